@@ -0,0 +1,45 @@
+# backend/src/asgi.py
+"""
+Optional ASGI entry point. The report and auth endpoints are served by async handlers
+(controllers/asyncReportController.py, controllers/asyncAuthController.py) on the
+asyncpg engine, so slow requests wait on the event loop instead of holding a thread.
+Every other route falls through to the Flask app, which keeps running unchanged on a
+thread pool.
+
+Run with:
+    pip install -r backend/requirements-async.txt
+    uvicorn backend.src.asgi:app --host 0.0.0.0 --port 5000 --workers 4
+"""
+
+from contextlib import asynccontextmanager
+
+try:
+    from starlette.applications import Starlette
+    from starlette.middleware.wsgi import WSGIMiddleware
+    from starlette.routing import Mount
+except ImportError as e:
+    raise ImportError(
+        "The ASGI entry point needs the optional async dependencies: "
+        "pip install -r backend/requirements-async.txt"
+    ) from e
+
+from backend.src.controllers import asyncAuthController, asyncReportController
+from backend.src.db import asyncDbClient
+from backend.src.server import create_app
+
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await asyncDbClient.dispose()
+
+
+app = Starlette(
+    routes=[
+        Mount("/api/auth", routes=asyncAuthController.routes),
+        Mount("/api/reports", routes=asyncReportController.routes),
+        # Everything else (users, metrics, health, ...) is served by the Flask app.
+        Mount("/", app=WSGIMiddleware(create_app())),
+    ],
+    lifespan=lifespan
+)
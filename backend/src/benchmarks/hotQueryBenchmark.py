@@ -0,0 +1,96 @@
+"""
+hotQueryBenchmark.py
+
+Measures the Python overhead of the hottest lookups (user by ID in token_required,
+user by email in login_user, report by ID in get_report_by_id) in their previous
+form, db.query(...).filter(...).first(), against the prebuilt statements the
+services now execute. Both forms run the same SQL on the same connection, so the
+difference per call is the cost of building the ORM Query and its cache key on
+every call.
+
+Usage (against a scratch database with migrations applied):
+    python -m backend.src.benchmarks.hotQueryBenchmark --iterations 20000
+
+Notes:
+- Run it next to the database (or against a local one) so round-trip time does not
+  drown the difference; the "saved" column is what matters.
+- The benchmark creates a throwaway user and report and deletes them afterwards.
+"""
+
+import time
+import uuid
+import argparse
+from sqlalchemy import delete
+from backend.src.db.dbClient import get_db_session
+from backend.src.models.User import User
+from backend.src.models.Report import Report
+from backend.src.services import authService, reportService, userCache
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    for _ in range(min(iterations, 500)):
+        fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def _lookups(user_id: int, email: str, report_id: int) -> list:
+    """
+    Returns (name, previous form, prebuilt form) triples; each form takes a session.
+    """
+    return [
+        (
+            "user by id",
+            lambda db: db.query(
+                User.id, User.email, User.username, User.created_at, User.updated_at
+            ).filter(User.id == user_id).first(),
+            lambda db: db.execute(userCache._USER_BY_ID, {"user_id": user_id}).first(),
+        ),
+        (
+            "user by email",
+            lambda db: db.query(User.id, User.email, User.password_hash).filter(User.email == email).first(),
+            lambda db: db.execute(authService._LOGIN_BY_EMAIL, {"email": email}).first(),
+        ),
+        (
+            "report by id",
+            lambda db: db.query(Report).filter(Report.id == report_id).first(),
+            lambda db: db.execute(reportService._REPORT_BY_ID, {"report_id": report_id}).scalars().first(),
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot lookups: ORM Query vs prebuilt statements.")
+    parser.add_argument("--iterations", type=int, default=10000, help="Calls per lookup and form.")
+    args = parser.parse_args()
+
+    email = f"bench-{uuid.uuid4().hex}@example.com"
+    with get_db_session() as db:
+        user = User(email=email, username=f"bench-{uuid.uuid4().hex[:12]}", password_hash="x")
+        db.add(user)
+        db.flush()
+        report = Report(user_id=user.id, tier=1, payment_status="PAID")
+        db.add(report)
+        db.commit()
+        user_id, report_id = user.id, report.id
+
+    try:
+        print(f"{'lookup':<14} {'query us':>10} {'prebuilt us':>12} {'saved us':>10} {'saved':>7}")
+        for name, previous, prebuilt in _lookups(user_id, email, report_id):
+            with get_db_session() as db:
+                previous_us = _per_call_us(lambda: previous(db), args.iterations)
+                prebuilt_us = _per_call_us(lambda: prebuilt(db), args.iterations)
+            saved = previous_us - prebuilt_us
+            print(f"{name:<14} {previous_us:>10.1f} {prebuilt_us:>12.1f} {saved:>10.1f} "
+                  f"{saved / previous_us:>6.0%}")
+    finally:
+        with get_db_session() as db:
+            db.execute(delete(Report).where(Report.user_id == user_id))
+            db.execute(delete(User).where(User.id == user_id))
+            db.commit()
+
+
+if __name__ == '__main__':
+    main()
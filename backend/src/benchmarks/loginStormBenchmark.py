@@ -0,0 +1,116 @@
+"""
+loginStormBenchmark.py
+
+Measures how a burst of logins affects unrelated requests. Against a running server,
+the benchmark first measures GET /api/reports/all latency on its own (baseline), then
+again while a number of threads hammer POST /api/auth/login. It reports p50/p99 read
+latency for both phases, plus how many logins succeeded and how many were turned
+away with 503 by the password hashing pool's admission control.
+
+Usage (against a running backend, e.g. docker-compose up):
+    python -m backend.src.benchmarks.loginStormBenchmark --base-url http://localhost:5000 \\
+        --readers 8 --login-threads 32 --seconds 20
+
+Notes:
+- The benchmark signs up a throwaway user through the API and logs in with it.
+- Compare runs with different GFVRHO_BCRYPT_WORKERS / GFVRHO_BCRYPT_MAX_PENDING settings
+  (or with the pool bypassed) to see the effect on read p99.
+"""
+
+import time
+import uuid
+import argparse
+import threading
+import requests
+
+
+def _percentile(samples: list, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _read_loop(base_url: str, token: str, stop: threading.Event, latencies: list, errors: list):
+    session = requests.Session()
+    headers = {"Authorization": f"Bearer {token}"}
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            response = session.get(f"{base_url}/api/reports/all", headers=headers, timeout=30)
+            elapsed = time.perf_counter() - started
+            if response.status_code == 200:
+                latencies.append(elapsed)
+            else:
+                errors.append(response.status_code)
+        except requests.RequestException:
+            errors.append("connection")
+
+
+def _login_loop(base_url: str, credentials: dict, stop: threading.Event, outcomes: dict, lock: threading.Lock):
+    session = requests.Session()
+    while not stop.is_set():
+        try:
+            status = session.post(f"{base_url}/api/auth/login", json=credentials, timeout=30).status_code
+        except requests.RequestException:
+            status = "connection"
+        with lock:
+            outcomes[status] = outcomes.get(status, 0) + 1
+
+
+def run_phase(base_url: str, token: str, credentials: dict, readers: int, login_threads: int, seconds: float) -> dict:
+    """
+    Runs readers (and optionally login threads) for the given duration and returns
+    the read latencies and login outcomes.
+    """
+    stop = threading.Event()
+    latencies, errors = [], []
+    outcomes, lock = {}, threading.Lock()
+
+    threads = [
+        threading.Thread(target=_read_loop, args=(base_url, token, stop, latencies, errors))
+        for _ in range(readers)
+    ]
+    threads += [
+        threading.Thread(target=_login_loop, args=(base_url, credentials, stop, outcomes, lock))
+        for _ in range(login_threads)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    return {"latencies": latencies, "errors": errors, "logins": outcomes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark read latency during a login storm.")
+    parser.add_argument("--base-url", default="http://localhost:5000", help="Backend base URL.")
+    parser.add_argument("--readers", type=int, default=8, help="Concurrent /api/reports/all clients.")
+    parser.add_argument("--login-threads", type=int, default=32, help="Concurrent login clients in the storm.")
+    parser.add_argument("--seconds", type=float, default=20, help="Duration of each phase.")
+    args = parser.parse_args()
+
+    suffix = uuid.uuid4().hex[:12]
+    credentials = {"email": f"bench-{suffix}@example.com", "password": f"bench-{suffix}-password"}
+    signup = requests.post(f"{args.base_url}/api/auth/signup",
+                           json={**credentials, "username": f"bench-{suffix}"}, timeout=30)
+    signup.raise_for_status()
+    login = requests.post(f"{args.base_url}/api/auth/login", json=credentials, timeout=30)
+    login.raise_for_status()
+    token = login.json()["token"]
+
+    print(f"{'phase':>10} {'reads':>8} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}  logins")
+    for phase, login_threads in (("baseline", 0), ("storm", args.login_threads)):
+        result = run_phase(args.base_url, token, credentials, args.readers, login_threads, args.seconds)
+        latencies = result["latencies"]
+        logins = ", ".join(f"{status}: {count}" for status, count in sorted(result["logins"].items(), key=str)) or "-"
+        print(f"{phase:>10} {len(latencies):>8} {_percentile(latencies, 50) * 1000:>9.1f} "
+              f"{_percentile(latencies, 99) * 1000:>9.1f} {len(result['errors']):>7}  {logins}")
+
+
+if __name__ == '__main__':
+    main()
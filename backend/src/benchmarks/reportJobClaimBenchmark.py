@@ -0,0 +1,115 @@
+"""
+reportJobClaimBenchmark.py
+
+Measures report_jobs claim throughput as the number of concurrent workers grows.
+For each worker count, the benchmark fills the queue with N jobs, starts that many
+worker processes, and has each one claim and complete jobs (without running the
+report workflow) until the queue is empty. It reports claims per second, so the
+cost of SELECT ... FOR UPDATE SKIP LOCKED contention can be seen directly.
+
+Usage (against a scratch database with migrations applied):
+    python -m backend.src.benchmarks.reportJobClaimBenchmark --jobs 5000 --workers 1 2 4 8 16
+
+Notes:
+- Each worker process uses its own connection pool, like separate backend nodes would.
+- The benchmark creates a throwaway user and deletes it and its jobs afterwards.
+"""
+
+import time
+import uuid
+import argparse
+import multiprocessing
+from sqlalchemy import insert, delete
+from backend.src.db.dbClient import get_db_session, engine
+from backend.src.models.User import User
+from backend.src.models.ReportJob import ReportJob
+from backend.src.services import reportJobService
+
+
+def _fill_queue(user_id: int, job_count: int):
+    rows = [
+        {"id": uuid.uuid4().hex, "user_id": user_id, "tier": 1,
+         "status": reportJobService.JOB_QUEUED, "attempts": 0}
+        for _ in range(job_count)
+    ]
+    with get_db_session() as db:
+        db.execute(insert(ReportJob), rows)
+        db.commit()
+
+
+def _drain(worker_index: int, start_barrier, claimed_counter):
+    # Connections inherited from the parent must not be shared with it.
+    engine.dispose()
+    worker_id = f"bench-{worker_index}"
+    start_barrier.wait()
+
+    claimed = 0
+    while True:
+        job = reportJobService.claim_next_job(worker_id)
+        if job is None:
+            break
+        reportJobService.complete_job(job.id, worker_id, report_id=None)
+        claimed += 1
+
+    with claimed_counter.get_lock():
+        claimed_counter.value += claimed
+
+
+def run(job_count: int, worker_count: int, user_id: int) -> float:
+    """
+    Runs one measurement and returns claims per second.
+    """
+    _fill_queue(user_id, job_count)
+    engine.dispose()
+
+    start_barrier = multiprocessing.Barrier(worker_count + 1)
+    claimed_counter = multiprocessing.Value("i", 0)
+    processes = [
+        multiprocessing.Process(target=_drain, args=(i, start_barrier, claimed_counter))
+        for i in range(worker_count)
+    ]
+    for p in processes:
+        p.start()
+
+    start_barrier.wait()
+    started = time.perf_counter()
+    for p in processes:
+        p.join()
+    elapsed = time.perf_counter() - started
+
+    if claimed_counter.value != job_count:
+        raise RuntimeError(f"Expected {job_count} claims, got {claimed_counter.value}")
+    return job_count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark report_jobs claim throughput.")
+    parser.add_argument("--jobs", type=int, default=2000, help="Jobs to enqueue per run.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="Worker counts to measure.")
+    args = parser.parse_args()
+
+    with get_db_session() as db:
+        user = User(
+            email=f"bench-{uuid.uuid4().hex}@example.com",
+            username=f"bench-{uuid.uuid4().hex[:12]}",
+            password_hash="x"
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+    try:
+        print(f"{'workers':>8} {'claims/s':>12} {'per worker':>12}")
+        for worker_count in args.workers:
+            rate = run(args.jobs, worker_count, user_id)
+            print(f"{worker_count:>8} {rate:>12.0f} {rate / worker_count:>12.0f}")
+    finally:
+        with get_db_session() as db:
+            db.execute(delete(ReportJob).where(ReportJob.user_id == user_id))
+            db.execute(delete(User).where(User.id == user_id))
+            db.commit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""
+workerModelBenchmark.py
+
+Compares gunicorn worker models (sync, gthread, gevent) on our own endpoints. For each
+model the benchmark starts gunicorn with config/gunicornConfig.py on a local port,
+drives it with concurrent HTTP clients for a fixed time, and reports throughput and
+p50/p99 latency per endpoint, then stops the server.
+
+Usage (from the repository root, with the database reachable and migrations applied):
+    python -m backend.src.benchmarks.workerModelBenchmark --models sync gthread gevent \\
+        --workers 2 --clients 64 --seconds 20
+
+Endpoints (--endpoints):
+- health: GET /api/health, no I/O (framework and worker overhead only)
+- reports: GET /api/reports/all, authenticated, one page from Postgres
+- stream: POST /api/reports/stream, a slow streaming request held open while the
+  LLM responds (needs a tier the benchmark user may request)
+
+Notes:
+- Every gunicorn setting other than the worker class comes from the environment, so
+  export GFVRHO_THREADS, GFVRHO_WORKER_CONNECTIONS, GFVRHO_DB_POOL_SIZE, etc. to
+  compare configurations.
+- The benchmark signs up a throwaway user through the API and logs in with it.
+"""
+
+import os
+import sys
+import time
+import uuid
+import argparse
+import threading
+import subprocess
+from pathlib import Path
+import requests
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+GUNICORN_CONFIG = Path(__file__).resolve().parents[1] / "config" / "gunicornConfig.py"
+STARTUP_TIMEOUT_SECONDS = 60
+
+
+def _percentile(samples: list, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _request(session: requests.Session, base_url: str, endpoint: str, token: str):
+    headers = {"Authorization": f"Bearer {token}"}
+    if endpoint == "health":
+        return session.get(f"{base_url}/api/health", timeout=60)
+    if endpoint == "reports":
+        return session.get(f"{base_url}/api/reports/all", headers=headers, timeout=60)
+    if endpoint == "stream":
+        # Read the whole stream, as a browser would.
+        response = session.post(f"{base_url}/api/reports/stream", json={"tier": 1},
+                                headers=headers, timeout=120, stream=True)
+        for _ in response.iter_content(chunk_size=None):
+            pass
+        return response
+    raise ValueError(f"Unknown endpoint {endpoint!r}")
+
+
+def _client_loop(base_url: str, endpoints: list, token: str, stop: threading.Event, results: dict, lock: threading.Lock):
+    session = requests.Session()
+    index = 0
+    while not stop.is_set():
+        endpoint = endpoints[index % len(endpoints)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            ok = _request(session, base_url, endpoint, token).status_code == 200
+        except requests.RequestException:
+            ok = False
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies, errors = results.setdefault(endpoint, ([], []))
+            (latencies if ok else errors).append(elapsed)
+
+
+def _start_server(model: str, port: int, workers: int) -> subprocess.Popen:
+    env = dict(os.environ, GFVRHO_WORKER_CLASS=model, GFVRHO_BIND=f"127.0.0.1:{port}", GFVRHO_WORKERS=str(workers))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", str(GUNICORN_CONFIG), "backend.src.server:create_app()"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn ({model}) exited with code {process.returncode}")
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/api/health", timeout=1).status_code == 200:
+                return process
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"gunicorn ({model}) did not become ready in {STARTUP_TIMEOUT_SECONDS}s")
+
+
+def _stop_server(process: subprocess.Popen):
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _get_token(base_url: str) -> str:
+    suffix = uuid.uuid4().hex[:12]
+    credentials = {"email": f"bench-{suffix}@example.com", "password": f"bench-{suffix}-password"}
+    signup = requests.post(f"{base_url}/api/auth/signup",
+                           json={**credentials, "username": f"bench-{suffix}"}, timeout=30)
+    signup.raise_for_status()
+    login = requests.post(f"{base_url}/api/auth/login", json=credentials, timeout=30)
+    login.raise_for_status()
+    return login.json()["token"]
+
+
+def run(model: str, port: int, workers: int, clients: int, seconds: float, endpoints: list, token: str = None) -> tuple:
+    """
+    Benchmarks one worker model and returns (results, token). results maps each
+    endpoint to (latencies, errors) in seconds.
+    """
+    process = _start_server(model, port, workers)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        token = token or _get_token(base_url)
+
+        stop = threading.Event()
+        results, lock = {}, threading.Lock()
+        # Stagger the starting endpoint so every endpoint is busy from the start.
+        threads = [
+            threading.Thread(
+                target=_client_loop,
+                args=(base_url, endpoints[i % len(endpoints):] + endpoints[:i % len(endpoints)], token, stop, results, lock)
+            )
+            for i in range(clients)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        return results, token
+    finally:
+        _stop_server(process)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare gunicorn worker models on the API.")
+    parser.add_argument("--models", nargs="+", default=["sync", "gthread", "gevent"], help="Worker classes to compare.")
+    parser.add_argument("--endpoints", nargs="+", default=["health", "reports"],
+                        choices=["health", "reports", "stream"], help="Endpoints to drive.")
+    parser.add_argument("--workers", type=int, default=2, help="Gunicorn worker processes.")
+    parser.add_argument("--clients", type=int, default=64, help="Concurrent HTTP clients.")
+    parser.add_argument("--seconds", type=float, default=20, help="Duration per worker model.")
+    parser.add_argument("--port", type=int, default=5055, help="Local port for the server under test.")
+    args = parser.parse_args()
+
+    token = None
+    print(f"{'model':>8} {'endpoint':>9} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for model in args.models:
+        results, token = run(model, args.port, args.workers, args.clients, args.seconds, args.endpoints, token)
+        for endpoint in args.endpoints:
+            latencies, errors = results.get(endpoint, ([], []))
+            print(f"{model:>8} {endpoint:>9} {len(latencies) / args.seconds:>9.1f} "
+                  f"{_percentile(latencies, 50) * 1000:>9.1f} {_percentile(latencies, 99) * 1000:>9.1f} "
+                  f"{len(errors):>7}")
+
+
+if __name__ == '__main__':
+    main()
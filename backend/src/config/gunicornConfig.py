@@ -0,0 +1,81 @@
+"""
+gunicornConfig.py
+
+Gunicorn settings for the production WSGI server, all selected by environment:
+
+    gunicorn -c backend/src/config/gunicornConfig.py "backend.src.server:create_app()"
+
+Worker model (GFVRHO_WORKER_CLASS):
+- sync: one request per process at a time. Simple and predictable, but a slow request
+  (LLM stream, S3, Stripe) blocks its worker.
+- gthread (default): GFVRHO_THREADS requests per process on a thread pool. Most of our
+  time is spent waiting on Postgres and external APIs, which release the GIL.
+- gevent: GFVRHO_WORKER_CONNECTIONS greenlets per process. Sockets and psycopg2 are
+  made cooperative (psycogreen), so thousands of slow requests can be open at once.
+  The database pool then becomes the limit; requests wait for a connection instead.
+  CPU-bound work still needs real threads: passwordHasher detects the patching and
+  runs bcrypt on gevent's native thread pool, so a login does not stall the process.
+
+Other settings:
+- GFVRHO_BIND (0.0.0.0:5000), GFVRHO_WORKERS (2 x CPUs + 1)
+- GFVRHO_PRELOAD (true): import the app once in the master and fork workers from it,
+  sharing memory copy-on-write. Each worker drops the connection pools it inherited
+  right after the fork (post_fork).
+- GFVRHO_MAX_REQUESTS (1000) and GFVRHO_MAX_REQUESTS_JITTER (100): recycle workers to
+  bound memory growth, staggered so they do not restart together. 0 disables.
+- GFVRHO_KEEPALIVE_SECONDS (75): keep idle client connections open longer than the
+  load balancer's idle timeout (60s on ALB), or it may reuse a connection gunicorn
+  has just closed and return 502s.
+- GFVRHO_TIMEOUT_SECONDS (120), GFVRHO_GRACEFUL_TIMEOUT_SECONDS (30)
+
+Best Practices:
+- workers x (GFVRHO_DB_POOL_SIZE + GFVRHO_DB_MAX_OVERFLOW) must stay below the
+  database's max_connections; with gthread, size the pool close to GFVRHO_THREADS.
+- Compare worker models with benchmarks/workerModelBenchmark.py before changing them.
+"""
+
+import os
+import multiprocessing
+
+WORKER_CLASSES = ("sync", "gthread", "gevent")
+
+_worker_class = os.environ.get("GFVRHO_WORKER_CLASS", "gthread").lower()
+if _worker_class not in WORKER_CLASSES:
+    raise ValueError(f"GFVRHO_WORKER_CLASS must be one of {', '.join(WORKER_CLASSES)}, not {_worker_class!r}")
+
+if _worker_class == "gevent":
+    # Patch before the app is imported (preload), so every module sees cooperative
+    # sockets and threads, and let psycopg2 yield to other greenlets while it waits.
+    # Pools that must stay on OS threads (utils/passwordHasher.py) check for this.
+    from gevent import monkey
+    monkey.patch_all()
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+bind = os.environ.get("GFVRHO_BIND", "0.0.0.0:5000")
+worker_class = _worker_class
+workers = int(os.environ.get("GFVRHO_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GFVRHO_THREADS", 4))
+worker_connections = int(os.environ.get("GFVRHO_WORKER_CONNECTIONS", 1000))
+
+preload_app = os.environ.get("GFVRHO_PRELOAD", "true").lower() == "true"
+max_requests = int(os.environ.get("GFVRHO_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GFVRHO_MAX_REQUESTS_JITTER", 100))
+
+keepalive = int(os.environ.get("GFVRHO_KEEPALIVE_SECONDS", 75))
+timeout = int(os.environ.get("GFVRHO_TIMEOUT_SECONDS", 120))
+graceful_timeout = int(os.environ.get("GFVRHO_GRACEFUL_TIMEOUT_SECONDS", 30))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info").lower()
+
+
+def post_fork(server, worker):
+    """
+    Drops pooled connections inherited from the master (opened while preloading), so
+    two processes never share a socket. close=False leaves them open for the master.
+    """
+    from backend.src.db import dbClient, readRouting
+    for engine in [dbClient.engine, *readRouting.replica_engines]:
+        engine.dispose(close=False)
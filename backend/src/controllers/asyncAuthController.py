@@ -0,0 +1,111 @@
+"""
+asyncAuthController.py
+
+This module defines the async (Starlette) versions of the authentication endpoints in
+authController.py: signup, login and logout. Requests, responses and status codes are
+the same; the work is delegated to asyncAuthService.py. The routes are mounted under
+/api/auth by asgi.py.
+
+Best Practices:
+- Keep request parsing and responses identical to authController.py.
+- Return 503 with Retry-After when the password hashing pool is saturated.
+"""
+
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from backend.src.controllers.authController import AUTH_RETRY_AFTER_SECONDS
+from backend.src.middlewares.asyncAuthMiddleware import async_token_required
+from backend.src.services import asyncAuthService
+from backend.src.utils import serializer
+from backend.src.utils.passwordHasher import PasswordHasherBusy
+
+
+async def signup(request):
+    """
+    Registers a new user. See authController.signup.
+    """
+    data = await _json_payload(request)
+    if not data:
+        return JSONResponse({"error": "Invalid JSON payload"}, status_code=400)
+
+    email = data.get("email")
+    username = data.get("username")
+    password = data.get("password")
+
+    if not email or not username or not password:
+        return JSONResponse({"error": "Missing required fields"}, status_code=400)
+
+    try:
+        new_user = await asyncAuthService.register_user(email, username, password)
+        return JSONResponse(serializer.serialize(new_user, serializer.USER_FIELDS), status_code=201)
+    except PasswordHasherBusy as busy:
+        return _busy_response(busy)
+    except ValueError as ve:
+        return JSONResponse({"error": str(ve)}, status_code=400)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def login(request):
+    """
+    Logs in an existing user. See authController.login.
+    """
+    data = await _json_payload(request)
+    if not data:
+        return JSONResponse({"error": "Invalid JSON payload"}, status_code=400)
+
+    email = data.get("email")
+    password = data.get("password")
+
+    if not email or not password:
+        return JSONResponse({"error": "Missing email or password"}, status_code=400)
+
+    try:
+        token = await asyncAuthService.login_user(email, password)
+        return JSONResponse({"token": token}, status_code=200)
+    except PasswordHasherBusy as busy:
+        return _busy_response(busy)
+    except ValueError as ve:
+        return JSONResponse({"error": str(ve)}, status_code=401)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+@async_token_required
+async def logout(request, current_user):
+    """
+    Revokes the current token. See authController.logout.
+    """
+    try:
+        await asyncAuthService.logout_user(request.state.token_claims)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+    return JSONResponse({"message": "Logged out successfully"}, status_code=200)
+
+
+async def _json_payload(request):
+    """
+    Returns the parsed JSON body, or None if it is missing or malformed.
+    """
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+def _busy_response(busy: PasswordHasherBusy):
+    """
+    Builds the 503 response returned when the password hashing pool is saturated.
+    """
+    return JSONResponse(
+        {"error": str(busy)},
+        status_code=503,
+        headers={"Retry-After": str(AUTH_RETRY_AFTER_SECONDS)}
+    )
+
+
+routes = [
+    Route("/signup", signup, methods=["POST"]),
+    Route("/login", login, methods=["POST"]),
+    Route("/logout", logout, methods=["POST"]),
+]
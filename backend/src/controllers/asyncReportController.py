@@ -0,0 +1,246 @@
+"""
+asyncReportController.py
+
+This module defines the async (Starlette) versions of the report endpoints in
+reportController.py. Requests, responses and status codes are the same; reads go
+through asyncReportService.py. The routes are mounted under /api/reports by asgi.py.
+
+The streaming endpoint is where async serving pays off: a report stream spends most of
+its time waiting on the LLM provider, and here it waits on the event loop instead of
+holding a worker thread, so one process can keep thousands of streams open.
+
+Best Practices:
+- Keep request parsing and responses identical to reportController.py; reuse its
+  serialization helpers.
+- Sync services without an async counterpart (payments, enrichment) run through
+  asyncio.to_thread, never directly in a coroutine.
+"""
+
+import asyncio
+from urllib.parse import urlencode
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from backend.src.controllers.reportController import (
+    MAX_REPORTS_PAGE_SIZE,
+    READ_CACHE_CONTROL,
+    _report_etag,
+    _reports_etag,
+    _serialize_reports,
+    _user_data_from_payload,
+    _sse_event
+)
+from backend.src.middlewares.asyncAuthMiddleware import async_token_required
+from backend.src.services import (
+    asyncReportService,
+    reportService,
+    reportJobService,
+    enrichmentService,
+    llmService
+)
+from backend.src.utils import httpCache, pagination
+
+
+@async_token_required
+async def create_report(request, current_user):
+    """
+    Queues a new report for the authenticated user. See reportController.create_report.
+    """
+    data = await _json_payload(request)
+    if not data:
+        return JSONResponse({"error": "Invalid JSON payload"}, status_code=400)
+
+    tier = data.get("tier")
+    if not tier:
+        return JSONResponse({"error": "Missing 'tier' in request payload"}, status_code=400)
+
+    try:
+        job = await asyncReportService.enqueue_report_job(
+            current_user.id, tier, _user_data_from_payload(data)
+        )
+        status_url = str(request.app.url_path_for("get_report_job", job_id=job.id))
+        return JSONResponse(
+            {"job_id": job.id, "status": job.status, "status_url": status_url},
+            status_code=202,
+            headers={"Location": status_url}
+        )
+    except ValueError as ve:
+        return JSONResponse({"error": str(ve)}, status_code=400)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+@async_token_required
+async def stream_report(request, current_user):
+    """
+    Streams a report's content as Server-Sent Events. See reportController.stream_report.
+    """
+    data = await _json_payload(request)
+    if not data:
+        return JSONResponse({"error": "Invalid JSON payload"}, status_code=400)
+
+    tier = data.get("tier")
+    if not tier:
+        return JSONResponse({"error": "Missing 'tier' in request payload"}, status_code=400)
+
+    try:
+        await asyncio.to_thread(reportService.validate_report_request, current_user.id, tier)
+    except ValueError as ve:
+        return JSONResponse({"error": str(ve)}, status_code=400)
+
+    user_id = current_user.id
+    user_data = _user_data_from_payload(data)
+
+    async def generate():
+        try:
+            market_data = {}
+            if user_data.get("company_name"):
+                yield _sse_event("status", {"stage": "enrichment"})
+                market_data = await asyncio.to_thread(enrichmentService.gather_market_data, user_data["company_name"])
+
+            yield _sse_event("status", {"stage": "generation"})
+            parts = []
+            async for chunk in llmService.generate_report_content_stream_async(tier, userData=user_data, marketData=market_data):
+                parts.append(chunk)
+                yield _sse_event("chunk", {"text": chunk})
+
+            # The content is complete; render and store the PDF off the request path.
+            job = await asyncReportService.enqueue_report_job(user_id, tier, user_data, "".join(parts))
+            yield _sse_event("done", {
+                "job_id": job.id,
+                "status_url": str(request.app.url_path_for("get_report_job", job_id=job.id))
+            })
+        except Exception as e:
+            yield _sse_event("error", {"error": str(e)})
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Keep nginx from buffering the stream
+        }
+    )
+
+
+@async_token_required
+async def get_report_job(request, current_user):
+    """
+    Returns the status of a report job. See reportController.get_report_job.
+    """
+    try:
+        job = await asyncReportService.get_job(request.path_params["job_id"])
+        if not job or job.user_id != current_user.id:
+            return JSONResponse({"error": "Report job not found"}, status_code=404)
+
+        result = {
+            "job_id": job.id,
+            "status": job.status,
+            "tier": job.tier,
+            "created_at": str(job.created_at),
+            "finished_at": str(job.finished_at) if job.finished_at else None
+        }
+        if job.status == reportJobService.JOB_SUCCEEDED:
+            report = await asyncReportService.get_report_by_id(job.report_id)
+            result["report"] = (
+                _serialize_reports([report], await asyncReportService.get_pdf_urls([report]))[0]
+                if report else None
+            )
+        elif job.status == reportJobService.JOB_FAILED:
+            result["error"] = job.error
+
+        return JSONResponse(result, status_code=200)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+@async_token_required
+async def get_report(request, current_user):
+    """
+    Retrieves a specific report by its ID. See reportController.get_report.
+    """
+    try:
+        report = await asyncReportService.get_report_by_id(request.path_params["report_id"])
+        if not report:
+            return JSONResponse({"error": "Report not found"}, status_code=404)
+
+        if report.user_id != current_user.id:
+            return JSONResponse({"error": "Unauthorized access to this report"}, status_code=403)
+
+        etag = _report_etag(report)
+        if httpCache.etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status_code=304, headers=_cache_headers(etag))
+
+        pdf_urls = await asyncReportService.get_pdf_urls([report])
+        return JSONResponse(_serialize_reports([report], pdf_urls)[0], status_code=200, headers=_cache_headers(etag))
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+@async_token_required
+async def get_all_reports(request, current_user):
+    """
+    Retrieves the authenticated user's reports, one page at a time.
+    See reportController.get_all_reports.
+    """
+    try:
+        limit = pagination.clamp_limit(
+            request.query_params.get("limit"), reportService.REPORTS_PAGE_SIZE, MAX_REPORTS_PAGE_SIZE
+        )
+        after = request.query_params.get("after")
+    except ValueError as ve:
+        return JSONResponse({"error": str(ve)}, status_code=400)
+
+    try:
+        version = await asyncReportService.get_reports_version(current_user.id)
+        etag = _reports_etag(current_user.id, version, limit, after)
+        if httpCache.etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status_code=304, headers=_cache_headers(etag))
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+    try:
+        reports, next_cursor = await asyncReportService.get_reports_page(
+            user_id=current_user.id,
+            limit=limit,
+            after=after
+        )
+    except ValueError as ve:
+        return JSONResponse({"error": str(ve)}, status_code=400)
+
+    try:
+        pdf_urls = await asyncReportService.get_pdf_urls(reports)
+        headers = _cache_headers(etag)
+        if next_cursor:
+            query = urlencode({"limit": limit, "after": next_cursor})
+            next_url = f"{request.app.url_path_for('get_all_reports')}?{query}"
+            headers["X-Next-Cursor"] = next_cursor
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return JSONResponse(_serialize_reports(reports, pdf_urls), status_code=200, headers=headers)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+def _cache_headers(etag: str) -> dict:
+    """
+    ETag and revalidation headers for read responses (see reportController).
+    """
+    return {"ETag": etag, "Cache-Control": READ_CACHE_CONTROL}
+
+
+async def _json_payload(request):
+    """
+    Returns the parsed JSON body, or None if it is missing or malformed.
+    """
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+routes = [
+    Route("/create", create_report, methods=["POST"]),
+    Route("/stream", stream_report, methods=["POST"]),
+    Route("/jobs/{job_id}", get_report_job, methods=["GET"]),
+    Route("/all", get_all_reports, methods=["GET"]),
+    Route("/{report_id:int}", get_report, methods=["GET"]),
+]
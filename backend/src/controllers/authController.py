@@ -9,6 +9,8 @@ Best Practices:
 - Return consistent JSON structures for both success and error scenarios.
 - Use appropriate HTTP status codes (201 for resource creation, 200 for success,
   400 or 401 for client errors, etc.).
+- Return 503 with Retry-After when the password hashing pool is saturated, so clients
+  back off instead of piling up behind a login storm.
 - Avoid duplicating business logic handled in authService.py. This file should focus
   on request parsing, HTTP status codes, and JSON responses.
 
@@ -18,8 +20,14 @@ Usage:
     app.register_blueprint(auth_bp, url_prefix="/auth")
 """
 
-from flask import Blueprint, request, jsonify, make_response
+from flask import Blueprint, request, jsonify, make_response, g
+from backend.src.middlewares.authMiddleware import token_required
 from backend.src.services import authService
+from backend.src.utils import serializer
+from backend.src.utils.passwordHasher import PasswordHasherBusy
+
+# Seconds clients should wait before retrying when hashing capacity is exhausted.
+AUTH_RETRY_AFTER_SECONDS = 1
 
 auth_bp = Blueprint("auth_bp", __name__)
 
@@ -30,6 +38,7 @@ def signup():
     Expects JSON data with fields: email, username, and password.
     Returns 201 on success, along with the newly created user (minus the password hash).
     Returns 400 if the email/username is already taken or if input validation fails.
+    Returns 503 if the server is too busy hashing passwords to take the request.
     """
     data = request.get_json()
     if not data:
@@ -45,11 +54,9 @@ def signup():
     try:
         new_user = authService.register_user(email, username, password)
         # Return the user info without the password hash
-        return jsonify({
-            "id": new_user.id,
-            "email": new_user.email,
-            "username": new_user.username
-        }), 201
+        return jsonify(serializer.serialize(new_user, serializer.USER_FIELDS)), 201
+    except PasswordHasherBusy as busy:
+        return _busy_response(busy)
     except ValueError as ve:
         return jsonify({"error": str(ve)}), 400
     except Exception as e:
@@ -62,6 +69,7 @@ def login():
     Expects JSON data with fields: email and password.
     Returns 200 on success, with a JWT token in the response body.
     Returns 400 or 401 if authentication fails.
+    Returns 503 if the server is too busy hashing passwords to take the request.
     """
     data = request.get_json()
     if not data:
@@ -76,20 +84,34 @@ def login():
     try:
         token = authService.login_user(email, password)
         return jsonify({"token": token}), 200
+    except PasswordHasherBusy as busy:
+        return _busy_response(busy)
     except ValueError as ve:
         return jsonify({"error": str(ve)}), 401
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @auth_bp.route("/logout", methods=["POST"])
-def logout():
+@token_required
+def logout(current_user):
     """
-    Example logout endpoint.
-    In a stateless JWT scenario, logout often requires token blacklisting
-    or client-side token removal. This is a placeholder that can be expanded.
+    Logs out the current token.
+    The token's jti is added to the revocation store, so the token is rejected by
+    every protected endpoint from now until it would have expired.
 
     Returns 200 to indicate the logout request was processed.
     """
-    # In a stateless JWT environment, the client typically discards the token.
-    # If using server-side session management, you might clear session data here.
+    try:
+        authService.logout_user(g.token_claims)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    # The client should still discard the token.
     return make_response(jsonify({"message": "Logged out successfully"}), 200)
+
+def _busy_response(busy: PasswordHasherBusy):
+    """
+    Builds the 503 response returned when the password hashing pool is saturated.
+    """
+    response = make_response(jsonify({"error": str(busy)}), 503)
+    response.headers["Retry-After"] = str(AUTH_RETRY_AFTER_SECONDS)
+    return response
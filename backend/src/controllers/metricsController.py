@@ -0,0 +1,52 @@
+"""
+metricsController.py
+
+This module defines the Flask controller for operational metrics. Metrics are
+per worker process: each gunicorn worker has its own connection pool, so scrape
+every worker (or aggregate in your metrics pipeline) for totals.
+
+The endpoints are disabled unless GFVRHO_METRICS_TOKEN is set. Scrapers then send
+it as a bearer token (Authorization: Bearer <token>); anything else gets a 404, so
+the blueprint does not advertise itself.
+
+Best Practices:
+- Expose read-only numbers only; never configuration secrets such as the database URL.
+- Restrict access to this blueprint at the load balancer or ingress in production as
+  well; the token is a second line of defence, not a replacement.
+"""
+
+import os
+import hmac
+from flask import Blueprint, jsonify, request
+from backend.src.db import dbClient, queryStats, readRouting
+
+METRICS_TOKEN = os.environ.get("GFVRHO_METRICS_TOKEN", "")
+
+metrics_bp = Blueprint("metrics_bp", __name__)
+
+@metrics_bp.before_request
+def require_metrics_token():
+    """
+    Answers 404 unless metrics are enabled and the request carries the metrics token.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if (
+        not METRICS_TOKEN
+        or scheme.lower() != "bearer"
+        or not hmac.compare_digest(token.strip().encode(), METRICS_TOKEN.encode())
+    ):
+        return jsonify({"error": "Not found"}), 404
+
+@metrics_bp.route("/db", methods=["GET"])
+def db_metrics():
+    """
+    Returns connection pool occupancy, checkout counts and checkout wait times
+    for this worker process, for the primary and each read replica, plus statement,
+    slow statement and N+1 request counters.
+    """
+    return jsonify({
+        "pid": os.getpid(),
+        "pool": dbClient.get_pool_metrics(),
+        "replica_pools": [replica.pool.metrics() for replica in readRouting.replica_engines],
+        "queries": queryStats.get_query_metrics()
+    }), 200
@@ -2,10 +2,15 @@
 reportController.py
 
 This module defines the Flask controller for user reports. It provides endpoints
-to create a new report and retrieve existing reports. It delegates the core logic
-to reportService.py and ensures the user is authenticated (and, implicitly, that
+to request a new report, stream a report's content as it is generated, poll the
+status of a report job, and retrieve existing reports. Report creation is queued through reportJobService.py; the remaining
+core logic is delegated to reportService.py. It ensures the user is authenticated (and, implicitly, that
 payment status is verified for paid tiers).
 
+The read endpoints support conditional GET: they return a weak ETag and answer
+If-None-Match with 304 before signing URLs or serializing (see utils/httpCache.py), so
+polling an unchanged report or listing costs one cheap lookup and no body.
+
 Best Practices:
 - Return consistent JSON structures for both success and error scenarios.
 - Use appropriate HTTP status codes.
@@ -13,30 +18,89 @@ Best Practices:
   Let reportService handle business logic.
 """
 
-from flask import Blueprint, request, jsonify
-from backend.src.services import reportService
+import json
+from flask import Blueprint, request, jsonify, url_for, Response, stream_with_context
+from backend.src.services import (
+    reportService,
+    reportJobService,
+    enrichmentService,
+    llmService
+)
 from backend.src.middlewares.authMiddleware import token_required  # Example import if needed
+from backend.src.utils import httpCache, pagination, serializer
 
 report_bp = Blueprint("report_bp", __name__)
 
+# Upper bound on the page size clients may request from /all.
+MAX_REPORTS_PAGE_SIZE = 200
+
+# Clients may keep read responses but must revalidate them (with If-None-Match) before reuse.
+READ_CACHE_CONTROL = "private, no-cache"
+
 @report_bp.route("/create", methods=["POST"])
 @token_required  # Example: if you have a decorator that enforces auth, attach it here
 def create_report(current_user):
     """
-    Creates a new report for the authenticated user.
+    Queues a new report for the authenticated user.
 
     Expects JSON data with:
         {
-            "tier": 2  // or 3, for example
+            "tier": 2,  // or 3, for example
+            "company_name": "Acme Inc."  // optional, enables market data enrichment
         }
 
     Steps:
     1. Validate the request data (tier).
-    2. Call reportService.create_report with current_user.id and tier.
-    3. Return the created report as JSON.
+    2. Enqueue a report job with current_user.id, tier and the company details.
+    3. Return 202 with the job ID and the URL to poll for its status.
+
+    Returns 400 if the tier is unknown or the payment is not verified; these are
+    checked before the job is queued. Content generation and PDF rendering run on
+    the report job workers; failures are reported through the job status endpoint.
+    """
+    data = request.get_json()
+    if not data:
+        return jsonify({"error": "Invalid JSON payload"}), 400
+
+    tier = data.get("tier")
+    if not tier:
+        return jsonify({"error": "Missing 'tier' in request payload"}), 400
+
+    try:
+        job = reportJobService.enqueue_report_job(
+            user_id=current_user.id,
+            tier=tier,
+            user_data=_user_data_from_payload(data)
+        )
+        status_url = url_for("report_bp.get_report_job", job_id=job.id)
+        response = jsonify({
+            "job_id": job.id,
+            "status": job.status,
+            "status_url": status_url
+        })
+        response.status_code = 202
+        response.headers["Location"] = status_url
+        return response
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-    If payment verification fails (handled inside the service), raise an error.
-    Return 201 if created successfully.
+@report_bp.route("/stream", methods=["POST"])
+@token_required
+def stream_report(current_user):
+    """
+    Generates a report's content and streams it to the client as Server-Sent Events,
+    then queues the PDF build in the background.
+
+    Expects the same JSON payload as /create. The response is text/event-stream with:
+        event: status  data: {"stage": "enrichment" | "generation"}
+        event: chunk   data: {"text": "..."}            (repeated)
+        event: done    data: {"job_id": "...", "status_url": "..."}
+        event: error   data: {"error": "..."}           (on failure)
+
+    The tier and payment are checked before the stream starts, so an unknown or
+    unpaid tier still gets a plain 400 JSON response.
     """
     data = request.get_json()
     if not data:
@@ -47,16 +111,77 @@ def create_report(current_user):
         return jsonify({"error": "Missing 'tier' in request payload"}), 400
 
     try:
-        new_report = reportService.create_report(user_id=current_user.id, tier=tier)
-        return jsonify({
-            "id": new_report.id,
-            "tier": new_report.tier,
-            "pdf_url": new_report.pdf_url,
-            "created_at": str(new_report.created_at),  # Convert datetime to string
-            "payment_status": new_report.payment_status
-        }), 201
+        reportService.validate_report_request(current_user.id, tier)
     except ValueError as ve:
         return jsonify({"error": str(ve)}), 400
+
+    user_id = current_user.id
+    user_data = _user_data_from_payload(data)
+
+    def generate():
+        try:
+            market_data = {}
+            if user_data.get("company_name"):
+                yield _sse_event("status", {"stage": "enrichment"})
+                market_data = enrichmentService.gather_market_data(user_data["company_name"])
+
+            yield _sse_event("status", {"stage": "generation"})
+            parts = []
+            for chunk in llmService.generate_report_content_stream(tier, userData=user_data, marketData=market_data):
+                parts.append(chunk)
+                yield _sse_event("chunk", {"text": chunk})
+
+            # The content is complete; render and store the PDF off the request path.
+            job = reportJobService.enqueue_report_job(
+                user_id=user_id,
+                tier=tier,
+                user_data=user_data,
+                report_content="".join(parts)
+            )
+            yield _sse_event("done", {
+                "job_id": job.id,
+                "status_url": url_for("report_bp.get_report_job", job_id=job.id)
+            })
+        except Exception as e:
+            yield _sse_event("error", {"error": str(e)})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Keep nginx from buffering the stream
+        }
+    )
+
+@report_bp.route("/jobs/<job_id>", methods=["GET"])
+@token_required
+def get_report_job(current_user, job_id):
+    """
+    Returns the status of a report job.
+    Once the job has succeeded, the created report is included under "report".
+
+    Returns 404 if the job does not exist or belongs to another user.
+    """
+    try:
+        job = reportJobService.get_job(job_id)
+        if not job or job.user_id != current_user.id:
+            return jsonify({"error": "Report job not found"}), 404
+
+        result = {
+            "job_id": job.id,
+            "status": job.status,
+            "tier": job.tier,
+            "created_at": str(job.created_at),
+            "finished_at": str(job.finished_at) if job.finished_at else None
+        }
+        if job.status == reportJobService.JOB_SUCCEEDED:
+            report = reportService.get_report_by_id(job.report_id)
+            result["report"] = _serialize_reports([report], reportService.get_pdf_urls([report]))[0] if report else None
+        elif job.status == reportJobService.JOB_FAILED:
+            result["error"] = job.error
+
+        return jsonify(result), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -69,6 +194,7 @@ def get_report(current_user, report_id):
     the user is allowed to view it.
 
     Returns 404 if the report does not exist or if the user is not authorized.
+    Returns 304 if If-None-Match carries the report's current ETag.
     """
     try:
         report = reportService.get_report_by_id(report_id)
@@ -78,13 +204,12 @@ def get_report(current_user, report_id):
         if report.user_id != current_user.id:
             return jsonify({"error": "Unauthorized access to this report"}), 403
 
-        return jsonify({
-            "id": report.id,
-            "tier": report.tier,
-            "pdf_url": report.pdf_url,
-            "created_at": str(report.created_at),
-            "payment_status": report.payment_status
-        }), 200
+        etag = _report_etag(report)
+        if httpCache.etag_matches(request.headers.get("If-None-Match"), etag):
+            return _with_cache_headers(httpCache.not_modified(etag), etag)
+
+        response = jsonify(_serialize_reports([report], reportService.get_pdf_urls([report]))[0])
+        return _with_cache_headers(response, etag), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -92,20 +217,99 @@ def get_report(current_user, report_id):
 @token_required
 def get_all_reports(current_user):
     """
-    Retrieves all reports for the authenticated user.
-    Returns 200 with a list of report objects if found, or an empty list otherwise.
+    Retrieves the authenticated user's reports, newest first, one page at a time.
+
+    Query parameters:
+        limit: Page size (default REPORTS_PAGE_SIZE, at most MAX_REPORTS_PAGE_SIZE).
+        after: Opaque cursor from the previous page.
+
+    Returns 200 with a list of report objects (empty if there are none). When more
+    reports exist, the cursor for the next page is returned in the X-Next-Cursor
+    header, and a Link header with rel="next" points at the next page.
+    Returns 304 if If-None-Match carries the listing's current ETag; that check only
+    looks up the user's newest report, before the page query.
+    Returns 400 if limit or after is invalid.
     """
     try:
-        reports = reportService.get_reports_for_user(user_id=current_user.id)
-        results = []
-        for r in reports:
-            results.append({
-                "id": r.id,
-                "tier": r.tier,
-                "pdf_url": r.pdf_url,
-                "created_at": str(r.created_at),
-                "payment_status": r.payment_status
-            })
-        return jsonify(results), 200
+        limit = pagination.clamp_limit(
+            request.args.get("limit"), reportService.REPORTS_PAGE_SIZE, MAX_REPORTS_PAGE_SIZE
+        )
+        after = request.args.get("after")
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+
+    try:
+        etag = _reports_etag(current_user.id, reportService.get_reports_version(current_user.id), limit, after)
+        if httpCache.etag_matches(request.headers.get("If-None-Match"), etag):
+            return _with_cache_headers(httpCache.not_modified(etag), etag)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    try:
+        reports, next_cursor = reportService.get_reports_page(
+            user_id=current_user.id,
+            limit=limit,
+            after=after
+        )
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+
+    try:
+        # Sign every download URL in one batch rather than once per row.
+        pdf_urls = reportService.get_pdf_urls(reports)
+        response = jsonify(_serialize_reports(reports, pdf_urls))
+        if next_cursor:
+            next_url = url_for("report_bp.get_all_reports", limit=limit, after=next_cursor)
+            response.headers["X-Next-Cursor"] = next_cursor
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return _with_cache_headers(response, etag), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+def _serialize_reports(reports, pdf_urls: dict) -> list:
+    """
+    Builds the JSON representation of reports shared by the read endpoints.
+    pdf_urls maps report IDs to download URLs minted by reportService.get_pdf_urls.
+    """
+    return serializer.serialize_many(
+        reports, serializer.REPORT_FIELDS,
+        extra=lambda report: {"pdf_url": pdf_urls.get(report.id)}
+    )
+
+def _report_etag(report) -> str:
+    """
+    Weak ETag of a single report's representation, including the pre-signed URL window.
+    """
+    return httpCache.make_etag(
+        "report", report.id, report.created_at, report.pdf_key, report.pdf_url,
+        report.payment_status, httpCache.url_window()
+    )
+
+def _reports_etag(user_id: int, version: tuple, limit: int, after: str) -> str:
+    """
+    Weak ETag of one page of a user's listing. version is reportService.get_reports_version.
+    """
+    return httpCache.make_etag("reports", user_id, *version, limit, after, httpCache.url_window())
+
+def _with_cache_headers(response, etag: str):
+    """
+    Adds the ETag and revalidation headers to a read response.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = READ_CACHE_CONTROL
+    return response
+
+def _user_data_from_payload(data: dict) -> dict:
+    """
+    Extracts the optional company details used for enrichment and the LLM prompt.
+    """
+    user_data = {}
+    if data.get("company_name"):
+        user_data["company_name"] = data["company_name"]
+    return user_data
+
+def _sse_event(event: str, payload: dict) -> str:
+    """
+    Formats a single Server-Sent Event. Payloads are JSON so chunks may contain newlines.
+    """
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
@@ -1,24 +1,32 @@
 # backend/src/controllers/userController.py
 
 from flask import Blueprint, request, jsonify
-from services.userService import get_user_profile, update_user_profile
-from middlewares.authMiddleware import auth_required
+from backend.src.controllers.authController import AUTH_RETRY_AFTER_SECONDS
+from backend.src.middlewares.authMiddleware import token_required
+from backend.src.services.userService import UserService, PROFILE_FIELDS
+from backend.src.utils import serializer
+from backend.src.utils.passwordHasher import PasswordHasherBusy
 
 # Create a Blueprint for user routes
 user_bp = Blueprint('user', __name__, url_prefix='/api/user')
 
 
 @user_bp.route('/profile', methods=['GET'])
-@auth_required
+@token_required
 def get_profile(current_user):
     """
     Get user profile details.
     """
     try:
-        user_profile = get_user_profile(current_user.id)
+        user = UserService.get_user_by_id(current_user.id)
+        if not user:
+            return jsonify({
+                "status": "error",
+                "message": "User not found"
+            }), 404
         return jsonify({
             "status": "success",
-            "data": user_profile
+            "data": serializer.serialize(user, serializer.USER_FIELDS)
         }), 200
     except Exception as e:
         return jsonify({
@@ -28,18 +36,44 @@ def get_profile(current_user):
 
 
 @user_bp.route('/profile', methods=['PUT'])
-@auth_required
+@token_required
 def update_profile(current_user):
     """
     Update user profile details.
+    Accepts username, email and password; any other field is rejected with 400.
     """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({
+            "status": "error",
+            "message": "Invalid JSON payload"
+        }), 400
+
+    unknown = sorted(set(data) - set(PROFILE_FIELDS))
+    if unknown:
+        return jsonify({
+            "status": "error",
+            "message": f"Unsupported profile fields: {', '.join(unknown)}"
+        }), 400
+
     try:
-        data = request.get_json()
-        updated_profile = update_user_profile(current_user.id, data)
+        user = UserService.update_user_profile(current_user.id, **data)
+        if not user:
+            return jsonify({
+                "status": "error",
+                "message": "User not found"
+            }), 404
         return jsonify({
             "status": "success",
-            "data": updated_profile
+            "data": serializer.serialize(user, serializer.USER_FIELDS)
         }), 200
+    except PasswordHasherBusy as busy:
+        response = jsonify({
+            "status": "error",
+            "message": str(busy)
+        })
+        response.headers["Retry-After"] = str(AUTH_RETRY_AFTER_SECONDS)
+        return response, 503
     except ValueError as ve:
         return jsonify({
             "status": "error",
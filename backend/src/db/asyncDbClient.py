@@ -0,0 +1,76 @@
+"""
+asyncDbClient.py
+
+This module is the asyncio counterpart of dbClient.py, used by the optional ASGI entry
+point (asgi.py). It builds an AsyncEngine on the asyncpg driver from the same
+DATABASE_URL and pool settings, and exposes get_async_session():
+
+    async with get_async_session() as session:
+        row = (await session.execute(stmt, params)).first()
+
+While a query waits on Postgres, the event loop serves other requests, so one process
+can keep thousands of requests in flight with only pool_size connections.
+
+Requires the optional async dependencies (backend/requirements-async.txt).
+
+Best Practices:
+- Only async code uses this engine; the Flask app, report workers and scripts keep
+  using dbClient.py. Both engines share the pool settings, so size max_connections
+  for both when the two serving modes run side by side.
+- Async sessions always use the primary; read replica routing (readRouting.py) is
+  only available to the sync services.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from backend.src.db import queryStats
+from backend.src.db.dbClient import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_PRE_PING
+)
+
+
+def to_async_url(url: str) -> str:
+    """
+    Returns the asyncpg form of a PostgreSQL URL (postgresql+asyncpg://...).
+    """
+    scheme, separator, rest = url.partition("://")
+    return f"postgresql+asyncpg{separator}{rest}" if scheme.startswith("postgres") else url
+
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=DB_ECHO,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=DB_POOL_PRE_PING
+)
+# Statement events fire on the engine's sync facade; this keeps the slow-query log.
+queryStats.instrument_engine(async_engine.sync_engine)
+
+# Objects stay usable after commit, as with the request-scoped sync sessions.
+AsyncSessionLocal = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def get_async_session() -> AsyncSession:
+    """
+    Returns a new AsyncSession, to be used as an async context manager. The session
+    is closed (and its connection returned to the pool) when the block exits.
+    """
+    return AsyncSessionLocal()
+
+
+async def dispose():
+    """
+    Closes the pool's connections. Call on application shutdown.
+    """
+    await async_engine.dispose()
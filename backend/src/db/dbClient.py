@@ -2,48 +2,236 @@
 dbClient.py
 
 This module sets up and manages a connection to the PostgreSQL database using SQLAlchemy.
-It exposes a get_db_session() function that returns a SQLAlchemy session object for
-interacting with the database.
+It owns the application's only engine (built by create_db_engine) and exposes a
+get_db_session() function that returns a SQLAlchemy session for interacting with the
+database.
+
+Inside a Flask request, get_db_session() hands out one session per request: the auth
+middleware and every service called by the endpoint share it, so a request uses at
+most one pooled connection at a time. Each outermost `with get_db_session()` block
+ends its transaction on exit (commit, or rollback on error), which returns the
+connection to the pool between blocks. The session itself is closed by
+remove_db_session, registered with app.teardown_appcontext. Outside a request (report
+workers, scripts, threads), get_db_session() returns a new session, as before.
+
+Pool settings (all optional):
+- DATABASE_URL, or GFVRHO_DB_USER / _PASSWORD / _HOST / _PORT / _NAME (the unprefixed
+  DB_USER ... DB_NAME and DB_ENV are honoured as fallbacks, see get_db_url)
+- GFVRHO_DB_POOL_SIZE, GFVRHO_DB_MAX_OVERFLOW, GFVRHO_DB_POOL_TIMEOUT_SECONDS
+- GFVRHO_DB_POOL_RECYCLE_SECONDS, GFVRHO_DB_POOL_PRE_PING, GFVRHO_DB_ECHO
 
 Best Practices:
 - Keep connection logic centralized here and avoid duplicating it in models or migrations.
+  Other modules (dbConfig.py, benchmarks) reuse this engine rather than creating their own.
 - Store sensitive credentials (username, password) in environment variables or a secure vault
   (e.g., AWS Secrets Manager) and retrieve them programmatically.
 - Do not define models or perform migrations here; that logic belongs in separate modules.
+- Size pool_size + max_overflow, multiplied by the number of worker processes, below
+  the server's max_connections.
 """
 
 import os
-from sqlalchemy import create_engine
+import time
+import threading
+from contextlib import contextmanager
+from flask import g, has_app_context
+from sqlalchemy import create_engine, exc
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from backend.src.db import queryStats
 
 # In a production environment, store these credentials in a secure location like AWS Secrets Manager or SSM.
 # The placeholders below can be replaced by environment variables or a config file.
-DB_USER = os.environ.get("GFVRHO_DB_USER", "postgres")
-DB_PASSWORD = os.environ.get("GFVRHO_DB_PASSWORD", "postgres")
-DB_HOST = os.environ.get("GFVRHO_DB_HOST", "localhost")
-DB_PORT = os.environ.get("GFVRHO_DB_PORT", "5432")
-DB_NAME = os.environ.get("GFVRHO_DB_NAME", "gfvrho")
+# The GFVRHO_DB_* names win; the unprefixed DB_* names read by the old dbConfig.py
+# (and used in backend/.env) still work as fallbacks.
+def get_db_url() -> str:
+    """
+    Builds the database URL from the environment. A full DATABASE_URL (as set by
+    docker-compose) wins. Otherwise the URL is assembled from GFVRHO_DB_USER / _PASSWORD /
+    _HOST / _PORT / _NAME, falling back to DB_USER / DB_PASSWORD / DB_HOST / DB_PORT /
+    DB_NAME. As in the old dbConfig.py, DB_ENV set to anything but "prod" appends "_dev"
+    to the database name.
+    """
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+
+    user = os.environ.get("GFVRHO_DB_USER", os.environ.get("DB_USER", "postgres"))
+    password = os.environ.get("GFVRHO_DB_PASSWORD", os.environ.get("DB_PASSWORD", "postgres"))
+    host = os.environ.get("GFVRHO_DB_HOST", os.environ.get("DB_HOST", "localhost"))
+    port = os.environ.get("GFVRHO_DB_PORT", os.environ.get("DB_PORT", "5432"))
+    name = os.environ.get("GFVRHO_DB_NAME", os.environ.get("DB_NAME", "gfvrho"))
+    db_env = os.environ.get("DB_ENV")
+    if db_env and db_env != "prod":
+        name = f"{name}_dev"
+    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
+
+
+DATABASE_URL = get_db_url()
+
+DB_POOL_SIZE = int(os.environ.get("GFVRHO_DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.environ.get("GFVRHO_DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT_SECONDS = float(os.environ.get("GFVRHO_DB_POOL_TIMEOUT_SECONDS", 10))
+# Recycle connections before server-side or load balancer idle timeouts close them.
+DB_POOL_RECYCLE_SECONDS = int(os.environ.get("GFVRHO_DB_POOL_RECYCLE_SECONDS", 1800))
+DB_POOL_PRE_PING = os.environ.get("GFVRHO_DB_POOL_PRE_PING", "true").lower() == "true"
+DB_ECHO = os.environ.get("GFVRHO_DB_ECHO", "false").lower() == "true"
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how often connections are checked out and how long
+    callers wait for one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._metrics_lock:
+                self._checkouts += 1
+                self._wait_seconds_total += waited
+                self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def recreate(self):
+        # Keep the counters across engine.dispose(), which replaces the pool.
+        pool = super().recreate()
+        pool._checkouts = self._checkouts
+        pool._timeouts = self._timeouts
+        pool._wait_seconds_total = self._wait_seconds_total
+        pool._wait_seconds_max = self._wait_seconds_max
+        return pool
+
+    def metrics(self) -> dict:
+        """
+        Returns current pool occupancy and cumulative checkout/wait counters.
+        """
+        with self._metrics_lock:
+            checkouts = self._checkouts
+            return {
+                "pool_size": self.size(),
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                "overflow": self.overflow(),
+                "max_overflow": self._max_overflow,
+                "checkouts": checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds_total": self._wait_seconds_total,
+                "wait_seconds_avg": self._wait_seconds_total / checkouts if checkouts else 0.0,
+                "wait_seconds_max": self._wait_seconds_max,
+            }
+
+
+def create_db_engine(url: str = DATABASE_URL, **overrides):
+    """
+    Builds an engine with the application's pool settings and statement
+    instrumentation (see queryStats.py). Use this instead of calling create_engine
+    directly so every engine is tuned and instrumented alike.
+
+    :param url: The database URL.
+    :param overrides: Keyword arguments passed to create_engine over the defaults.
+    :return: A SQLAlchemy Engine.
+    """
+    options = {
+        "echo": DB_ECHO,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    options.update(overrides)
+    return queryStats.instrument_engine(create_engine(url, **options))
 
-# Construct the database URL for PostgreSQL.
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 # Create an engine and session factory.
-# - echo=False to silence SQL debug logs in production; set True for debugging if needed.
-engine = create_engine(DATABASE_URL, echo=False)
+# - echo is off unless GFVRHO_DB_ECHO=true; turn it on for debugging if needed.
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# g attributes holding request-scoped sessions (see request_session_block).
+_request_session_keys = {"_db_session"}
+
 def get_db_session():
     """
-    Creates and returns a new SQLAlchemy session.
+    Returns a SQLAlchemy session, to be used as a context manager.
 
     Usage:
         with get_db_session() as session:
             # Perform database operations here
             ...
+
+    Inside a Flask request this is the request's shared session; outside one it is a
+    new session that is closed when the block exits.
     """
-    # For a context-managed approach:
-    #     with get_db_session() as session:
-    #         ...
-    # you might define a context manager. For now, this function simply
-    # returns the SessionLocal instance.
+    if has_app_context():
+        return request_session_block("_db_session", SessionLocal)
     return SessionLocal()
+
+
+def remove_db_session(exception=None):
+    """
+    Closes the request's session, if one was opened. Register with
+    app.teardown_appcontext.
+    """
+    for key in list(_request_session_keys):
+        session = g.pop(key, None)
+        g.pop(f"{key}_depth", None)
+        if session is not None:
+            if exception is not None:
+                session.rollback()
+            session.close()
+
+
+def get_pool_metrics() -> dict:
+    """
+    Returns checkout and wait statistics for the engine's connection pool.
+    """
+    return engine.pool.metrics()
+
+
+@contextmanager
+def request_session_block(key: str, factory):
+    """
+    Yields the request's session stored under key (creating it with factory on
+    first use). Only the outermost block ends the transaction, so nested blocks
+    (a service calling another service) share it. Sessions created here are
+    closed by remove_db_session.
+    """
+    depth_key = f"{key}_depth"
+    session = g.get(key)
+    if session is None:
+        # Objects must stay usable after a block commits, since the endpoint reads
+        # them after the service's block has ended.
+        session = factory(expire_on_commit=False)
+        setattr(g, key, session)
+        setattr(g, depth_key, 0)
+        _request_session_keys.add(key)
+
+    setattr(g, depth_key, g.get(depth_key) + 1)
+    try:
+        yield session
+    except BaseException:
+        if g.get(depth_key) == 1:
+            session.rollback()
+        raise
+    else:
+        if g.get(depth_key) == 1:
+            # Ends the transaction and returns the connection to the pool.
+            session.commit()
+    finally:
+        setattr(g, depth_key, g.get(depth_key) - 1)
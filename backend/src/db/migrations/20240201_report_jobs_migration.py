@@ -0,0 +1,58 @@
+# backend/src/db/migrations/20240201_report_jobs_migration.py
+
+from alembic import op
+import sqlalchemy as sa
+
+# Migration Identifiers
+revision = '20240201_report_jobs_migration'
+down_revision = '20240101_initial_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create the report_jobs table used as the durable report generation queue.
+    """
+    op.create_table(
+        'report_jobs',
+        sa.Column('id', sa.String(32), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('tier', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('report_id', sa.Integer(), sa.ForeignKey('reports.id'), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('locked_by', sa.String(255), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True)
+    )
+
+    # Workers claim the oldest queued job; a partial index keeps that lookup
+    # small no matter how many finished jobs accumulate.
+    op.create_index(
+        'ix_report_jobs_queued_created_at',
+        'report_jobs',
+        ['created_at'],
+        postgresql_where=sa.text("status = 'queued'")
+    )
+
+    # The lease reaper scans running jobs by lease expiry.
+    op.create_index(
+        'ix_report_jobs_running_lease',
+        'report_jobs',
+        ['lease_expires_at'],
+        postgresql_where=sa.text("status = 'running'")
+    )
+
+
+def downgrade():
+    """
+    Drop the report_jobs table.
+    """
+    op.drop_index('ix_report_jobs_running_lease', table_name='report_jobs')
+    op.drop_index('ix_report_jobs_queued_created_at', table_name='report_jobs')
+    op.drop_table('report_jobs')
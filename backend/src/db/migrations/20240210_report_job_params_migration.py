@@ -0,0 +1,28 @@
+# backend/src/db/migrations/20240210_report_job_params_migration.py
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Migration Identifiers
+revision = '20240210_report_job_params_migration'
+down_revision = '20240201_report_jobs_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Store the request inputs (e.g., company name) needed to run a queued report job.
+    """
+    op.add_column(
+        'report_jobs',
+        sa.Column('params', postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb"))
+    )
+
+
+def downgrade():
+    """
+    Drop the report job params column.
+    """
+    op.drop_column('report_jobs', 'params')
@@ -0,0 +1,33 @@
+# backend/src/db/migrations/20240220_llm_response_cache_migration.py
+
+from alembic import op
+import sqlalchemy as sa
+
+# Migration Identifiers
+revision = '20240220_llm_response_cache_migration'
+down_revision = '20240210_report_job_params_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create the persistent tier of the LLM response cache.
+    """
+    op.create_table(
+        'llm_response_cache',
+        sa.Column('cache_key', sa.String(64), primary_key=True),
+        sa.Column('model', sa.String(100), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False)
+    )
+    op.create_index('ix_llm_response_cache_expires_at', 'llm_response_cache', ['expires_at'])
+
+
+def downgrade():
+    """
+    Drop the LLM response cache table.
+    """
+    op.drop_index('ix_llm_response_cache_expires_at', table_name='llm_response_cache')
+    op.drop_table('llm_response_cache')
@@ -0,0 +1,34 @@
+# backend/src/db/migrations/20240301_report_job_request_key_migration.py
+
+from alembic import op
+import sqlalchemy as sa
+
+# Migration Identifiers
+revision = '20240301_report_job_request_key_migration'
+down_revision = '20240220_llm_response_cache_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add the request identity used to coalesce duplicate report jobs.
+    At most one queued or running job may exist per request key; finished jobs
+    do not block a later identical request.
+    """
+    op.add_column('report_jobs', sa.Column('request_key', sa.String(64), nullable=True))
+    op.create_index(
+        'uq_report_jobs_inflight_request_key',
+        'report_jobs',
+        ['request_key'],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')")
+    )
+
+
+def downgrade():
+    """
+    Drop the report job request key.
+    """
+    op.drop_index('uq_report_jobs_inflight_request_key', table_name='report_jobs')
+    op.drop_column('report_jobs', 'request_key')
@@ -0,0 +1,32 @@
+# backend/src/db/migrations/20240310_report_pdf_key_migration.py
+
+from alembic import op
+import sqlalchemy as sa
+
+# Migration Identifiers
+revision = '20240310_report_pdf_key_migration'
+down_revision = '20240301_report_job_request_key_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Store the S3 key of each report's PDF; download URLs are pre-signed on read.
+    """
+    op.add_column('reports', sa.Column('pdf_key', sa.String(255), nullable=True))
+
+    # Reports created before this migration stored an expiring pre-signed URL.
+    # Recover the object key from its path so those reports get fresh links again.
+    op.execute(
+        "UPDATE reports "
+        "SET pdf_key = substring(pdf_url from '(reports/[^?/]+\\.pdf)') "
+        "WHERE pdf_key IS NULL AND pdf_url ~ 'amazonaws\\.com/.*reports/[^?/]+\\.pdf'"
+    )
+
+
+def downgrade():
+    """
+    Drop the report PDF key column.
+    """
+    op.drop_column('reports', 'pdf_key')
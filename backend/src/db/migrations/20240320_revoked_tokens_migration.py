@@ -0,0 +1,35 @@
+# backend/src/db/migrations/20240320_revoked_tokens_migration.py
+
+from alembic import op
+import sqlalchemy as sa
+
+# Migration Identifiers
+revision = '20240320_revoked_tokens_migration'
+down_revision = '20240310_report_pdf_key_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create the revocation store for JWTs invalidated before they expire (logout).
+    """
+    op.create_table(
+        'revoked_tokens',
+        sa.Column('jti', sa.String(32), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False)
+    )
+    op.create_index('ix_revoked_tokens_expires_at', 'revoked_tokens', ['expires_at'])
+    # Workers refresh their filters incrementally by revoked_at.
+    op.create_index('ix_revoked_tokens_revoked_at', 'revoked_tokens', ['revoked_at'])
+
+
+def downgrade():
+    """
+    Drop the revoked tokens table.
+    """
+    op.drop_index('ix_revoked_tokens_revoked_at', table_name='revoked_tokens')
+    op.drop_index('ix_revoked_tokens_expires_at', table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
@@ -0,0 +1,26 @@
+# backend/src/db/migrations/20240325_users_username_unique_migration.py
+
+from alembic import op
+
+# Migration Identifiers
+revision = '20240325_users_username_unique_migration'
+down_revision = '20240320_revoked_tokens_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Enforce unique usernames, as the User model declares. Registration relies on this
+    constraint (INSERT ... ON CONFLICT DO NOTHING) instead of checking first.
+
+    Fails if duplicate usernames already exist; resolve those before upgrading.
+    """
+    op.create_unique_constraint('uq_users_username', 'users', ['username'])
+
+
+def downgrade():
+    """
+    Drop the unique username constraint.
+    """
+    op.drop_constraint('uq_users_username', 'users', type_='unique')
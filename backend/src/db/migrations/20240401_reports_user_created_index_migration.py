@@ -0,0 +1,39 @@
+# backend/src/db/migrations/20240401_reports_user_created_index_migration.py
+
+from alembic import op
+import sqlalchemy as sa
+
+# Migration Identifiers
+revision = '20240401_reports_user_created_index_migration'
+down_revision = '20240325_users_username_unique_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Index a user's reports in listing order so /api/reports/all pages are index seeks.
+
+    The index matches ORDER BY created_at DESC, id DESC and the keyset predicate
+    (created_at, id) < (:created_at, :id) used by reportService.get_reports_page.
+    It is built CONCURRENTLY so the reports table stays writable during the build.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reports_user_id_created_at_id',
+            'reports',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    """
+    Drop the report listing index.
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_reports_user_id_created_at_id',
+            table_name='reports',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,31 @@
+# backend/src/db/migrations/20240405_users_created_at_index_migration.py
+
+from alembic import op
+
+# Migration Identifiers
+revision = '20240405_users_created_at_index_migration'
+down_revision = '20240401_reports_user_created_index_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Index users by creation time for the created_at filter of UserService.list_users.
+    Built CONCURRENTLY so signups are not blocked during the build.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_created_at',
+            'users',
+            ['created_at'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    """
+    Drop the users creation time index.
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_created_at', table_name='users', postgresql_concurrently=True)
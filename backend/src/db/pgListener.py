@@ -0,0 +1,144 @@
+"""
+pgListener.py
+
+This module delivers PostgreSQL NOTIFY messages to in-process handlers. It is how
+per-process state (caches, routing hints) learns about changes made by other gunicorn
+workers, report workers or nodes.
+
+Each process runs one listener thread on one dedicated connection (outside the
+SQLAlchemy pool) that LISTENs on every subscribed channel:
+
+    pgListener.subscribe("gfvrho_user_invalidate", on_notify, on_reset)
+    pgListener.ensure_started()
+
+- on_notify(payload) is called for each notification on the channel.
+- on_reset() is called whenever notifications may have been missed: when the listener
+  (re)connects, and after it loses its connection. Handlers should drop any state
+  that notifications keep fresh.
+
+Send notifications with notify(session, channel, payload). NOTIFY is transactional:
+it is delivered when the session's transaction commits, and never if it rolls back.
+
+Best Practices:
+- Subscribe at import time, before the first ensure_started() call.
+- Handlers run on the listener thread; keep them fast and thread-safe.
+"""
+
+import os
+import time
+import select
+import logging
+import threading
+import psycopg2
+from sqlalchemy import text
+from backend.src.db.dbClient import DATABASE_URL
+
+LISTENER_RECONNECT_SECONDS = 5
+
+# Sends a notification; parameters are channel and payload. Async sessions execute
+# it directly (await session.execute(NOTIFY_STATEMENT, {...})).
+NOTIFY_STATEMENT = text("SELECT pg_notify(:channel, :payload)")
+
+logger = logging.getLogger(__name__)
+
+_subscriptions = {}
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+
+def subscribe(channel: str, on_notify, on_reset=None):
+    """
+    Registers handlers for a channel.
+
+    :param channel: The NOTIFY channel name (a plain identifier).
+    :param on_notify: Called with each notification's payload (str).
+    :param on_reset: Called when notifications may have been missed.
+    """
+    _subscriptions.setdefault(channel, []).append((on_notify, on_reset))
+
+
+def ensure_started():
+    """
+    Starts the listener thread for this process if it is not running. Checked by PID
+    so workers forked from a preloaded master start their own listener.
+    """
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return
+    with _listener_lock:
+        if _listener_pid == os.getpid():
+            return
+        # State built before the fork was never covered by a listener.
+        _reset_all()
+        thread = threading.Thread(target=_listen_forever, name="pg-listener", daemon=True)
+        thread.start()
+        _listener_pid = os.getpid()
+
+
+def is_listening() -> bool:
+    """
+    Returns whether this process has started its listener.
+    """
+    return _listener_pid == os.getpid()
+
+
+def notify(session, channel: str, payload: str):
+    """
+    Sends a notification on the session's transaction (delivered on commit).
+
+    :param session: The SQLAlchemy session whose transaction carries the change.
+    :param channel: The NOTIFY channel name.
+    :param payload: The message, e.g. an ID.
+    """
+    session.execute(NOTIFY_STATEMENT, {"channel": channel, "payload": payload})
+
+
+def _reset_all():
+    for handlers in list(_subscriptions.values()):
+        for _, on_reset in handlers:
+            if on_reset is not None:
+                on_reset()
+
+
+def _dispatch(channel: str, payload: str):
+    for on_notify, _ in _subscriptions.get(channel, ()):
+        try:
+            on_notify(payload)
+        except Exception as e:
+            logger.warning("Handler for %s failed: %s", channel, e)
+
+
+def _listen_forever():
+    while True:
+        try:
+            _listen()
+        except Exception as e:
+            logger.warning("Postgres listener disconnected: %s", e)
+        # Notifications may have been missed while disconnected.
+        _reset_all()
+        time.sleep(LISTENER_RECONNECT_SECONDS)
+
+
+def _listen():
+    """
+    Holds a dedicated connection in LISTEN mode and dispatches notifications as
+    they arrive.
+    """
+    # Keepalives make a silently dropped connection fail instead of idling forever.
+    conn = psycopg2.connect(DATABASE_URL, keepalives=1, keepalives_idle=30, keepalives_interval=10)
+    try:
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            for channel in list(_subscriptions):
+                cursor.execute(f"LISTEN {channel}")
+        # State built while the listener was starting may predate a missed change.
+        _reset_all()
+
+        while True:
+            select.select([conn], [], [], 60)
+            conn.poll()
+            while conn.notifies:
+                notification = conn.notifies.pop(0)
+                _dispatch(notification.channel, notification.payload)
+    finally:
+        conn.close()
@@ -0,0 +1,172 @@
+"""
+queryStats.py
+
+This module instruments SQLAlchemy engines to show what each Flask request does in the
+database. create_db_engine (dbClient.py) calls instrument_engine on every engine it
+builds, so the primary and the read replicas are both covered, and init_app(app)
+registers the per-request reporting:
+
+- Every statement run inside a request is counted and timed.
+- Statements slower than GFVRHO_DB_SLOW_QUERY_MS are logged, inside a request or not.
+  Parameters are redacted: only their names and types are logged.
+- When one request runs the same SQL GFVRHO_DB_N_PLUS_ONE_THRESHOLD times or more
+  (typically a lazy load such as Report.user inside a loop), it is logged as a likely
+  N+1 query.
+- In debug mode, responses carry X-DB-Query-Count, X-DB-Query-Time-Ms and
+  X-DB-Repeated-Statements headers.
+
+Process-wide totals are exposed by get_query_metrics() (see metricsController.py).
+
+Best Practices:
+- Fix an N+1 warning with a join, joinedload/selectinload, or a projection query
+  (see models/dto.py) rather than raising the threshold.
+- Keep the slow-query threshold above the normal latency of the busiest endpoints, so
+  the log stays readable in production.
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import Counter
+from flask import g, request, current_app, has_app_context
+from sqlalchemy import event
+
+SLOW_QUERY_MS = float(os.environ.get("GFVRHO_DB_SLOW_QUERY_MS", 200))
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("GFVRHO_DB_N_PLUS_ONE_THRESHOLD", 5))
+
+# Longest statement text written to the log.
+MAX_LOGGED_STATEMENT_LENGTH = 1000
+
+logger = logging.getLogger(__name__)
+
+_metrics_lock = threading.Lock()
+_metrics = {"statements": 0, "slow_statements": 0, "n_plus_one_requests": 0}
+
+
+class RequestQueryStats:
+    """
+    Statements run by one request.
+    """
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = Counter()
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> list:
+        """
+        Returns (statement, count) pairs run at least threshold times, most frequent first.
+        """
+        return [(statement, n) for statement, n in self.statements.most_common() if n >= threshold]
+
+
+def instrument_engine(engine):
+    """
+    Attaches the timing and counting hooks to an engine.
+
+    :param engine: A SQLAlchemy Engine.
+    :return: The same engine.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    return engine
+
+
+def init_app(app):
+    """
+    Registers the per-request reporting on a Flask application.
+    """
+    app.after_request(_after_request)
+
+
+def get_request_stats() -> RequestQueryStats:
+    """
+    Returns the current request's statistics, or None if it has not run any statement.
+    """
+    return g.get("_db_query_stats") if has_app_context() else None
+
+
+def get_query_metrics() -> dict:
+    """
+    Returns process-wide statement, slow statement and N+1 request counters.
+    """
+    with _metrics_lock:
+        return dict(_metrics)
+
+
+def redact_parameters(parameters):
+    """
+    Replaces parameter values with their type names so statements can be logged
+    without leaking user data.
+    """
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, list):
+        # executemany: one parameter set per row.
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, tuple):
+        return tuple(type(value).__name__ for value in parameters)
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["_query_started"].pop()
+    _record(statement, parameters, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("_query_started"):
+        connection.info["_query_started"].pop()
+
+
+def _record(statement: str, parameters, seconds: float):
+    slow = seconds * 1000 >= SLOW_QUERY_MS
+    with _metrics_lock:
+        _metrics["statements"] += 1
+        if slow:
+            _metrics["slow_statements"] += 1
+
+    if slow:
+        logger.warning(
+            "Slow query (%.1f ms): %s parameters=%s",
+            seconds * 1000, statement[:MAX_LOGGED_STATEMENT_LENGTH], redact_parameters(parameters)
+        )
+
+    if has_app_context():
+        stats = g.get("_db_query_stats")
+        if stats is None:
+            stats = g._db_query_stats = RequestQueryStats()
+        stats.count += 1
+        stats.seconds += seconds
+        stats.statements[statement] += 1
+
+
+def _after_request(response):
+    stats = get_request_stats()
+    if stats is None:
+        return response
+
+    repeated = stats.repeated()
+    if repeated:
+        with _metrics_lock:
+            _metrics["n_plus_one_requests"] += 1
+        for statement, n in repeated:
+            logger.warning(
+                "Possible N+1 query in %s %s: statement run %d times: %s",
+                request.method, request.path, n, statement[:MAX_LOGGED_STATEMENT_LENGTH]
+            )
+
+    if current_app.debug:
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Query-Time-Ms"] = f"{stats.seconds * 1000:.1f}"
+        response.headers["X-DB-Repeated-Statements"] = str(len(repeated))
+    return response
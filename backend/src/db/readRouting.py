@@ -0,0 +1,192 @@
+"""
+readRouting.py
+
+This module sends read-only work to PostgreSQL read replicas while writes stay on the
+primary engine from dbClient.py. Read-only service methods open their session with
+get_read_session() instead of get_db_session():
+
+    with get_read_session() as db:
+        return db.query(Report).filter(Report.id == report_id).first()
+
+Replica sessions are RoutingSession instances: queries run on one replica (picked
+round-robin per session), while anything that flushes or executes an INSERT, UPDATE
+or DELETE is routed to the primary.
+
+Replicas lag the primary, so reads fall back to the primary (read-your-writes) when:
+- the current request has already written through the primary session;
+- the user wrote within the last GFVRHO_DB_READ_YOUR_WRITES_SECONDS. Services call
+  mark_user_write(user_id, session) when they change a user's data, and the mark is
+  broadcast to every process with NOTIFY (see db/pgListener.py). That includes report
+  workers, so a freshly built report is read back from the primary;
+- the listener may have missed notifications (just started or reconnected): all reads
+  go to the primary for one window.
+Point lookups can use read_one(), which also retries a replica miss on the primary.
+
+Configuration:
+- GFVRHO_DB_REPLICA_URLS: comma-separated replica database URLs. When empty (the
+  default), get_read_session() is the same as get_db_session().
+- GFVRHO_DB_READ_YOUR_WRITES_SECONDS: how long a user's reads stay on the primary
+  after a write. Keep it above the replicas' typical replay lag.
+
+Best Practices:
+- Only use get_read_session() in methods that never write.
+- For local testing, point GFVRHO_DB_REPLICA_URLS at a second local Postgres (a
+  streaming replica, or a copy of the schema) to exercise the routing.
+"""
+
+import os
+import time
+import itertools
+import threading
+from flask import g, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
+from backend.src.db import pgListener
+from backend.src.db.dbClient import (
+    engine,
+    SessionLocal,
+    create_db_engine,
+    get_db_session,
+    request_session_block
+)
+from backend.src.utils.lruCache import LRUCache
+
+REPLICA_URLS = [url.strip() for url in os.environ.get("GFVRHO_DB_REPLICA_URLS", "").split(",") if url.strip()]
+READ_YOUR_WRITES_SECONDS = float(os.environ.get("GFVRHO_DB_READ_YOUR_WRITES_SECONDS", 5))
+READ_YOUR_WRITES_CACHE_SIZE = int(os.environ.get("GFVRHO_DB_READ_YOUR_WRITES_CACHE_SIZE", 100000))
+
+# Postgres channel carrying the IDs of users who just wrote.
+USER_WRITE_CHANNEL = "gfvrho_user_write"
+
+replica_engines = [create_db_engine(url) for url in REPLICA_URLS]
+_replica_cycle = itertools.cycle(replica_engines) if replica_engines else None
+_replica_lock = threading.Lock()
+
+# Users whose reads stay on the primary, expiring after the read-your-writes window.
+_recent_writers = LRUCache(maxsize=READ_YOUR_WRITES_CACHE_SIZE, ttl_seconds=READ_YOUR_WRITES_SECONDS)
+_primary_only_until = 0.0
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica and sends writes to the primary.
+    """
+
+    def __init__(self, replica=None, **kwargs):
+        super().__init__(**kwargs)
+        self._replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._replica is None or self._flushing or isinstance(clause, UpdateBase):
+            return engine
+        return self._replica
+
+
+ReplicaSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+
+def replicas_enabled() -> bool:
+    """
+    Returns whether any replica is configured.
+    """
+    return bool(replica_engines)
+
+
+def get_read_session(user_id: int = None):
+    """
+    Returns a session for read-only work, to be used as a context manager. It reads
+    from a replica unless read-your-writes requires the primary.
+
+    :param user_id: The user whose data is read. Defaults to the authenticated user
+                    of the current request, if any.
+    """
+    if not _use_replica(user_id):
+        return get_db_session()
+    if has_app_context():
+        return request_session_block("_db_replica_session", _new_replica_session)
+    return _new_replica_session()
+
+
+def read_one(query_fn, user_id: int = None):
+    """
+    Runs a point lookup on a read session. If a replica returned nothing, the row
+    may simply not have replicated yet, so the lookup is repeated on the primary.
+
+    :param query_fn: Function session -> result (None when not found).
+    :param user_id: As for get_read_session.
+    :return: The result of query_fn.
+    """
+    use_replica = _use_replica(user_id)
+    with get_read_session(user_id) as db:
+        result = query_fn(db)
+    if result is None and use_replica:
+        with get_db_session() as db:
+            result = query_fn(db)
+    return result
+
+
+def mark_user_write(user_id: int, session=None):
+    """
+    Keeps the user's reads on the primary for READ_YOUR_WRITES_SECONDS, in every
+    process. Call it from services that change a user's data.
+
+    :param user_id: The user whose data changed.
+    :param session: The session making the change; the mark is broadcast when its
+                    transaction commits.
+    """
+    if not replica_engines or user_id is None:
+        return
+    _recent_writers.set(user_id, True)
+    if session is not None:
+        pgListener.notify(session, USER_WRITE_CHANNEL, str(user_id))
+
+
+def _use_replica(user_id: int = None) -> bool:
+    if not replica_engines:
+        return False
+    pgListener.ensure_started()
+    if time.monotonic() < _primary_only_until:
+        return False
+
+    if has_app_context():
+        if g.get("_db_wrote"):
+            return False
+        if user_id is None:
+            user_id = (g.get("token_claims") or {}).get("user_id")
+    return user_id is None or _recent_writers.get(user_id) is None
+
+
+def _new_replica_session(**kwargs):
+    with _replica_lock:
+        replica = next(_replica_cycle)
+    return ReplicaSessionLocal(replica=replica, **kwargs)
+
+
+def _on_user_write(payload: str):
+    try:
+        _recent_writers.set(int(payload), True)
+    except ValueError:
+        _on_reset()
+
+
+def _on_reset():
+    # Writes may have gone unannounced; read from the primary until they have replicated.
+    global _primary_only_until
+    _primary_only_until = time.monotonic() + READ_YOUR_WRITES_SECONDS
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _after_flush(session, flush_context):
+    if has_app_context():
+        g._db_wrote = True
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _after_write_statement(orm_execute_state):
+    if has_app_context() and (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        g._db_wrote = True
+
+
+if replica_engines:
+    pgListener.subscribe(USER_WRITE_CHANNEL, _on_user_write, on_reset=_on_reset)
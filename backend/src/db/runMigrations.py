@@ -0,0 +1,214 @@
+"""
+runMigrations.py
+
+Applies the migrations in db/migrations to the database, in revision order. Each
+migration module is an Alembic revision (revision / down_revision / upgrade); this
+module runs them with Alembic's operations API, so no alembic.ini or env.py is needed.
+
+Applied revisions are recorded in the schema_migrations table, so running it again only
+applies what is new. Each migration runs in its own transaction; migrations that build
+indexes CONCURRENTLY leave it through op.get_context().autocommit_block().
+
+Every replica (and the report worker) runs this on start. The whole run holds a Postgres
+advisory lock, so concurrent runners queue behind the first one and then find nothing
+left to apply, instead of racing each other through the same migrations.
+
+Usage (the backend container runs this before starting gunicorn):
+    python -m backend.src.db.runMigrations
+    python -m backend.src.db.runMigrations --stamp 20240405_users_created_at_index_migration
+
+--stamp records every revision up to and including the given one as applied without
+running it, for databases whose schema was created before migrations were tracked.
+
+Upgrading an existing database: a database that already has tables but no
+schema_migrations records is refused rather than replayed from the first migration
+(which would fail on the existing tables on every container start). Once, before
+deploying, stamp the newest revision its schema already has, e.g. for a database
+created by the initial migration:
+    python -m backend.src.db.runMigrations --stamp 20240101_initial_migration
+The next start applies the remaining migrations.
+
+Best Practices:
+- Never edit a migration that has been applied somewhere; add a new one whose
+  down_revision is the current head.
+- Keep exactly one head. The runner refuses to guess the order of branched revisions.
+"""
+
+import os
+import glob
+import time
+import logging
+import argparse
+import importlib.util
+from contextlib import contextmanager
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import MetaData, Table, Column, String, DateTime, func, select, text, inspect
+from backend.src.db.dbClient import engine
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# Key of the Postgres advisory lock held while migrating; any fixed bigint unique to this use.
+MIGRATION_LOCK_KEY = 4711202403
+
+# Seconds between attempts to take the lock while another run holds it.
+MIGRATION_LOCK_POLL_SECONDS = 1
+
+logger = logging.getLogger(__name__)
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("revision", String(128), primary_key=True),
+    Column("applied_at", DateTime(), server_default=func.now(), nullable=False)
+)
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> list:
+    """
+    Loads the migration modules in directory and returns them in the order they apply,
+    following down_revision from the base revision.
+
+    :raises RuntimeError: If the revisions do not form a single chain.
+    """
+    modules = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.py"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(f"gfvrho_migration_{name}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if module.revision in modules:
+            raise RuntimeError(f"Duplicate migration revision {module.revision!r} in {path}")
+        modules[module.revision] = module
+
+    children = {}
+    for module in modules.values():
+        if module.down_revision in children:
+            raise RuntimeError(
+                f"Revisions {children[module.down_revision].revision!r} and {module.revision!r} "
+                f"both follow {module.down_revision!r}"
+            )
+        children[module.down_revision] = module
+
+    ordered = []
+    current = children.get(None)
+    while current is not None:
+        ordered.append(current)
+        current = children.get(current.revision)
+    if len(ordered) != len(modules):
+        unreachable = sorted(set(modules) - {module.revision for module in ordered})
+        raise RuntimeError(f"Migrations not reachable from the base revision: {unreachable}")
+    return ordered
+
+
+def applied_revisions(connection) -> set:
+    """
+    Returns the revisions recorded in schema_migrations, creating the table if needed.
+    """
+    _metadata.create_all(connection, tables=[schema_migrations])
+    return set(connection.execute(select(schema_migrations.c.revision)).scalars())
+
+
+@contextmanager
+def migration_lock():
+    """
+    Holds the migration advisory lock for the duration of the block, waiting for any
+    other runner to finish first. The lock is taken on its own connection, so the
+    migrations' connections and transactions are unaffected. A no-op on databases
+    other than Postgres.
+
+    Waiters poll with pg_try_advisory_lock rather than blocking in pg_advisory_lock:
+    a blocked statement is an open transaction, and CREATE INDEX CONCURRENTLY in the
+    lock holder's migrations waits for every open transaction to finish, so the two
+    runners would wait on each other forever.
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    # Autocommit, so the lock connection is never idle in a transaction either.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        acquire = text("SELECT pg_try_advisory_lock(:key)")
+        while not connection.execute(acquire, {"key": MIGRATION_LOCK_KEY}).scalar():
+            logger.info("Waiting for another migration run to finish")
+            time.sleep(MIGRATION_LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+
+def upgrade(stamp: str = None) -> list:
+    """
+    Applies every migration not yet recorded, oldest first, under the migration lock.
+
+    :param stamp: Record revisions up to and including this one as applied, without
+                  running them, before applying the rest.
+    :return: The revisions that were applied (or stamped) by this call.
+    :raises RuntimeError: If the database has tables but no recorded migrations and no
+                          stamp is given, or if stamp is not a known revision.
+    """
+    migrations = load_migrations()
+    revisions = [module.revision for module in migrations]
+    if stamp is not None and stamp not in revisions:
+        raise RuntimeError(f"Unknown revision {stamp!r}")
+
+    with migration_lock():
+        return _apply(migrations, revisions, stamp)
+
+
+def _apply(migrations: list, revisions: list, stamp: str) -> list:
+    """
+    Applies (or stamps) the migrations not yet recorded. Called with the lock held.
+    """
+    with engine.begin() as connection:
+        done = applied_revisions(connection)
+        existing = set(inspect(connection).get_table_names()) - {schema_migrations.name}
+
+    if not done and existing and stamp is None:
+        raise RuntimeError(
+            "The database already has tables (" + ", ".join(sorted(existing)) + ") but no "
+            "recorded migrations, so applying from the first migration would fail. Record "
+            "the revisions its schema already has, then run again: "
+            "python -m backend.src.db.runMigrations --stamp <revision> "
+            f"(e.g. --stamp {revisions[0]})"
+        )
+
+    applied = []
+    for index, module in enumerate(migrations):
+        if module.revision in done:
+            continue
+        run = stamp is None or index > revisions.index(stamp)
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            with context.begin_transaction():
+                if run:
+                    logger.info("Applying migration %s", module.revision)
+                    with Operations.context(context):
+                        module.upgrade()
+                else:
+                    logger.info("Stamping migration %s as applied", module.revision)
+                # autocommit_block() may have swapped the connection; record on the current one.
+                context.connection.execute(schema_migrations.insert().values(revision=module.revision))
+        applied.append(module.revision)
+
+    if not applied:
+        logger.info("Database is up to date at %s", revisions[-1] if revisions else None)
+    return applied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending database migrations.")
+    parser.add_argument("--stamp", default=None, help="Mark revisions up to this one as applied without running them.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
+    try:
+        upgrade(stamp=args.stamp)
+    except RuntimeError as e:
+        logger.error("Migrations not applied: %s", e)
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+seedSynthetic.py
+
+Generates a large synthetic dataset for load tests and benchmarks: N users and M reports,
+streamed into PostgreSQL with COPY in batches. It reaches millions of rows in minutes,
+so pagination, indexes, the planner estimates and the caches can be measured at
+production scale.
+
+The data is skewed like real traffic:
+- Reports per user follow a heavy-tailed (Pareto) distribution: most users have a few
+  reports and a small number have thousands.
+- Tiers are weighted towards the cheaper ones (TIER_WEIGHTS, 60/30/10).
+- Users sign up over --days days, with more sign-ups recently. Each report is created
+  after its owner signed up, also biased towards recent dates.
+
+Usage (against a scratch database with migrations applied):
+    python -m backend.src.db.seeds.seedSynthetic --users 1000000 --reports 5000000
+    python -m backend.src.db.seeds.seedSynthetic --purge
+
+Notes:
+- Every seeded user has the email domain SEED_EMAIL_DOMAIN and the password
+  SEED_PASSWORD (one bcrypt hash computed up front), so login benchmarks can use them.
+- --seed makes the generated data reproducible.
+- Tables are ANALYZEd afterwards so planner estimates reflect the new rows.
+"""
+
+import io
+import csv
+import time
+import uuid
+import random
+import bisect
+import argparse
+import datetime
+import itertools
+import bcrypt
+from backend.src.db.dbClient import engine
+
+SEED_EMAIL_DOMAIN = "seed.gfvrho.test"
+SEED_PASSWORD = "seed-password"
+
+TIER_WEIGHTS = {1: 60, 2: 30, 3: 10}
+PENDING_PAYMENT_RATE = 0.05
+PARETO_ALPHA = 1.16  # ~80/20: a fifth of the users own most of the reports
+
+
+def _recent_biased_offset(rng: random.Random, span_seconds: float) -> float:
+    """
+    Returns an offset in [0, span_seconds) that favours the end of the span (recent dates).
+    """
+    return span_seconds * (rng.random() ** 0.5)
+
+
+def _copy_rows(cursor, table: str, columns: tuple, rows, batch_size: int) -> int:
+    """
+    Streams rows into table with COPY, one CSV buffer of batch_size rows at a time.
+
+    :return: The number of rows copied.
+    """
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    total = 0
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return total
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch)
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+        total += len(batch)
+
+
+def _generate_users(rng: random.Random, count: int, tag: str, password_hash: str,
+                    start: datetime.datetime, span_seconds: float):
+    for n in range(count):
+        created_at = start + datetime.timedelta(seconds=_recent_biased_offset(rng, span_seconds))
+        yield (
+            f"user{n}-{tag}@{SEED_EMAIL_DOMAIN}",
+            f"seed_{tag}_{n}",
+            password_hash,
+            created_at.isoformat(),
+            created_at.isoformat()
+        )
+
+
+def _generate_reports(rng: random.Random, count: int, users: list, end: datetime.datetime):
+    """
+    Yields report rows. users is a list of (id, created_at); owners are drawn with
+    Pareto-distributed weights.
+    """
+    cumulative = list(itertools.accumulate(rng.paretovariate(PARETO_ALPHA) for _ in users))
+    total_weight = cumulative[-1]
+    tiers = list(TIER_WEIGHTS)
+    tier_cumulative = list(itertools.accumulate(TIER_WEIGHTS.values()))
+
+    for _ in range(count):
+        user_id, user_created_at = users[bisect.bisect_left(cumulative, rng.random() * total_weight)]
+        if user_created_at.tzinfo is not None:
+            user_created_at = user_created_at.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        span = max((end - user_created_at).total_seconds(), 1.0)
+        created_at = user_created_at + datetime.timedelta(seconds=_recent_biased_offset(rng, span))
+        tier = tiers[bisect.bisect_left(tier_cumulative, rng.random() * tier_cumulative[-1])]
+        yield (
+            user_id,
+            tier,
+            created_at.isoformat(),
+            f"reports/{rng.getrandbits(256):064x}.pdf",
+            "PENDING" if rng.random() < PENDING_PAYMENT_RATE else "PAID"
+        )
+
+
+def seed(user_count: int, report_count: int, days: int, batch_size: int, rng_seed: int = None):
+    """
+    Generates and loads the dataset.
+    """
+    rng = random.Random(rng_seed)
+    tag = f"{rng.getrandbits(32):08x}" if rng_seed is not None else uuid.uuid4().hex[:8]
+    # Naive UTC, matching the timestamp columns created by the initial migration.
+    end = datetime.datetime.utcnow()
+    start = end - datetime.timedelta(days=days)
+    password_hash = bcrypt.hashpw(SEED_PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+
+        started = time.perf_counter()
+        copied = _copy_rows(
+            cursor, "users", ("email", "username", "password_hash", "created_at", "updated_at"),
+            _generate_users(rng, user_count, tag, password_hash, start, (end - start).total_seconds()),
+            batch_size
+        )
+        connection.commit()
+        print(f"users:   {copied:>12,} rows in {time.perf_counter() - started:7.1f}s")
+
+        # COPY cannot return generated IDs; read back this run's users.
+        cursor.execute(
+            "SELECT id, created_at FROM users WHERE username LIKE %s ORDER BY id",
+            (f"seed\\_{tag}\\_%",)
+        )
+        users = cursor.fetchall()
+
+        started = time.perf_counter()
+        copied = _copy_rows(
+            cursor, "reports", ("user_id", "tier", "created_at", "pdf_key", "payment_status"),
+            _generate_reports(rng, report_count, users, end) if users else (),
+            batch_size
+        )
+        connection.commit()
+        print(f"reports: {copied:>12,} rows in {time.perf_counter() - started:7.1f}s")
+
+        cursor.execute("ANALYZE users")
+        cursor.execute("ANALYZE reports")
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def purge():
+    """
+    Deletes every seeded user and their reports.
+    """
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        pattern = f"%@{SEED_EMAIL_DOMAIN}"
+        cursor.execute(
+            "DELETE FROM reports WHERE user_id IN (SELECT id FROM users WHERE email LIKE %s)", (pattern,)
+        )
+        reports = cursor.rowcount
+        cursor.execute("DELETE FROM users WHERE email LIKE %s", (pattern,))
+        users = cursor.rowcount
+        connection.commit()
+        print(f"Deleted {users:,} seeded users and {reports:,} reports.")
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load a large synthetic dataset for benchmarks.")
+    parser.add_argument("--users", type=int, default=100000, help="Users to create.")
+    parser.add_argument("--reports", type=int, default=500000, help="Reports to create.")
+    parser.add_argument("--days", type=int, default=730, help="Spread of created_at, in days before now.")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Rows per COPY batch.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible data.")
+    parser.add_argument("--purge", action="store_true", help="Delete previously seeded data and exit.")
+    args = parser.parse_args()
+
+    if args.purge:
+        purge()
+        return
+    seed(args.users, args.reports, args.days, args.batch_size, args.seed)
+
+
+if __name__ == '__main__':
+    main()
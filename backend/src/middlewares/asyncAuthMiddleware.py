@@ -0,0 +1,71 @@
+"""
+asyncAuthMiddleware.py
+
+This file is the ASGI counterpart of authMiddleware.py. It defines async_token_required,
+a decorator for the Starlette endpoints in asgi.py that enforces the same JWT rules
+with the same error messages and status codes.
+
+Best Practices:
+1. Keep the checks identical to authMiddleware.token_required; change both together.
+2. The token is verified on the event loop (CPU only). The revocation check and user
+   lookup are served from in-process caches almost always, but may query Postgres, so
+   they run together in one hop to a worker thread.
+"""
+
+import asyncio
+import jwt
+from functools import wraps
+from starlette.responses import JSONResponse
+from backend.src.middlewares.authMiddleware import JWT_SECRET, JWT_ALGORITHM
+from backend.src.services import userCache, tokenRevocation
+
+
+def async_token_required(f):
+    """
+    A decorator to protect Starlette endpoints by requiring a valid token.
+    Usage:
+        @async_token_required
+        async def protected_route(request, current_user):
+            # Route logic
+
+    The decoded claims are available to the endpoint as request.state.token_claims.
+    """
+    @wraps(f)
+    async def decorated(request):
+        auth_header = request.headers.get('Authorization')
+        if not auth_header:
+            return JSONResponse({"error": "Authorization header is missing"}, status_code=401)
+
+        parts = auth_header.split()
+        if len(parts) != 2 or parts[0].lower() != "bearer":
+            return JSONResponse({"error": "Invalid Authorization header format"}, status_code=401)
+
+        try:
+            payload = jwt.decode(parts[1], JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            revoked, user = await asyncio.to_thread(_resolve, payload)
+        except jwt.ExpiredSignatureError:
+            return JSONResponse({"error": "Token has expired"}, status_code=401)
+        except jwt.InvalidTokenError:
+            return JSONResponse({"error": "Invalid token"}, status_code=401)
+        except Exception as e:
+            return JSONResponse({"error": str(e)}, status_code=500)
+
+        if revoked:
+            return JSONResponse({"error": "Token has been revoked"}, status_code=401)
+        if not user:
+            return JSONResponse({"error": "User does not exist"}, status_code=401)
+
+        request.state.token_claims = payload
+        return await f(request, user)
+
+    return decorated
+
+
+def _resolve(payload: dict) -> tuple:
+    """
+    Returns (revoked, user) for verified claims. Runs on a worker thread.
+    """
+    jti = payload.get("jti")
+    if jti and tokenRevocation.is_revoked(jti):
+        return True, None
+    return False, userCache.get_user(payload.get("user_id"))
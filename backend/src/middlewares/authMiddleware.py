@@ -9,14 +9,17 @@ Best Practices:
 1. Store and retrieve secret keys or OAuth credentials from a secure location (e.g., AWS SSM or Secrets Manager).
 2. Provide clear error messages and status codes when tokens are missing or invalid.
 3. Avoid duplicating database or token logic here. Use a service or utility to validate/parse tokens if needed.
+4. The user is resolved through userCache, so most requests never touch the database.
+   Endpoints receive a read-only AuthenticatedUser snapshot, not an ORM object.
+5. Revoked tokens (logout) are rejected via tokenRevocation, whose in-memory Bloom
+   filter keeps the check I/O-free for tokens that were never revoked.
 """
 
 import os
 import jwt
 from functools import wraps
-from flask import request, jsonify
-from backend.src.db.dbClient import get_db_session
-from backend.src.models.User import User
+from flask import request, jsonify, g
+from backend.src.services import userCache, tokenRevocation
 
 JWT_SECRET = os.environ.get("GFVRHO_JWT_SECRET", "CHANGE_ME")
 JWT_ALGORITHM = os.environ.get("GFVRHO_JWT_ALGORITHM", "HS256")
@@ -29,7 +32,9 @@ def token_required(f):
         def protected_route(current_user, ...):
             # Route logic
 
-    The 'current_user' argument is injected automatically if the token is valid.
+    The 'current_user' argument (a userCache.AuthenticatedUser) is injected
+    automatically if the token is valid. The decoded claims are available to the
+    endpoint as flask.g.token_claims.
     """
     @wraps(f)
     def decorated(*args, **kwargs):
@@ -49,11 +54,17 @@ def token_required(f):
             payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
             user_id = payload.get("user_id")
 
-            # Fetch the user from the database. If user not found, deny access.
-            with get_db_session() as db:
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user:
-                    return jsonify({"error": "User does not exist"}), 401
+            # Reject tokens revoked by logout.
+            jti = payload.get("jti")
+            if jti and tokenRevocation.is_revoked(jti):
+                return jsonify({"error": "Token has been revoked"}), 401
+
+            # Resolve the user (cached across requests). If user not found, deny access.
+            user = userCache.get_user(user_id)
+            if not user:
+                return jsonify({"error": "User does not exist"}), 401
+
+            g.token_claims = payload
 
             # Pass the user to the endpoint as the first argument
             return f(user, *args, **kwargs)
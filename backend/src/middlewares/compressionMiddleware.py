@@ -0,0 +1,95 @@
+"""
+compressionMiddleware.py
+
+This file compresses JSON and text responses for clients that accept it. Brotli is
+used when the client accepts it and the optional brotli package is installed,
+otherwise gzip. Small bodies are sent as they are: below GFVRHO_COMPRESS_MIN_BYTES,
+compression costs more CPU than it saves on the wire.
+
+Configuration:
+- GFVRHO_COMPRESS_MIN_BYTES (1024)
+- GFVRHO_GZIP_LEVEL (6), GFVRHO_BROTLI_QUALITY (5): moderate levels suit responses
+  that are compressed once per request rather than once per deploy.
+
+Best Practices:
+1. Streaming responses (Server-Sent Events) are never buffered or compressed here.
+2. Register it once per app, from server.create_app.
+"""
+
+import os
+import gzip
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip is always available.
+    brotli = None
+
+COMPRESS_MIN_BYTES = int(os.environ.get("GFVRHO_COMPRESS_MIN_BYTES", 1024))
+GZIP_LEVEL = int(os.environ.get("GFVRHO_GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.environ.get("GFVRHO_BROTLI_QUALITY", 5))
+
+COMPRESSIBLE_MIMETYPES = ("application/json", "text/plain", "text/html", "text/csv")
+
+
+def register_compression(app):
+    """
+    Registers response compression on the provided Flask app.
+    """
+    app.after_request(compress_response)
+
+
+def compress_response(response):
+    """
+    Compresses response in place when it is worth it and the client accepts it.
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+
+    if encoding == "br":
+        data = brotli.compress(data, quality=BROTLI_QUALITY)
+    else:
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL)
+    response.set_data(data)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def choose_encoding(accept_encoding: str):
+    """
+    Returns "br", "gzip" or None for an Accept-Encoding header value.
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", accepted.get("*", 0)) > 0:
+        return "gzip"
+    return None
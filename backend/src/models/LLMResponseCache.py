@@ -0,0 +1,44 @@
+"""
+LLMResponseCache.py
+
+This module defines the LLMResponseCache model using SQLAlchemy. It includes only the
+model definition (no migration logic). Each row is a cached LLM response keyed by a
+hash of the canonical prompt inputs and model name. The LLMResponseCache model has:
+- cache_key (primary key, SHA-256 hex digest)
+- model (string)
+- content (text)
+- created_at
+- expires_at
+
+Best Practices:
+- Keep model definitions minimal and avoid mixing with migration or business logic.
+- Lookup and expiry logic lives in services/llmCache.py.
+"""
+
+from sqlalchemy import (
+    Column,
+    String,
+    Text,
+    DateTime
+)
+from sqlalchemy.sql import func
+from backend.src.models.base import Base
+
+class LLMResponseCache(Base):
+    """
+    SQLAlchemy model for the persistent LLM response cache.
+
+    Fields:
+        cache_key (str): Primary key; SHA-256 of the canonical prompt inputs and model.
+        model (str): The model that produced the response.
+        content (str): The generated report content.
+        created_at (DateTime): When the response was cached.
+        expires_at (DateTime): When the cached response stops being served.
+    """
+    __tablename__ = "llm_response_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    model = Column(String(100), nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
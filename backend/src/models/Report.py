@@ -7,13 +7,16 @@ definition (no migration logic). The Report model has:
 - user_id (foreign key to users.id)
 - tier (int)
 - created_at
-- pdf_url (string)
+- pdf_url (string, legacy)
+- pdf_key (string)
 - payment_status (string)
 - relationship to User model
 
 Best Practices:
 - Keep model definitions minimal and avoid mixing with migration or business logic.
 - The user_id field references the users table through a ForeignKey.
+- Listings are served by ix_reports_user_id_created_at_id (user_id, created_at DESC, id DESC);
+  see the 20240401 migration and reportService.get_reports_page.
 """
 
 import datetime
@@ -26,9 +29,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.ext.declarative import declarative_base
-
-Base = declarative_base()
+from backend.src.models.base import Base
 
 class Report(Base):
     """
@@ -39,7 +40,8 @@ class Report(Base):
         user_id (int): Foreign key referencing the users table's id.
         tier (int): The tier level of the report (e.g., 1, 2, or 3).
         created_at (DateTime): Timestamp when the report record was created.
-        pdf_url (str): URL/path to the generated PDF file.
+        pdf_url (str): Legacy URL of the PDF, for reports created before pdf_key existed.
+        pdf_key (str): S3 key of the generated PDF. Download URLs are pre-signed on read.
         payment_status (str): Status of payment for this report (e.g., 'PAID', 'PENDING').
 
     Relationships:
@@ -53,6 +55,7 @@ class Report(Base):
     tier = Column(Integer, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     pdf_url = Column(String, nullable=True)
+    pdf_key = Column(String, nullable=True)
     payment_status = Column(String, nullable=True)
 
     # Define the relationship to the User model.
@@ -0,0 +1,69 @@
+"""
+ReportJob.py
+
+This module defines the ReportJob model using SQLAlchemy. It includes only the model
+definition (no migration logic). A ReportJob is a durable work item in the
+report_jobs table, which serves as the report generation queue shared by every
+backend node. The ReportJob model has:
+- id (opaque string primary key returned to clients)
+- user_id (foreign key to users.id)
+- tier (int)
+- params (request inputs such as the company name)
+- request_key (identity of the request, used to coalesce duplicates)
+- status (queued, running, succeeded, failed)
+- report_id (foreign key to reports.id once the job has succeeded)
+- lease/heartbeat bookkeeping for the worker that claimed the job
+
+Best Practices:
+- Keep model definitions minimal and avoid mixing with migration or business logic.
+- Queue operations (claim, heartbeat, requeue) live in services/reportJobService.py.
+"""
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    ForeignKey
+)
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB
+from backend.src.models.base import Base
+
+class ReportJob(Base):
+    """
+    SQLAlchemy model for queued report generation jobs.
+
+    Fields:
+        id (str): Primary key (hex UUID).
+        user_id (int): Foreign key referencing the users table's id.
+        tier (int): The requested report tier.
+        params (dict): Request inputs passed to the report workflow (e.g., company_name).
+        request_key (str): Hash of the request inputs; unique among queued/running jobs.
+        status (str): One of 'queued', 'running', 'succeeded', 'failed'.
+        attempts (int): Number of times the job has been claimed.
+        report_id (int): Foreign key to the created report, set on success.
+        error (str): Error message of the last failed attempt.
+        locked_by (str): Identifier of the worker currently holding the job.
+        lease_expires_at (DateTime): When the current claim expires unless renewed.
+        heartbeat_at (DateTime): Last heartbeat received from the claiming worker.
+        created_at / started_at / finished_at (DateTime): Lifecycle timestamps.
+    """
+    __tablename__ = "report_jobs"
+
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    tier = Column(Integer, nullable=False)
+    params = Column(JSONB, nullable=False, default=dict)
+    request_key = Column(String(64), nullable=True)
+    status = Column(String(20), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    report_id = Column(Integer, ForeignKey("reports.id"), nullable=True)
+    error = Column(Text, nullable=True)
+    locked_by = Column(String(255), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,42 @@
+"""
+RevokedToken.py
+
+This module defines the RevokedToken model using SQLAlchemy. It includes only the
+model definition (no migration logic). Each row is a JWT that was revoked (e.g., by
+logout) before it expired. The RevokedToken model has:
+- jti (primary key, the token's unique ID)
+- user_id (foreign key to users.id)
+- expires_at (when the token would have expired anyway)
+- revoked_at
+
+Best Practices:
+- Keep model definitions minimal and avoid mixing with migration or business logic.
+- Lookup, filtering and purge logic lives in services/tokenRevocation.py.
+"""
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    ForeignKey
+)
+from sqlalchemy.sql import func
+from backend.src.models.base import Base
+
+class RevokedToken(Base):
+    """
+    SQLAlchemy model for revoked JWTs.
+
+    Fields:
+        jti (str): Primary key; the revoked token's "jti" claim.
+        user_id (int): The user the token was issued to.
+        expires_at (DateTime): The token's "exp" claim. Rows past it can be purged.
+        revoked_at (DateTime): When the token was revoked.
+    """
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
@@ -0,0 +1,14 @@
+"""
+base.py
+
+This module defines the declarative base shared by all SQLAlchemy models.
+Keeping every model on one Base means they share a single MetaData, so foreign
+keys and relationships between tables (e.g., reports.user_id -> users.id) resolve.
+
+Best Practices:
+- Import Base from here in every model module instead of calling declarative_base() again.
+"""
+
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
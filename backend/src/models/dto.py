@@ -0,0 +1,72 @@
+"""
+dto.py
+
+This module defines lightweight, read-only data transfer objects for list endpoints.
+They are filled from Core rows that select only the columns listed in __slots__, so a
+listing never loads full ORM instances (or their identity-map bookkeeping) and never
+reads columns the response does not need, such as users.password_hash.
+
+Usage:
+    stmt = select(*ReportSummary.columns()).where(Report.user_id == user_id)
+    reports = [ReportSummary.from_row(row) for row in db.execute(stmt)]
+
+Serialize DTOs (or ORM objects) with utils/serializer.py.
+
+Best Practices:
+- Keep DTOs flat and limited to what a response needs. Add a field to __slots__ only
+  if a caller reads it.
+- DTOs are snapshots. To change data, go through the service and the ORM model.
+"""
+
+from backend.src.models.Report import Report
+from backend.src.models.User import User
+
+
+class SlottedDTO:
+    """
+    Base class for DTOs. Subclasses set __slots__ to the selected column names (in
+    select order) and __model__ to the mapped class the columns come from.
+    """
+    __slots__ = ()
+    __model__ = None
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    @classmethod
+    def columns(cls) -> list:
+        """
+        Returns the model columns to select, in __slots__ order.
+        """
+        return [getattr(cls.__model__, name) for name in cls.__slots__]
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Builds a DTO from a row selected with columns().
+        """
+        return cls(*row)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"<{type(self).__name__}({fields})>"
+
+
+class ReportSummary(SlottedDTO):
+    """
+    A report as shown in listings.
+    """
+    __slots__ = ("id", "user_id", "tier", "created_at", "pdf_url", "pdf_key", "payment_status")
+    __model__ = Report
+
+
+class UserSummary(SlottedDTO):
+    """
+    A user as shown in listings. Never carries the password hash.
+    """
+    __slots__ = ("id", "email", "username", "created_at")
+    __model__ = User
@@ -0,0 +1,15 @@
+"""
+metricsRoutes.py
+
+This file registers the operational metrics routes by attaching the blueprint
+defined in metricsController.py. It does not contain any direct business logic
+or JSON responses, relying entirely on the controller for handling requests.
+"""
+
+from backend.src.controllers.metricsController import metrics_bp
+
+def register_metrics_routes(app):
+    """
+    Registers the metrics_bp blueprint under the '/metrics' prefix.
+    """
+    app.register_blueprint(metrics_bp, url_prefix="/metrics")
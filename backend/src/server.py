@@ -1,46 +1,75 @@
 # backend/src/server.py
+"""
+Builds the Flask application. Production runs it under gunicorn with the settings in
+config/gunicornConfig.py:
 
+    gunicorn -c backend/src/config/gunicornConfig.py "backend.src.server:create_app()"
+
+`python -m backend.src.server` starts Flask's development server instead, for local
+work only.
+"""
+
+import os
+import logging
 from flask import Flask, jsonify
 from flask_cors import CORS
-from src.config.settings import Settings
-from src.routes.authRoutes import auth_bp
-from src.routes.reportRoutes import report_bp
-from src.routes.userRoutes import user_bp
-from src.middlewares.authMiddleware import auth_middleware
-from src.middlewares.errorMiddleware import error_handler
-from src.utils.logger import setup_logger
+from backend.src.config.settings import Settings
+from backend.src.routes.authRoutes import auth_bp
+from backend.src.routes.reportRoutes import report_bp
+from backend.src.controllers.userController import user_bp
+from backend.src.routes.metricsRoutes import metrics_bp
+from backend.src.db import queryStats
+from backend.src.db.dbClient import remove_db_session
+from backend.src.middlewares.errorMiddleware import register_error_handlers
+from backend.src.middlewares.compressionMiddleware import register_compression
+
+logger = logging.getLogger(__name__)
+
+
+def create_app() -> Flask:
+    """
+    Creates and configures the Flask application.
+    """
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
+
+    app = Flask(__name__)
+
+    # Load Configuration
+    app.config['SECRET_KEY'] = Settings.SECRET_KEY
+    app.config['DEBUG'] = Settings.DEBUG
+
+    # Enable CORS for all routes
+    CORS(app)
 
-# Initialize Logger
-logger = setup_logger()
+    # Register Blueprints (Routes). Authentication is enforced per endpoint by
+    # authMiddleware.token_required.
+    app.register_blueprint(auth_bp, url_prefix='/api/auth')
+    app.register_blueprint(report_bp, url_prefix='/api/reports')
+    app.register_blueprint(user_bp, url_prefix='/api/users')
+    app.register_blueprint(metrics_bp, url_prefix='/api/metrics')
 
-# Initialize Flask Application
-app = Flask(__name__)
+    # Close the request-scoped database session (see dbClient.get_db_session)
+    app.teardown_appcontext(remove_db_session)
 
-# Load Configuration
-app.config['SECRET_KEY'] = Settings.SECRET_KEY
-app.config['SQLALCHEMY_DATABASE_URI'] = Settings.DATABASE_URI
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Per-request SQL counts, slow-query and N+1 logging (see db/queryStats.py)
+    queryStats.init_app(app)
 
-# Enable CORS for all routes
-CORS(app)
+    # JSON error responses
+    register_error_handlers(app)
 
-# Middleware for Auth (global before_request)
-app.before_request(auth_middleware)
+    # gzip/brotli for larger JSON bodies
+    register_compression(app)
 
-# Register Blueprints (Routes)
-app.register_blueprint(auth_bp, url_prefix='/api/auth')
-app.register_blueprint(report_bp, url_prefix='/api/reports')
-app.register_blueprint(user_bp, url_prefix='/api/users')
+    # Health Check Route
+    @app.route('/api/health', methods=['GET'])
+    def health_check():
+        return jsonify({"status": "healthy", "message": "Server is running"}), 200
 
-# Error Handling Middleware
-app.register_error_handler(Exception, error_handler)
+    return app
 
-# Health Check Route
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    return jsonify({"status": "healthy", "message": "Server is running"}), 200
 
-# Run Application
+# Run the development server. There is deliberately no module-level app: importing
+# this module must not build one, since gunicorn and asgi.py call create_app() themselves.
 if __name__ == '__main__':
-    logger.info("Starting Flask Application")
-    app.run(host='0.0.0.0', port=5000, debug=Settings.DEBUG)
+    logger.info("Starting Flask development server")
+    create_app().run(host='0.0.0.0', port=int(os.environ.get("PORT", 5000)), debug=Settings.DEBUG)
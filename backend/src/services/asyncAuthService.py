@@ -0,0 +1,95 @@
+"""
+asyncAuthService.py
+
+This module provides the asyncio versions of authService.py's registration and login,
+used by the ASGI app (asgi.py). Queries run on the async engine (db/asyncDbClient.py)
+and bcrypt runs on the same bounded hashing pool, awaited without blocking the event
+loop. Tokens are issued exactly as authService issues them, so tokens from either
+serving mode are accepted by both.
+
+We expose:
+- register_user(email, username, password) -> User
+- login_user(email, password) -> str
+- logout_user(claims)
+
+Best Practices:
+- Keep behaviour identical to authService.py; change both modules together.
+- Never call blocking I/O directly from these coroutines; use asyncio.to_thread for
+  sync services that have no async counterpart.
+"""
+
+import asyncio
+from sqlalchemy.dialects.postgresql import insert
+from backend.src.db import pgListener, readRouting
+from backend.src.db.asyncDbClient import get_async_session
+from backend.src.models.User import User
+from backend.src.services import authService
+from backend.src.utils import passwordHasher
+
+
+async def register_user(email: str, username: str, password: str) -> User:
+    """
+    Async version of authService.register_user.
+
+    :return: The created User object (detached from any session).
+    :raises ValueError: If the email or username is already in use.
+    :raises passwordHasher.PasswordHasherBusy: If the hashing pool is saturated.
+    """
+    hashed_pw = await passwordHasher.hash_password_async(password)
+
+    stmt = insert(User).values(
+        email=email,
+        username=username,
+        password_hash=hashed_pw
+    ).on_conflict_do_nothing().returning(User.id, User.created_at, User.updated_at)
+
+    async with get_async_session() as db:
+        row = (await db.execute(stmt)).first()
+        if row is not None and readRouting.replicas_enabled():
+            # Same as readRouting.mark_user_write(row.id, db), on the async session.
+            readRouting.mark_user_write(row.id)
+            await db.execute(
+                pgListener.NOTIFY_STATEMENT,
+                {"channel": readRouting.USER_WRITE_CHANNEL, "payload": str(row.id)}
+            )
+        await db.commit()
+
+    # No row means a unique constraint (email or username) rejected the insert.
+    if row is None:
+        raise ValueError("Email or username already in use.")
+
+    return User(
+        id=row.id,
+        email=email,
+        username=username,
+        password_hash=hashed_pw,
+        created_at=row.created_at,
+        updated_at=row.updated_at
+    )
+
+
+async def login_user(email: str, password: str) -> str:
+    """
+    Async version of authService.login_user.
+
+    :return: A JWT access token as a string.
+    :raises ValueError: If the email or password is wrong.
+    :raises passwordHasher.PasswordHasherBusy: If the hashing pool is saturated.
+    """
+    async with get_async_session() as db:
+        user = (await db.execute(authService._LOGIN_BY_EMAIL, {"email": email})).first()
+    if not user:
+        raise ValueError("Invalid email or password.")
+
+    if not await passwordHasher.check_password_async(password, user.password_hash):
+        raise ValueError("Invalid email or password.")
+
+    return authService._generate_jwt_token({"user_id": user.id, "email": user.email})
+
+
+async def logout_user(claims: dict):
+    """
+    Async version of authService.logout_user. Revocation is rare and updates the
+    in-process filter, so the sync implementation runs on a worker thread.
+    """
+    await asyncio.to_thread(authService.logout_user, claims)
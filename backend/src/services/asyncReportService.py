@@ -0,0 +1,97 @@
+"""
+asyncReportService.py
+
+This module provides the asyncio versions of the report reads used by the ASGI app
+(asgi.py): single reports, keyset-paginated listings and report job status. Queries run
+on the async engine (db/asyncDbClient.py) and build the same statements as
+reportService.py and reportJobService.py.
+
+Report creation is unchanged: jobs are queued through reportJobService (on a worker
+thread) and built by the report workers.
+
+We expose:
+- get_report_by_id(report_id) -> Report
+- get_reports_page(user_id, limit, after) -> (reports, next_cursor)
+- get_reports_version(user_id) -> (id, created_at)
+- get_job(job_id) -> ReportJob
+- get_pdf_urls(reports) -> dict
+- enqueue_report_job(...) -> ReportJob
+
+Best Practices:
+- Share statements with the sync services instead of copying them, so both serving
+  modes return the same data.
+- Async reads use the primary; they do not go through readRouting.
+"""
+
+import asyncio
+from sqlalchemy import select, bindparam
+from backend.src.db.asyncDbClient import get_async_session
+from backend.src.models.ReportJob import ReportJob
+from backend.src.models.dto import ReportSummary
+from backend.src.services import reportService, reportJobService
+
+_JOB_BY_ID = select(ReportJob).where(ReportJob.id == bindparam("job_id"))
+
+
+async def get_report_by_id(report_id: int):
+    """
+    Async version of reportService.get_report_by_id.
+
+    :return: The Report object if found, else None.
+    """
+    async with get_async_session() as db:
+        result = await db.execute(reportService._REPORT_BY_ID, {"report_id": report_id})
+        return result.scalars().first()
+
+
+async def get_reports_page(user_id: int, limit: int = reportService.REPORTS_PAGE_SIZE, after: str = None) -> tuple:
+    """
+    Async version of reportService.get_reports_page.
+
+    :return: A tuple (reports, next_cursor); next_cursor is None on the last page.
+    :raises ValueError: If the cursor is malformed.
+    """
+    stmt = reportService.reports_page_statement(user_id, limit, after)
+    async with get_async_session() as db:
+        reports = [ReportSummary.from_row(row) for row in await db.execute(stmt)]
+    return reportService.split_reports_page(reports, limit)
+
+
+async def get_reports_version(user_id: int) -> tuple:
+    """
+    Async version of reportService.get_reports_version.
+    """
+    async with get_async_session() as db:
+        row = (await db.execute(reportService._NEWEST_REPORT, {"user_id": user_id})).first()
+    return (row.id, row.created_at) if row else (None, None)
+
+
+async def get_job(job_id: str):
+    """
+    Async version of reportJobService.get_job.
+
+    :return: The ReportJob if found, else None.
+    """
+    async with get_async_session() as db:
+        result = await db.execute(_JOB_BY_ID, {"job_id": job_id})
+        return result.scalars().first()
+
+
+async def get_pdf_urls(reports: list) -> dict:
+    """
+    Async wrapper for reportService.get_pdf_urls. Signing may fetch AWS credentials
+    or touch the URL cache, so it runs on a worker thread.
+    """
+    if not reports:
+        return {}
+    return await asyncio.to_thread(reportService.get_pdf_urls, reports)
+
+
+async def enqueue_report_job(user_id: int, tier: int, user_data: dict = None, report_content: str = None):
+    """
+    Async wrapper for reportJobService.enqueue_report_job, which also wakes this
+    process's embedded report workers.
+    """
+    return await asyncio.to_thread(
+        reportJobService.enqueue_report_job, user_id, tier, user_data, report_content
+    )
@@ -13,16 +13,24 @@ Best Practices:
   (e.g., in AWS Secrets Manager or SSM Parameter Store).
 - Always hash user passwords before saving them to the database. Never store plaintext passwords.
 - Use secure libraries like bcrypt or passlib for hashing. Shown here as an example.
+- bcrypt work runs on the bounded pool in utils/passwordHasher.py, never inline in the
+  request thread, and never while a database session is held. When the pool is
+  saturated, PasswordHasherBusy propagates so the controller can answer 503.
 - Token handling (e.g., JWT issuance, refresh logic) should be carefully managed to prevent security risks.
 """
 
 import os
-import bcrypt
 import jwt
+import uuid
 import datetime
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from backend.src.db import readRouting
 from backend.src.db.dbClient import get_db_session
 from backend.src.models.User import User
+from backend.src.services import tokenRevocation
+from backend.src.utils import passwordHasher
 
 # Example environment variables for secret keys and OAuth:
 JWT_SECRET = os.environ.get("GFVRHO_JWT_SECRET", "CHANGE_ME")  
@@ -33,37 +41,54 @@ JWT_EXPIRATION_SECONDS = int(os.environ.get("GFVRHO_JWT_EXPIRATION_SECONDS", 360
 AMAZON_OAUTH_CLIENT_ID = os.environ.get("GFVRHO_AMAZON_OAUTH_CLIENT_ID", "CHANGE_ME")
 AMAZON_OAUTH_CLIENT_SECRET = os.environ.get("GFVRHO_AMAZON_OAUTH_CLIENT_SECRET", "CHANGE_ME")
 
+# Login lookup, built once at import so each login only binds the email.
+_LOGIN_BY_EMAIL = select(User.id, User.email, User.password_hash).where(User.email == bindparam("email"))
+
 def register_user(email: str, username: str, password: str):
     """
     Registers a new user by creating a record in the database with a hashed password.
     Raises an exception if the email or username is already in use.
+
+    The user is created with a single INSERT ... ON CONFLICT DO NOTHING RETURNING,
+    so uniqueness is enforced by the users_email_key and uq_users_username constraints
+    rather than a separate lookup, and concurrent signups for the same email or
+    username cannot both succeed.
     
     :param email: The email address for the new user (unique).
     :param username: The desired username (unique).
     :param password: The plaintext password to be hashed and stored.
-    :return: The created User object.
+    :return: The created User object (detached from any session).
+    :raises ValueError: If the email or username is already in use.
+    :raises passwordHasher.PasswordHasherBusy: If the hashing pool is saturated.
     """
+    # Hash the password before storing (on the hashing pool, with no session held).
+    hashed_pw = passwordHasher.hash_password(password)
+
+    stmt = insert(User).values(
+        email=email,
+        username=username,
+        password_hash=hashed_pw
+    ).on_conflict_do_nothing().returning(User.id, User.created_at, User.updated_at)
+
     db: Session
     with get_db_session() as db:
-        existing_user = db.query(User).filter(
-            (User.email == email) | (User.username == username)
-        ).first()
-        if existing_user:
-            raise ValueError("Email or username already in use.")
-
-        # Hash the password before storing.
-        hashed_pw = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        
-        new_user = User(
-            email=email,
-            username=username,
-            password_hash=hashed_pw.decode('utf-8')
-        )
-        db.add(new_user)
+        row = db.execute(stmt).first()
+        if row is not None:
+            readRouting.mark_user_write(row.id, db)
         db.commit()
-        db.refresh(new_user)
 
-        return new_user
+    # No row means a unique constraint (email or username) rejected the insert.
+    if row is None:
+        raise ValueError("Email or username already in use.")
+
+    return User(
+        id=row.id,
+        email=email,
+        username=username,
+        password_hash=hashed_pw,
+        created_at=row.created_at,
+        updated_at=row.updated_at
+    )
 
 def login_user(email: str, password: str) -> str:
     """
@@ -73,20 +98,34 @@ def login_user(email: str, password: str) -> str:
     :param email: The user's email address.
     :param password: The plaintext password to verify.
     :return: A JWT access token as a string.
+    :raises passwordHasher.PasswordHasherBusy: If the hashing pool is saturated.
     """
     with get_db_session() as db:
         db: Session
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            raise ValueError("Invalid email or password.")
+        user = db.execute(_LOGIN_BY_EMAIL, {"email": email}).first()
+    if not user:
+        raise ValueError("Invalid email or password.")
 
-        # Compare hashed password with provided plaintext password.
-        if not bcrypt.checkpw(password.encode('utf-8'), user.password_hash.encode('utf-8')):
-            raise ValueError("Invalid email or password.")
+    # Compare hashed password with provided plaintext password (on the hashing pool).
+    if not passwordHasher.check_password(password, user.password_hash):
+        raise ValueError("Invalid email or password.")
 
-        # Create JWT token on successful authentication.
-        token = _generate_jwt_token({"user_id": user.id, "email": user.email})
-        return token
+    # Create JWT token on successful authentication.
+    token = _generate_jwt_token({"user_id": user.id, "email": user.email})
+    return token
+
+def logout_user(claims: dict):
+    """
+    Revokes the token described by claims so it is rejected until it expires.
+    Tokens issued without a jti cannot be revoked and simply run out.
+
+    :param claims: The decoded claims of the token being logged out.
+    """
+    jti = claims.get("jti")
+    if not jti:
+        return
+    expires_at = datetime.datetime.fromtimestamp(claims["exp"], tz=datetime.timezone.utc)
+    tokenRevocation.revoke(jti, claims["user_id"], expires_at)
 
 def handle_amazon_oauth_callback(oauth_code: str):
     """
@@ -112,13 +151,15 @@ def handle_amazon_oauth_callback(oauth_code: str):
 def _generate_jwt_token(payload: dict) -> str:
     """
     Generates a JWT token with the given payload, signed with the server's secret key.
-    Token expiration is controlled by JWT_EXPIRATION_SECONDS.
+    Token expiration is controlled by JWT_EXPIRATION_SECONDS. Every token gets a unique
+    "jti" so it can be revoked individually (see logout_user).
 
     :param payload: A dictionary of claims (e.g., user_id, email).
     :return: A signed JWT token as a string.
     """
-    expire = datetime.datetime.utcnow() + datetime.timedelta(seconds=JWT_EXPIRATION_SECONDS)
-    payload.update({"exp": expire})
+    issued = datetime.datetime.utcnow()
+    expire = issued + datetime.timedelta(seconds=JWT_EXPIRATION_SECONDS)
+    payload.update({"jti": uuid.uuid4().hex, "iat": issued, "exp": expire})
     token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
     # For PyJWT v2.x, jwt.encode returns a string. For v1.x, it returns bytes.
     # Ensure we consistently return a string:
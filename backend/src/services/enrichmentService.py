@@ -0,0 +1,84 @@
+"""
+enrichmentService.py
+
+This module implements the market data enrichment stage of report generation. It calls
+the LinkedIn, Crunchbase and Carta helpers from externalAPIsService.py concurrently and
+merges whatever they return into a single marketData dictionary for
+llmService.generate_report_content.
+
+We expose a single public function:
+- gather_market_data(company_name, deadline_seconds=None) -> dict
+
+Best Practices:
+- The whole stage is bounded by one deadline (GFVRHO_ENRICHMENT_DEADLINE_SECONDS), so
+  enrichment latency is roughly that of the slowest provider rather than the sum.
+- A slow or failing provider never fails the report; it is listed under
+  "unavailable_sources" and the report is generated from the remaining data.
+- Provider calls that overrun the deadline keep running on the pool until their own
+  timeouts fire, so the pool is sized for several reports' worth of stragglers.
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from backend.src.utils import externalAPIsService
+
+ENRICHMENT_DEADLINE_SECONDS = float(os.environ.get("GFVRHO_ENRICHMENT_DEADLINE_SECONDS", 15))
+ENRICHMENT_MAX_WORKERS = int(os.environ.get("GFVRHO_ENRICHMENT_MAX_WORKERS", 12))
+
+# marketData key -> provider call
+PROVIDERS = {
+    "linkedin": externalAPIsService.call_linkedin_api,
+    "crunchbase": externalAPIsService.call_crunchbase_api,
+    "carta": externalAPIsService.call_carta_api,
+}
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=ENRICHMENT_MAX_WORKERS, thread_name_prefix="enrichment")
+
+
+def gather_market_data(company_name: str, deadline_seconds: float = None) -> dict:
+    """
+    Calls every enrichment provider concurrently and merges their results.
+
+    :param company_name: The name of the company to look up.
+    :param deadline_seconds: Upper bound for the whole stage; defaults to
+                             ENRICHMENT_DEADLINE_SECONDS.
+    :return: A dictionary keyed by provider name ("linkedin", "crunchbase", "carta")
+             holding each provider's data, plus "unavailable_sources" listing the
+             providers that failed or missed the deadline.
+    """
+    if deadline_seconds is None:
+        deadline_seconds = ENRICHMENT_DEADLINE_SECONDS
+
+    started = time.monotonic()
+    futures = {
+        _executor.submit(call, company_name): source
+        for source, call in PROVIDERS.items()
+    }
+    done, not_done = wait(futures, timeout=deadline_seconds)
+
+    market_data = {}
+    unavailable = []
+    for future in done:
+        source = futures[future]
+        try:
+            market_data[source] = future.result()
+        except Exception as e:
+            logger.warning("Enrichment source %s failed: %s", source, e)
+            unavailable.append(source)
+
+    for future in not_done:
+        source = futures[future]
+        logger.warning("Enrichment source %s missed the %.1fs deadline", source, deadline_seconds)
+        future.cancel()
+        unavailable.append(source)
+
+    market_data["unavailable_sources"] = sorted(unavailable)
+    logger.info(
+        "Enrichment for %s finished in %.2fs (%d/%d sources)",
+        company_name, time.monotonic() - started, len(PROVIDERS) - len(unavailable), len(PROVIDERS)
+    )
+    return market_data
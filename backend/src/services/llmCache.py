@@ -0,0 +1,178 @@
+"""
+llmCache.py
+
+This module caches generated report content so that re-running the same company and
+tier skips the LLM call, the slowest and most expensive stage of report generation.
+
+The cache has two tiers:
+1. An in-process LRU (GFVRHO_LLM_CACHE_MEMORY_SIZE entries, GFVRHO_LLM_CACHE_MEMORY_TTL_SECONDS).
+2. A persistent Postgres table, llm_response_cache (GFVRHO_LLM_CACHE_DB_TTL_SECONDS),
+   shared by every worker and node.
+
+Keys are the SHA-256 of a canonical, sorted JSON serialization of the prompt inputs
+(tier, userData, marketData) plus the model name, so logically equal inputs hit the
+same entry regardless of dict ordering.
+
+We expose:
+- make_cache_key(model, tier, userData, marketData) -> str
+- get(cache_key) -> str or None
+- set(cache_key, model, content)
+- get_cache_stats() -> dict
+- purge_expired() -> int
+
+Best Practices:
+- The cache must never fail a report. Errors in the persistent tier are logged and
+  treated as misses.
+- Change the model name (or bump CACHE_KEY_VERSION when the prompt template changes)
+  to invalidate existing entries.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import datetime
+import threading
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from backend.src.db.dbClient import get_db_session
+from backend.src.models.LLMResponseCache import LLMResponseCache
+from backend.src.utils.lruCache import LRUCache
+
+LLM_CACHE_ENABLED = os.environ.get("GFVRHO_LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MEMORY_SIZE = int(os.environ.get("GFVRHO_LLM_CACHE_MEMORY_SIZE", 512))
+LLM_CACHE_MEMORY_TTL_SECONDS = int(os.environ.get("GFVRHO_LLM_CACHE_MEMORY_TTL_SECONDS", 3600))
+LLM_CACHE_DB_TTL_SECONDS = int(os.environ.get("GFVRHO_LLM_CACHE_DB_TTL_SECONDS", 86400))
+
+# Bump when the prompt template changes so old responses are no longer served.
+CACHE_KEY_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+_memory_cache = LRUCache(maxsize=LLM_CACHE_MEMORY_SIZE, ttl_seconds=LLM_CACHE_MEMORY_TTL_SECONDS)
+_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "db_errors": 0}
+_stats_lock = threading.Lock()
+
+
+def make_cache_key(model: str, tier: int, userData: dict, marketData: dict) -> str:
+    """
+    Builds the cache key for a set of prompt inputs.
+
+    :return: A 64-character hex SHA-256 digest.
+    """
+    canonical = json.dumps(
+        {
+            "version": CACHE_KEY_VERSION,
+            "model": model,
+            "tier": tier,
+            "userData": userData or {},
+            "marketData": marketData or {},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get(cache_key: str) -> str:
+    """
+    Looks up cached content, checking the in-process tier before Postgres.
+    A Postgres hit is promoted into the in-process tier.
+
+    :return: The cached content, or None on a miss.
+    """
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    content = _memory_cache.get(cache_key)
+    if content is not None:
+        _count("memory_hits")
+        return content
+
+    try:
+        db: Session
+        with get_db_session() as db:
+            content = db.query(LLMResponseCache.content).filter(
+                LLMResponseCache.cache_key == cache_key,
+                LLMResponseCache.expires_at > func.now()
+            ).scalar()
+    except Exception as e:
+        logger.warning("LLM cache lookup failed: %s", e)
+        _count("db_errors")
+        content = None
+
+    if content is None:
+        _count("misses")
+        return None
+
+    _count("db_hits")
+    _memory_cache.set(cache_key, content)
+    return content
+
+
+def set(cache_key: str, model: str, content: str):
+    """
+    Stores content in both cache tiers. An existing Postgres entry is replaced.
+    """
+    if not LLM_CACHE_ENABLED:
+        return
+
+    _memory_cache.set(cache_key, content)
+
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=LLM_CACHE_DB_TTL_SECONDS)
+    stmt = insert(LLMResponseCache).values(
+        cache_key=cache_key,
+        model=model,
+        content=content,
+        expires_at=expires_at
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LLMResponseCache.cache_key],
+        set_={"model": stmt.excluded.model, "content": stmt.excluded.content,
+              "created_at": func.now(), "expires_at": stmt.excluded.expires_at}
+    )
+    try:
+        db: Session
+        with get_db_session() as db:
+            db.execute(stmt)
+            db.commit()
+    except Exception as e:
+        logger.warning("LLM cache write failed: %s", e)
+        _count("db_errors")
+
+
+def get_cache_stats() -> dict:
+    """
+    Returns hit/miss counters for this process, plus the in-process tier size.
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["memory_size"] = len(_memory_cache)
+    lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+    stats["hit_ratio"] = (stats["memory_hits"] + stats["db_hits"]) / lookups if lookups else 0.0
+    return stats
+
+
+def purge_expired() -> int:
+    """
+    Deletes expired rows from the persistent tier. Lookups already ignore expired
+    rows; run this periodically (e.g., from a scheduled task) to reclaim space.
+
+    :return: The number of rows deleted.
+    """
+    db: Session
+    with get_db_session() as db:
+        result = db.execute(
+            delete(LLMResponseCache)
+            .where(LLMResponseCache.expires_at <= func.now())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+
+def _count(counter: str):
+    with _stats_lock:
+        _stats[counter] += 1
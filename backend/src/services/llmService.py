@@ -5,8 +5,14 @@ This module handles LLM (Large Language Model) interactions for the gfvrho proje
 It demonstrates how to integrate with LangChain, as well as external providers such as
 ChatGPT (OpenAI) and Perplexity for generating textual content.
 
-We expose a single public function:
-- generate_report_content(tier, userData, marketData)
+We expose these public functions:
+- generate_report_content(tier, userData, marketData) -> str
+- generate_report_content_stream(tier, userData, marketData) -> iterator of str chunks
+- generate_report_content_stream_async(tier, userData, marketData) -> async iterator of
+  str chunks, for the ASGI app: no thread is held while waiting on the provider
+
+Generated content is cached by llmCache.py (in-process LRU plus Postgres), keyed on the
+canonical prompt inputs and the model name, so identical requests skip the LLM call.
 
 Best Practices:
 1. Store API keys and credentials in a secure location (AWS Secrets Manager, SSM Parameter Store).
@@ -19,6 +25,8 @@ the library versions and usage, you may need to adjust method names and paramete
 """
 
 import os
+import asyncio
+from backend.src.services import llmCache
 
 # Placeholder imports showing how one might integrate with LangChain and LLM providers.
 # In a real application, you might do something like:
@@ -31,6 +39,10 @@ import os
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "CHANGE_ME")
 PERPLEXITY_API_KEY = os.environ.get("PERPLEXITY_API_KEY", "CHANGE_ME")
 
+# Models used per tier. They are part of the cache key, so changing one invalidates its cache.
+SIMPLE_LLM_MODEL = os.environ.get("GFVRHO_SIMPLE_LLM_MODEL", "gpt-3.5-turbo")
+ADVANCED_LLM_MODEL = os.environ.get("GFVRHO_ADVANCED_LLM_MODEL", "gpt-4")
+
 def generate_report_content(tier: int, userData: dict, marketData: dict) -> str:
     """
     Generates textual content for a report based on the tier, user data, and market data.
@@ -42,16 +54,18 @@ def generate_report_content(tier: int, userData: dict, marketData: dict) -> str:
     :param marketData: A dictionary of market analysis, trends, or stats retrieved from external APIs.
     :return: A string containing the generated report content.
     """
+    # Serve a cached response for identical inputs before doing any LLM work.
+    model = _model_for_tier(tier)
+    cache_key = llmCache.make_cache_key(model, tier, userData, marketData)
+    cached_content = llmCache.get(cache_key)
+    if cached_content is not None:
+        return cached_content
+
     # The content generation logic here is highly dependent on your actual approach.
     # The code below is a placeholder to show the conceptual flow.
 
     # Step 1: Construct a prompt or context for the LLM
-    # You could use LangChain's PromptTemplate, or raw strings if you're calling the API directly.
-    # Example:
-    prompt = (
-        f"Generate a tier {tier} report for user data {userData} and market data {marketData}. "
-        f"Focus on analyzing potential investment opportunities, highlighting relevant metrics."
-    )
+    prompt = _build_prompt(tier, userData, marketData)
 
     # Step 2: Decide which LLM or chain to call based on the tier
     # For example, tier 1 might be a simpler LLM call, while tier 2 or 3 might use ChatGPT + Perplexity synergy.
@@ -63,10 +77,87 @@ def generate_report_content(tier: int, userData: dict, marketData: dict) -> str:
         # ChatGPT might provide deep analysis, Perplexity might do additional data lookup
         llm_response = _call_advanced_llm(prompt)
 
-    # Return the response as the final content for the report
+    # Cache and return the response as the final content for the report
+    llmCache.set(cache_key, model, llm_response)
     return llm_response
 
 
+def generate_report_content_stream(tier: int, userData: dict, marketData: dict):
+    """
+    Streaming variant of generate_report_content. Yields the report content in chunks
+    as the provider produces them, so callers can forward the first tokens to the client
+    without waiting for the full response.
+
+    The complete content is written to the cache once the stream finishes; a cached
+    response is yielded as a single chunk. If the consumer stops early (e.g., the client
+    disconnects), nothing is cached.
+
+    :param tier: The tier level of the report (1, 2, or 3).
+    :param userData: A dictionary containing user-specific info (e.g., company name, domain).
+    :param marketData: A dictionary of market analysis, trends, or stats retrieved from external APIs.
+    :return: An iterator of content chunks (str).
+    """
+    model = _model_for_tier(tier)
+    cache_key = llmCache.make_cache_key(model, tier, userData, marketData)
+    cached_content = llmCache.get(cache_key)
+    if cached_content is not None:
+        yield cached_content
+        return
+
+    prompt = _build_prompt(tier, userData, marketData)
+    chunks = _stream_simple_llm(prompt) if tier == 1 else _stream_advanced_llm(prompt)
+
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+
+    llmCache.set(cache_key, model, "".join(parts))
+
+
+async def generate_report_content_stream_async(tier: int, userData: dict, marketData: dict):
+    """
+    Async variant of generate_report_content_stream. The cache is consulted on a worker
+    thread (it may query Postgres); the provider stream itself is awaited on the event loop.
+
+    :return: An async iterator of content chunks (str).
+    """
+    model = _model_for_tier(tier)
+    cache_key = llmCache.make_cache_key(model, tier, userData, marketData)
+    cached_content = await asyncio.to_thread(llmCache.get, cache_key)
+    if cached_content is not None:
+        yield cached_content
+        return
+
+    prompt = _build_prompt(tier, userData, marketData)
+    chunks = _astream_simple_llm(prompt) if tier == 1 else _astream_advanced_llm(prompt)
+
+    parts = []
+    async for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+
+    await asyncio.to_thread(llmCache.set, cache_key, model, "".join(parts))
+
+
+def _model_for_tier(tier: int) -> str:
+    """
+    Returns the model used for a tier: a simpler model for tier 1, an advanced one otherwise.
+    """
+    return SIMPLE_LLM_MODEL if tier == 1 else ADVANCED_LLM_MODEL
+
+
+def _build_prompt(tier: int, userData: dict, marketData: dict) -> str:
+    """
+    Builds the prompt shared by the blocking and streaming generators.
+    You could use LangChain's PromptTemplate, or raw strings if you're calling the API directly.
+    """
+    return (
+        f"Generate a tier {tier} report for user data {userData} and market data {marketData}. "
+        f"Focus on analyzing potential investment opportunities, highlighting relevant metrics."
+    )
+
+
 def _call_simple_llm(prompt: str) -> str:
     """
     Illustrative function calling a basic LLM. This might be a direct OpenAI call
@@ -103,3 +194,43 @@ def _call_advanced_llm(prompt: str) -> str:
         f"Prompt was: {prompt}"
     )
     return combined_response
+
+
+def _stream_simple_llm(prompt: str):
+    """
+    Streaming counterpart of _call_simple_llm. With OpenAI this would pass stream=True
+    and yield each delta's content as it arrives, e.g.:
+        for event in client.chat.completions.create(model=SIMPLE_LLM_MODEL, messages=[...], stream=True):
+            yield event.choices[0].delta.content or ""
+    """
+    # Mock stream: emit the placeholder response line by line.
+    yield from _call_simple_llm(prompt).splitlines(keepends=True)
+
+
+def _stream_advanced_llm(prompt: str):
+    """
+    Streaming counterpart of _call_advanced_llm. Sections from each provider are
+    yielded as soon as they are produced.
+    """
+    # Mock stream: emit the placeholder response line by line.
+    yield from _call_advanced_llm(prompt).splitlines(keepends=True)
+
+
+async def _astream_simple_llm(prompt: str):
+    """
+    Async counterpart of _stream_simple_llm. With OpenAI this would use AsyncOpenAI, e.g.:
+        async for event in await client.chat.completions.create(model=SIMPLE_LLM_MODEL, messages=[...], stream=True):
+            yield event.choices[0].delta.content or ""
+    """
+    # Mock stream: emit the placeholder response line by line.
+    for chunk in _call_simple_llm(prompt).splitlines(keepends=True):
+        yield chunk
+
+
+async def _astream_advanced_llm(prompt: str):
+    """
+    Async counterpart of _stream_advanced_llm.
+    """
+    # Mock stream: emit the placeholder response line by line.
+    for chunk in _call_advanced_llm(prompt).splitlines(keepends=True):
+        yield chunk
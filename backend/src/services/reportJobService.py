@@ -0,0 +1,335 @@
+"""
+reportJobService.py
+
+This module runs report generation as background jobs. Instead of holding a Flask
+worker for the whole pipeline (payment check, LLM call, PDF render, S3 upload), the
+controller enqueues a job and returns immediately with a job ID. Workers execute
+reportService.create_report, and callers poll the job status.
+
+Jobs are rows in the report_jobs table, so the queue is durable and shared by every
+backend node without a separate broker. Workers claim jobs with
+SELECT ... FOR UPDATE SKIP LOCKED, renew a lease with heartbeats while they work,
+and any job whose lease expires (e.g., its worker crashed) is put back in the queue.
+
+We expose:
+- enqueue_report_job(user_id, tier, user_data=None, report_content=None) -> ReportJob
+- get_job(job_id) -> ReportJob or None
+- claim_next_job(worker_id) -> ReportJob or None
+- heartbeat_job(job_id, worker_id) -> bool
+- complete_job(job_id, worker_id, report_id) / fail_job(job_id, worker_id, error, retryable=False)
+- is_retryable(error) -> bool
+- requeue_expired_jobs() -> int
+
+Best Practices:
+- Keep the report workflow itself in reportService.py; this module only schedules it
+  and records the outcome.
+- Identical requests (same user, tier and inputs) that arrive while a matching job is
+  queued or running are coalesced onto that job, across processes, through a partial
+  unique index on request_key.
+- Every state transition after a claim is conditional on locked_by, so a worker whose
+  lease was reclaimed cannot overwrite the result of the worker that took over.
+- Requests are validated (tier, payment) before they are queued. Once queued, transient
+  failures (timeouts, dropped connections) are retried up to REPORT_JOB_MAX_ATTEMPTS
+  claims; any other failure is final.
+- The worker loop lives in workers/reportWorker.py and normally runs in dedicated
+  worker containers. Web processes run no workers unless GFVRHO_REPORT_JOB_WORKERS
+  is set (e.g. 2 for a single-process development setup without a worker).
+"""
+
+import os
+import uuid
+import datetime
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import requests
+import botocore.exceptions
+from sqlalchemy import select, update, case, func, exc
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from backend.src.db.dbClient import get_db_session
+from backend.src.models.ReportJob import ReportJob
+from backend.src.services.reportService import make_request_key, validate_report_request
+
+REPORT_JOB_WORKERS = int(os.environ.get("GFVRHO_REPORT_JOB_WORKERS", 0))
+REPORT_JOB_LEASE_SECONDS = int(os.environ.get("GFVRHO_REPORT_JOB_LEASE_SECONDS", 60))
+REPORT_JOB_MAX_ATTEMPTS = int(os.environ.get("GFVRHO_REPORT_JOB_MAX_ATTEMPTS", 3))
+
+# Reserved params key carrying pre-generated report content.
+REPORT_CONTENT_PARAM = "report_content"
+
+# Job status values
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Errors worth another attempt: the next claim may well succeed.
+RETRYABLE_ERRORS = (
+    TimeoutError,
+    concurrent.futures.TimeoutError,
+    ConnectionError,
+    BrokenProcessPool,
+    exc.OperationalError,
+    exc.DisconnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    botocore.exceptions.ConnectionError,
+    botocore.exceptions.HTTPClientError,
+)
+
+# S3 error codes that mean "try again later" rather than "this request is wrong".
+RETRYABLE_S3_ERROR_CODES = {"RequestTimeout", "SlowDown", "ServiceUnavailable", "InternalError", "Throttling"}
+
+
+def enqueue_report_job(user_id: int, tier: int, user_data: dict = None, report_content: str = None) -> ReportJob:
+    """
+    Inserts a new queued report job and wakes the local workers. If an identical
+    request already has a queued or running job, that job is returned instead, so
+    duplicate submissions share one execution and one report.
+
+    :param user_id: The ID of the user requesting the report.
+    :param tier: The requested report tier (1, 2, 3).
+    :param user_data: Request inputs for the report (e.g., company_name), stored with the job.
+    :param report_content: Already generated content (e.g., from the streaming endpoint); the
+                           job then only renders and stores the PDF.
+    :return: The queued (or already in-flight) ReportJob.
+    :raises ValueError: If the tier is unknown or the payment is not verified.
+    :raises RuntimeError: If neither an insert nor an in-flight duplicate is found after three tries.
+    """
+    validate_report_request(user_id, tier)
+
+    params = dict(user_data or {})
+    if report_content is not None:
+        params[REPORT_CONTENT_PARAM] = report_content
+    request_key = make_request_key(user_id, tier, user_data, report_content)
+
+    inflight = ReportJob.status.in_([JOB_QUEUED, JOB_RUNNING])
+    stmt = (
+        insert(ReportJob)
+        .values(
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            tier=tier,
+            params=params,
+            request_key=request_key,
+            status=JOB_QUEUED,
+            attempts=0
+        )
+        .on_conflict_do_nothing(index_elements=[ReportJob.request_key], index_where=inflight)
+        .returning(ReportJob.id)
+    )
+
+    db: Session
+    with get_db_session() as db:
+        # Either our insert wins, or an in-flight duplicate exists. If that duplicate
+        # finishes between the two statements, the next attempt inserts normally.
+        for _ in range(3):
+            job_id = db.execute(stmt).scalar()
+            db.commit()
+            if job_id is None:
+                job_id = db.query(ReportJob.id).filter(
+                    ReportJob.request_key == request_key, inflight
+                ).scalar()
+            if job_id is not None:
+                break
+        else:
+            raise RuntimeError("Could not enqueue report job: the matching in-flight job kept changing.")
+        job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+
+    # Imported lazily: the worker module depends on this one.
+    from backend.src.workers import reportWorker
+    reportWorker.ensure_embedded_workers(REPORT_JOB_WORKERS)
+    reportWorker.notify_new_job()
+    return job
+
+
+def get_job(job_id: str) -> ReportJob:
+    """
+    Retrieves a job by its ID.
+
+    :param job_id: The job identifier returned by enqueue_report_job.
+    :return: The ReportJob if found, else None.
+    """
+    db: Session
+    with get_db_session() as db:
+        return db.query(ReportJob).filter(ReportJob.id == job_id).first()
+
+
+def claim_next_job(worker_id: str) -> ReportJob:
+    """
+    Atomically claims the oldest queued job for a worker.
+    Rows locked by concurrent claimers are skipped rather than waited on, so any
+    number of workers can claim in parallel without blocking each other.
+
+    :param worker_id: Identifier of the claiming worker (stored in locked_by).
+    :return: The claimed ReportJob, or None if the queue is empty.
+    """
+    next_job_id = (
+        select(ReportJob.id)
+        .where(ReportJob.status == JOB_QUEUED)
+        .order_by(ReportJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(ReportJob)
+        .where(ReportJob.id == next_job_id)
+        .values(
+            status=JOB_RUNNING,
+            locked_by=worker_id,
+            attempts=ReportJob.attempts + 1,
+            heartbeat_at=func.now(),
+            lease_expires_at=func.now() + _lease_interval(),
+            started_at=func.coalesce(ReportJob.started_at, func.now())
+        )
+        .returning(ReportJob.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    db: Session
+    with get_db_session() as db:
+        claimed_id = db.execute(stmt).scalar()
+        db.commit()
+        if claimed_id is None:
+            return None
+        return db.query(ReportJob).filter(ReportJob.id == claimed_id).first()
+
+
+def heartbeat_job(job_id: str, worker_id: str) -> bool:
+    """
+    Extends the lease on a running job.
+
+    :return: False if the worker no longer holds the job (its lease expired and
+             the job was requeued or claimed by another worker).
+    """
+    stmt = (
+        update(ReportJob)
+        .where(
+            ReportJob.id == job_id,
+            ReportJob.locked_by == worker_id,
+            ReportJob.status == JOB_RUNNING
+        )
+        .values(
+            heartbeat_at=func.now(),
+            lease_expires_at=func.now() + _lease_interval()
+        )
+    )
+    return _execute_update(stmt) == 1
+
+
+def complete_job(job_id: str, worker_id: str, report_id: int) -> bool:
+    """
+    Marks a job as succeeded and records the created report.
+
+    :return: False if the worker no longer holds the job.
+    """
+    stmt = (
+        update(ReportJob)
+        .where(ReportJob.id == job_id, ReportJob.locked_by == worker_id)
+        .values(
+            status=JOB_SUCCEEDED,
+            report_id=report_id,
+            error=None,
+            locked_by=None,
+            lease_expires_at=None,
+            finished_at=func.now()
+        )
+    )
+    return _execute_update(stmt) == 1
+
+
+def fail_job(job_id: str, worker_id: str, error: str, retryable: bool = False) -> bool:
+    """
+    Records a failed attempt. A retryable failure puts the job back in the queue while
+    it has claims left (as requeue_expired_jobs does for expired leases); any other
+    failure, e.g. payment not verified, marks the job failed for good.
+
+    :param error: The error message stored on the job.
+    :param retryable: Whether the failure was transient (see is_retryable).
+    :return: False if the worker no longer holds the job.
+    """
+    if retryable:
+        exhausted = ReportJob.attempts >= REPORT_JOB_MAX_ATTEMPTS
+        status = case((exhausted, JOB_FAILED), else_=JOB_QUEUED)
+        finished_at = case((exhausted, func.now()), else_=None)
+    else:
+        status = JOB_FAILED
+        finished_at = func.now()
+    stmt = (
+        update(ReportJob)
+        .where(ReportJob.id == job_id, ReportJob.locked_by == worker_id)
+        .values(
+            status=status,
+            error=error,
+            locked_by=None,
+            lease_expires_at=None,
+            finished_at=finished_at
+        )
+    )
+    return _execute_update(stmt) == 1
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Returns True if error, or an error it was raised from, is transient: a timeout, a
+    dropped database or network connection, a crashed render pool, or an S3 throttling
+    or availability error. The chain is followed because helpers such as
+    pdfGenerator.generate_pdf re-raise failures wrapped in a plain Exception.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, RETRYABLE_ERRORS):
+            return True
+        if isinstance(error, exc.DBAPIError) and error.connection_invalidated:
+            return True
+        if isinstance(error, botocore.exceptions.ClientError):
+            if error.response.get("Error", {}).get("Code") in RETRYABLE_S3_ERROR_CODES:
+                return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def requeue_expired_jobs() -> int:
+    """
+    Returns running jobs whose lease has expired to the queue. Jobs that have
+    already used REPORT_JOB_MAX_ATTEMPTS claims are marked failed instead.
+
+    :return: The number of jobs requeued or failed.
+    """
+    exhausted = ReportJob.attempts >= REPORT_JOB_MAX_ATTEMPTS
+    stmt = (
+        update(ReportJob)
+        .where(
+            ReportJob.status == JOB_RUNNING,
+            ReportJob.lease_expires_at < func.now()
+        )
+        .values(
+            status=case((exhausted, JOB_FAILED), else_=JOB_QUEUED),
+            error=case((exhausted, "Report job lease expired too many times."), else_=ReportJob.error),
+            finished_at=case((exhausted, func.now()), else_=None),
+            locked_by=None,
+            lease_expires_at=None
+        )
+    )
+    return _execute_update(stmt)
+
+
+def _execute_update(stmt) -> int:
+    """
+    Runs a single UPDATE in its own transaction and returns the affected row count.
+    No ORM objects are held by these sessions, so session synchronization is skipped.
+    """
+    db: Session
+    with get_db_session() as db:
+        result = db.execute(stmt.execution_options(synchronize_session=False))
+        db.commit()
+        return result.rowcount
+
+
+def _lease_interval() -> datetime.timedelta:
+    """
+    Lease length added to now() whenever a job is claimed or heartbeats.
+    """
+    return datetime.timedelta(seconds=REPORT_JOB_LEASE_SECONDS)
@@ -3,6 +3,7 @@ reportService.py
 
 This module provides business logic for creating and retrieving reports.
 It interacts with:
+- enrichmentService.py to gather market data from external providers
 - llmService.py to generate report content
 - pdfGenerator.py to produce a PDF
 - paymentService.py to verify if the user has paid for the requested tier
@@ -11,51 +12,136 @@ Best Practices:
 - Keep this module focused on the workflow of creating/retrieving reports without duplicating logic
   from other services (LLM, payment, or database).
 - Integrate with dbClient.py for database operations and models for schema definitions.
+- Read-only functions use readRouting.get_read_session (replicas when configured);
+  functions that write mark the user with readRouting.mark_user_write.
 """
 
+import os
+import json
+import hashlib
+import datetime
+from sqlalchemy import select, tuple_, bindparam
 from sqlalchemy.orm import Session
+from backend.src.db import readRouting
 from backend.src.db.dbClient import get_db_session
 from backend.src.models.Report import Report
-from backend.src.services import llmService, paymentService
-from backend.src.utils import pdfGenerator
+from backend.src.models.dto import ReportSummary
+from backend.src.services import llmService, paymentService, enrichmentService
+from backend.src.utils import pdfGenerator, pagination
+from backend.src.utils.singleFlight import SingleFlight
 
-def create_report(user_id: int, tier: int) -> Report:
+# Report tiers that can be requested.
+REPORT_TIERS = (1, 2, 3)
+
+# Default page size for get_reports_page.
+REPORTS_PAGE_SIZE = int(os.environ.get("GFVRHO_REPORTS_PAGE_SIZE", 50))
+
+# Coalesces concurrent identical create_report calls within this process.
+_report_flights = SingleFlight()
+
+# Report lookup, built once at import so each call only binds the ID.
+_REPORT_BY_ID = select(Report).where(Report.id == bindparam("report_id"))
+
+# Newest report of a user (see get_reports_version).
+_NEWEST_REPORT = select(Report.id, Report.created_at).where(
+    Report.user_id == bindparam("user_id")
+).order_by(Report.created_at.desc(), Report.id.desc()).limit(1)
+
+def make_request_key(user_id: int, tier: int, user_data: dict = None, report_content: str = None) -> str:
+    """
+    Returns a stable identity for a report request: the SHA-256 of a canonical
+    serialization of everything that determines the resulting report.
+    Identical requests (double-clicks, client retries) share the same key.
+    """
+    canonical = json.dumps(
+        {
+            "user_id": user_id,
+            "tier": tier,
+            "user_data": user_data or {},
+            "report_content": report_content,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def validate_report_request(user_id: int, tier: int):
     """
-    Creates a new report for a user. The workflow:
+    Checks that a report request can be accepted: the tier exists and the user has
+    paid for it. Run before a request is queued, so a bad request is rejected up front
+    rather than accepted and failed later on a worker.
+
+    :param user_id: The ID of the user requesting the report.
+    :param tier: The requested report tier.
+    :raises ValueError: If the tier is unknown or the payment is not verified.
+    """
+    if isinstance(tier, bool) or tier not in REPORT_TIERS:
+        raise ValueError(f"Invalid report tier; expected one of {', '.join(map(str, REPORT_TIERS))}.")
+    if not paymentService.verify_payment(user_id, tier):
+        raise ValueError("Payment not verified for the requested tier.")
+
+def create_report(user_id: int, tier: int, user_data: dict = None, report_content: str = None) -> Report:
+    """
+    Creates a new report for a user. Concurrent calls with identical inputs are
+    coalesced: only one runs the workflow and the others share its Report (or error).
+    The workflow:
     1. Verify payment for the requested tier (paymentService).
-    2. Generate report content with llmService.
-    3. Generate a PDF using pdfGenerator.
-    4. Save the new report record (with PDF URL) to the database.
+    2. Gather market data for the company concurrently from external providers (enrichmentService).
+    3. Generate report content with llmService.
+    4. Generate a PDF using pdfGenerator.
+    5. Save the new report record (with the PDF's S3 key) to the database.
     
     :param user_id: The ID of the user requesting the report.
     :param tier: An integer specifying the report tier (1, 2, 3).
+    :param user_data: Optional request inputs (e.g., company_name) passed to the LLM.
+                      Market data enrichment runs only when company_name is present.
+    :param report_content: Content that was already generated (e.g., streamed to the client).
+                           When given, steps 2 and 3 are skipped.
     :return: The newly created Report object.
     :raises ValueError: If the payment is not verified.
     """
+    request_key = make_request_key(user_id, tier, user_data, report_content)
+    return _report_flights.do(request_key, _create_report, user_id, tier, user_data, report_content)
+
+def _create_report(user_id: int, tier: int, user_data: dict, report_content: str) -> Report:
+    """
+    Runs the report workflow described in create_report.
+    """
     # 1. Check payment status.
     if not paymentService.verify_payment(user_id, tier):
         raise ValueError("Payment not verified for the requested tier.")
 
-    # 2. Generate report content using the LLM service.
-    # In a real scenario, you might pass additional user or market data to the LLM.
-    report_content = llmService.generate_report_content(tier, userData={}, marketData={})
+    user_data = user_data or {}
+
+    if report_content is None:
+        # 2. Enrich with market data. Providers are called in parallel under one deadline.
+        market_data = {}
+        if user_data.get("company_name"):
+            market_data = enrichmentService.gather_market_data(user_data["company_name"])
+
+        # 3. Generate report content using the LLM service.
+        report_content = llmService.generate_report_content(tier, userData=user_data, marketData=market_data)
 
-    # 3. Generate a PDF (the function returns the URL or path to the uploaded PDF).
-    pdf_url = pdfGenerator.generate_pdf(
+    # 4. Generate a PDF (the function returns the S3 key of the uploaded PDF).
+    pdf_key = pdfGenerator.generate_pdf(
         content=report_content,
         watermark_text=f"gfvrho Tier {tier} Report"
     )
 
     db: Session
     with get_db_session() as db:
-        # 4. Save the new report record to the database.
+        # 5. Save the new report record to the database. Only the key is stored;
+        #    download URLs are minted when the report is read (get_pdf_urls).
         new_report = Report(
             user_id=user_id,
             tier=tier,
-            pdf_url=pdf_url,
+            pdf_key=pdf_key,
             payment_status="PAID"  # We assume verification means it's paid
         )
         db.add(new_report)
+        # The user's next reads (e.g., polling the job) must see this report.
+        readRouting.mark_user_write(user_id, db)
         db.commit()
         db.refresh(new_report)
 
@@ -65,22 +151,106 @@ def get_report_by_id(report_id: int) -> Report:
     """
     Retrieves a specific report by its ID.
     
+    Reads from a replica when one is configured, falling back to the primary if the
+    report has not replicated yet.
+    
     :param report_id: The ID of the report to retrieve.
     :return: The Report object if found, else None.
     """
-    db: Session
-    with get_db_session() as db:
-        report = db.query(Report).filter(Report.id == report_id).first()
-        return report
+    return readRouting.read_one(
+        lambda db: db.execute(_REPORT_BY_ID, {"report_id": report_id}).scalars().first()
+    )
 
 def get_reports_for_user(user_id: int) -> list:
     """
-    Retrieves all reports created by a specific user.
+    Retrieves all reports created by a specific user, newest first.
+    Prefer get_reports_page for anything user-facing.
     
     :param user_id: The ID of the user.
-    :return: A list of Report objects for the given user.
+    :return: A list of ReportSummary objects for the given user.
     """
+    stmt = select(*ReportSummary.columns()).where(
+        Report.user_id == user_id
+    ).order_by(Report.created_at.desc(), Report.id.desc())
+
     db: Session
-    with get_db_session() as db:
-        reports = db.query(Report).filter(Report.user_id == user_id).all()
-        return reports
+    with readRouting.get_read_session(user_id) as db:
+        return [ReportSummary.from_row(row) for row in db.execute(stmt)]
+
+def get_reports_page(user_id: int, limit: int = REPORTS_PAGE_SIZE, after: str = None) -> tuple:
+    """
+    Retrieves one page of a user's reports, newest first, using keyset pagination
+    on (created_at, id). Each page is an index seek on
+    ix_reports_user_id_created_at_id, so latency does not grow with the number of
+    reports before it.
+
+    :param user_id: The ID of the user.
+    :param limit: Maximum number of reports to return.
+    :param after: Cursor returned with the previous page, or None for the first page.
+    Rows are selected as plain columns into ReportSummary objects, not ORM instances.
+
+    :return: A tuple (reports, next_cursor); next_cursor is None on the last page.
+    :raises ValueError: If the cursor is malformed.
+    """
+    stmt = reports_page_statement(user_id, limit, after)
+
+    db: Session
+    with readRouting.get_read_session(user_id) as db:
+        reports = [ReportSummary.from_row(row) for row in db.execute(stmt)]
+    return split_reports_page(reports, limit)
+
+def get_reports_version(user_id: int) -> tuple:
+    """
+    Returns (id, created_at) of the user's newest report, or (None, None) if there are
+    none. Reports are only ever added, so this changes whenever the listing does, and
+    it costs a single seek on ix_reports_user_id_created_at_id: cheap enough to run
+    before the page query to answer conditional GETs.
+
+    :param user_id: The ID of the user.
+    """
+    db: Session
+    with readRouting.get_read_session(user_id) as db:
+        row = db.execute(_NEWEST_REPORT, {"user_id": user_id}).first()
+    return (row.id, row.created_at) if row else (None, None)
+
+def reports_page_statement(user_id: int, limit: int, after: str = None):
+    """
+    Builds the keyset query behind get_reports_page (shared with asyncReportService).
+    It selects one row more than limit, which tells whether there is a next page.
+
+    :raises ValueError: If the cursor is malformed.
+    """
+    stmt = select(*ReportSummary.columns()).where(Report.user_id == user_id)
+    if after:
+        created_at, report_id = pagination.decode_cursor(after, (datetime.datetime, int))
+        stmt = stmt.where(tuple_(Report.created_at, Report.id) < tuple_(created_at, report_id))
+    return stmt.order_by(Report.created_at.desc(), Report.id.desc()).limit(limit + 1)
+
+def split_reports_page(reports: list, limit: int) -> tuple:
+    """
+    Trims the rows fetched by reports_page_statement to one page.
+
+    :return: A tuple (reports, next_cursor); next_cursor is None on the last page.
+    """
+    next_cursor = None
+    if len(reports) > limit:
+        reports = reports[:limit]
+        last = reports[-1]
+        next_cursor = pagination.encode_cursor((last.created_at, last.id))
+    return reports, next_cursor
+
+def get_pdf_urls(reports: list) -> dict:
+    """
+    Returns a download URL for each report's PDF, keyed by report ID.
+    URLs are pre-signed in one batch from the stored S3 keys (and cached by
+    pdfGenerator); legacy reports without a key fall back to their stored URL.
+
+    :param reports: Report or ReportSummary objects to resolve.
+    :return: A dictionary mapping report ID to its PDF URL (or None).
+    """
+    keys = [r.pdf_key for r in reports if r.pdf_key]
+    signed = pdfGenerator.get_presigned_urls(keys) if keys else {}
+    return {
+        r.id: signed[r.pdf_key] if r.pdf_key else r.pdf_url
+        for r in reports
+    }
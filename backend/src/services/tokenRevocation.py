@@ -0,0 +1,228 @@
+"""
+tokenRevocation.py
+
+This module tracks JWTs that were revoked before they expired (e.g., by logout) while
+keeping token_required stateless on the fast path.
+
+The authoritative store is the revoked_tokens table. Each process keeps a Bloom filter
+of the jti of every unexpired revoked token:
+- A jti that is not in the filter is definitely not revoked: no I/O at all.
+- A filter hit (a revoked token, or a rare false positive) is confirmed against the
+  table, and the answer is cached.
+
+The filter is refreshed incrementally (new rows by revoked_at) at most every
+GFVRHO_REVOCATION_REFRESH_SECONDS and rebuilt from scratch every
+GFVRHO_REVOCATION_REBUILD_SECONDS to drop expired tokens. A revocation is therefore
+effective immediately in the worker that handled the logout, and within one refresh
+interval in every other worker.
+
+We expose:
+- revoke(jti, user_id, expires_at)
+- is_revoked(jti) -> bool
+- get_revocation_stats() -> dict
+- purge_expired() -> int
+
+Best Practices:
+- Tokens must carry a jti to be revocable; keep JWT lifetimes short regardless.
+- Run purge_expired() periodically (e.g., from a scheduled task) to keep the table,
+  and therefore the filter, small.
+"""
+
+import os
+import time
+import logging
+import datetime
+import threading
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from backend.src.db.dbClient import get_db_session
+from backend.src.models.RevokedToken import RevokedToken
+from backend.src.utils.bloomFilter import BloomFilter
+from backend.src.utils.lruCache import LRUCache
+
+REVOCATION_REFRESH_SECONDS = float(os.environ.get("GFVRHO_REVOCATION_REFRESH_SECONDS", 2))
+REVOCATION_REBUILD_SECONDS = float(os.environ.get("GFVRHO_REVOCATION_REBUILD_SECONDS", 600))
+REVOCATION_BLOOM_MIN_CAPACITY = int(os.environ.get("GFVRHO_REVOCATION_BLOOM_MIN_CAPACITY", 10000))
+REVOCATION_BLOOM_ERROR_RATE = float(os.environ.get("GFVRHO_REVOCATION_BLOOM_ERROR_RATE", 0.001))
+
+# revoked_at is set when the revoking transaction starts, so a row can become visible
+# after newer ones. Incremental refreshes re-read this much history to catch it.
+REFRESH_OVERLAP_SECONDS = 30
+
+logger = logging.getLogger(__name__)
+
+_bloom = None
+_watermark = None
+_refreshed_at = 0.0
+_rebuilt_at = 0.0
+_refresh_lock = threading.Lock()
+
+# Answers from the authoritative store for filter hits.
+_confirmed = LRUCache(maxsize=REVOCATION_BLOOM_MIN_CAPACITY)
+_stats = {"checks": 0, "bloom_hits": 0, "false_positives": 0}
+_stats_lock = threading.Lock()
+
+
+def revoke(jti: str, user_id: int, expires_at: datetime.datetime):
+    """
+    Revokes a token. Revoking the same token again is a no-op.
+
+    :param jti: The token's "jti" claim.
+    :param user_id: The user the token was issued to.
+    :param expires_at: The token's expiry; the record can be purged after it.
+    """
+    stmt = insert(RevokedToken).values(
+        jti=jti,
+        user_id=user_id,
+        expires_at=expires_at
+    ).on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+
+    db: Session
+    with get_db_session() as db:
+        db.execute(stmt)
+        db.commit()
+
+    _confirmed.set(jti, True)
+    if _bloom is not None:
+        _bloom.add(jti)
+
+
+def is_revoked(jti: str) -> bool:
+    """
+    Checks whether a token has been revoked. Costs a filter probe for almost every
+    token; only filter hits reach the database.
+
+    :param jti: The token's "jti" claim.
+    :return: True if the token was revoked.
+    :raises Exception: If the filter has never been loaded and the store is unreachable.
+    """
+    _maybe_refresh()
+    _count("checks")
+
+    if jti not in _bloom:
+        return False
+    _count("bloom_hits")
+
+    revoked = _confirmed.get(jti)
+    if revoked is None:
+        db: Session
+        with get_db_session() as db:
+            revoked = db.query(RevokedToken.jti).filter(RevokedToken.jti == jti).first() is not None
+        # A negative answer may change once the token is revoked elsewhere, so it is
+        # kept no longer than the filter itself would take to notice.
+        _confirmed.set(jti, revoked, ttl_seconds=None if revoked else REVOCATION_REFRESH_SECONDS)
+
+    if not revoked:
+        _count("false_positives")
+    return revoked
+
+
+def get_revocation_stats() -> dict:
+    """
+    Returns filter size and check counters for this process.
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["bloom_size"] = len(_bloom) if _bloom is not None else 0
+    stats["bloom_capacity"] = _bloom.capacity if _bloom is not None else 0
+    return stats
+
+
+def purge_expired() -> int:
+    """
+    Deletes revocation records for tokens that have expired anyway.
+
+    :return: The number of rows deleted.
+    """
+    db: Session
+    with get_db_session() as db:
+        result = db.execute(
+            delete(RevokedToken)
+            .where(RevokedToken.expires_at <= func.now())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+
+def _maybe_refresh():
+    """
+    Loads the filter on first use (blocking), then refreshes it at most every
+    REVOCATION_REFRESH_SECONDS. Only one thread refreshes; the others keep using
+    the current filter.
+    """
+    now = time.monotonic()
+    if _bloom is not None and now - _refreshed_at < REVOCATION_REFRESH_SECONDS:
+        return
+
+    first_load = _bloom is None
+    if not _refresh_lock.acquire(blocking=first_load):
+        return
+    try:
+        if _bloom is None or now - _rebuilt_at >= REVOCATION_REBUILD_SECONDS:
+            _rebuild()
+        elif now - _refreshed_at >= REVOCATION_REFRESH_SECONDS:
+            _refresh()
+    except Exception as e:
+        if first_load:
+            raise
+        # Keep serving from the current filter; the next interval retries.
+        logger.warning("Token revocation filter refresh failed: %s", e)
+    finally:
+        _refresh_lock.release()
+
+
+def _rebuild():
+    """
+    Builds a new filter from every unexpired revoked token and swaps it in.
+    """
+    global _bloom, _watermark, _refreshed_at, _rebuilt_at
+    db: Session
+    with get_db_session() as db:
+        rows = db.query(RevokedToken.jti, RevokedToken.revoked_at).filter(
+            RevokedToken.expires_at > func.now()
+        ).all()
+
+    bloom = BloomFilter(
+        capacity=max(REVOCATION_BLOOM_MIN_CAPACITY, len(rows) * 2),
+        error_rate=REVOCATION_BLOOM_ERROR_RATE
+    )
+    for jti, _ in rows:
+        bloom.add(jti)
+
+    _watermark = max((revoked_at for _, revoked_at in rows), default=None)
+    _bloom = bloom
+    _refreshed_at = _rebuilt_at = time.monotonic()
+
+
+def _refresh():
+    """
+    Adds tokens revoked since the last refresh to the current filter. Rebuilds
+    instead once the filter has outgrown its capacity.
+    """
+    global _watermark, _refreshed_at
+    db: Session
+    with get_db_session() as db:
+        query = db.query(RevokedToken.jti, RevokedToken.revoked_at).filter(
+            RevokedToken.expires_at > func.now()
+        )
+        if _watermark is not None:
+            since = _watermark - datetime.timedelta(seconds=REFRESH_OVERLAP_SECONDS)
+            query = query.filter(RevokedToken.revoked_at > since)
+        rows = query.all()
+
+    for jti, revoked_at in rows:
+        if jti not in _bloom:
+            _bloom.add(jti)
+        if _watermark is None or revoked_at > _watermark:
+            _watermark = revoked_at
+    _refreshed_at = time.monotonic()
+
+    if len(_bloom) > _bloom.capacity:
+        _rebuild()
+
+
+def _count(counter: str):
+    with _stats_lock:
+        _stats[counter] += 1
@@ -0,0 +1,178 @@
+"""
+userCache.py
+
+This module caches the identity of authenticated users so token_required can resolve
+the user named in a JWT without a database round trip on every protected request.
+
+Entries are immutable AuthenticatedUser snapshots (never live ORM objects, which are
+bound to a session and unsafe to share between threads), held in an in-process LRU
+(GFVRHO_USER_CACHE_SIZE entries, GFVRHO_USER_CACHE_TTL_SECONDS).
+
+Invalidation must reach every gunicorn worker, so it goes through Postgres:
+- invalidate(user_id, session) issues NOTIFY on the caller's transaction, which is
+  delivered to all listeners only when that transaction commits.
+- Each process's Postgres listener (db/pgListener.py) drops the named entry from
+  its local cache.
+- If the listener loses its connection, notifications may have been missed, so the
+  whole local cache is cleared before listening again. The TTL bounds staleness in
+  any case.
+
+We expose:
+- get_user(user_id) -> AuthenticatedUser or None
+- invalidate(user_id, session=None)
+- invalidate_local(user_id)
+- get_cache_stats() -> dict
+
+Best Practices:
+- Call invalidate() from every code path that changes or deletes a user, before the
+  transaction commits, and invalidate_local() right after the commit so a lookup that
+  raced the transaction cannot leave the old row cached in this worker.
+- Keep AuthenticatedUser limited to identity fields. Never cache password hashes.
+"""
+
+import os
+import threading
+from sqlalchemy import select, bindparam
+from backend.src.db import pgListener
+from backend.src.db.dbClient import get_db_session
+from backend.src.models.User import User
+from backend.src.utils.lruCache import LRUCache
+
+USER_CACHE_ENABLED = os.environ.get("GFVRHO_USER_CACHE_ENABLED", "true").lower() == "true"
+USER_CACHE_SIZE = int(os.environ.get("GFVRHO_USER_CACHE_SIZE", 10000))
+USER_CACHE_TTL_SECONDS = int(os.environ.get("GFVRHO_USER_CACHE_TTL_SECONDS", 300))
+
+# Postgres channel carrying the IDs of changed users.
+INVALIDATION_CHANNEL = "gfvrho_user_invalidate"
+
+_cache = LRUCache(maxsize=USER_CACHE_SIZE, ttl_seconds=USER_CACHE_TTL_SECONDS)
+
+# Built once at import: each miss only binds user_id, and the engine's compiled
+# cache reuses the SQL instead of rebuilding an ORM Query per lookup.
+_USER_BY_ID = select(
+    User.id, User.email, User.username, User.created_at, User.updated_at
+).where(User.id == bindparam("user_id"))
+
+# Incremented on every invalidation. A lookup that started before an invalidation
+# must not store what it read, because the row may have changed since.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+class AuthenticatedUser:
+    """
+    Read-only snapshot of a user's identity, passed to endpoints as current_user.
+    """
+    __slots__ = ("id", "email", "username", "created_at", "updated_at")
+
+    def __init__(self, id, email, username, created_at, updated_at):
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "email", email)
+        object.__setattr__(self, "username", username)
+        object.__setattr__(self, "created_at", created_at)
+        object.__setattr__(self, "updated_at", updated_at)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AuthenticatedUser is read-only")
+
+    def __repr__(self):
+        return f"<AuthenticatedUser(id={self.id}, username={self.username})>"
+
+
+def get_user(user_id: int):
+    """
+    Returns the identity of a user, from the cache when possible.
+
+    :param user_id: The user ID from a verified token.
+    :return: An AuthenticatedUser, or None if the user does not exist.
+    """
+    if user_id is None:
+        return None
+    if not USER_CACHE_ENABLED:
+        return _load_user(user_id)
+
+    pgListener.ensure_started()
+
+    user = _cache.get(user_id)
+    if user is not None:
+        return user
+
+    generation = _generation
+    user = _load_user(user_id)
+    if user is not None:
+        with _generation_lock:
+            if generation == _generation:
+                _cache.set(user_id, user)
+    return user
+
+
+def invalidate(user_id: int, session=None):
+    """
+    Drops a user from the cache in every worker.
+
+    Pass the session that is changing the user so the notification is sent only if
+    (and when) its transaction commits. Without a session the notification is sent
+    immediately on a separate connection.
+
+    :param user_id: The ID of the user that changed or was deleted.
+    :param session: The SQLAlchemy session whose transaction modifies the user.
+    """
+    _forget(user_id)
+
+    if session is not None:
+        pgListener.notify(session, INVALIDATION_CHANNEL, str(user_id))
+        return
+
+    with get_db_session() as db:
+        pgListener.notify(db, INVALIDATION_CHANNEL, str(user_id))
+        db.commit()
+
+
+def invalidate_local(user_id: int):
+    """
+    Drops a user from this process's cache only. Other workers are reached by the
+    notification sent from invalidate().
+
+    :param user_id: The ID of the user that changed or was deleted.
+    """
+    _forget(user_id)
+
+
+def get_cache_stats() -> dict:
+    """
+    Returns hit/miss counters and the size of this process's cache.
+    """
+    stats = _cache.stats()
+    stats["listening"] = pgListener.is_listening()
+    return stats
+
+
+def _load_user(user_id: int):
+    with get_db_session() as db:
+        row = db.execute(_USER_BY_ID, {"user_id": user_id}).first()
+    if row is None:
+        return None
+    return AuthenticatedUser(*row)
+
+
+def _forget(user_id):
+    """
+    Removes one entry (or all entries, when user_id is None) from this process's cache.
+    """
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        if user_id is None:
+            _cache.clear()
+        else:
+            _cache.delete(user_id)
+
+
+def _on_invalidate(payload: str):
+    try:
+        _forget(int(payload))
+    except ValueError:
+        _forget(None)
+
+
+pgListener.subscribe(INVALIDATION_CHANNEL, _on_invalidate, on_reset=lambda: _forget(None))
@@ -1,15 +1,26 @@
 # backend/src/services/userService.py
 
+import datetime
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from src.models.User import User
-from src.db.dbClient import get_db_session
-from werkzeug.security import generate_password_hash
+from backend.src.models.User import User
+from backend.src.models.dto import UserSummary
+from backend.src.db import readRouting, rowEstimates
+from backend.src.db.dbClient import get_db_session
+from backend.src.services import userCache
+from backend.src.utils import passwordHasher
 from typing import Optional
 
+# Fields a user may change on their own profile.
+PROFILE_FIELDS = ("username", "email", "password")
+
 
 class UserService:
     """
     Service class to handle user-related operations such as profile retrieval and updates.
+    Read-only methods use readRouting.get_read_session, so they are served by a read
+    replica when one is configured.
     """
 
     @staticmethod
@@ -20,8 +31,10 @@ class UserService:
         :param user_id: The ID of the user to retrieve.
         :return: User object if found, else None.
         """
-        with get_db_session() as session:
-            return session.query(User).filter(User.id == user_id).first()
+        return readRouting.read_one(
+            lambda session: session.query(User).filter(User.id == user_id).first(),
+            user_id=user_id
+        )
 
     @staticmethod
     def get_user_by_email(email: str) -> Optional[User]:
@@ -31,18 +44,34 @@ class UserService:
         :param email: The email of the user to retrieve.
         :return: User object if found, else None.
         """
-        with get_db_session() as session:
-            return session.query(User).filter(User.email == email).first()
+        return readRouting.read_one(
+            lambda session: session.query(User).filter(User.email == email).first()
+        )
 
     @staticmethod
     def update_user_profile(user_id: int, **kwargs) -> Optional[User]:
         """
         Update user profile details.
+        Only the fields in PROFILE_FIELDS are accepted. A new password is hashed with
+        passwordHasher, the same bcrypt scheme login_user checks against, before any
+        session is opened.
 
         :param user_id: The ID of the user to update.
-        :param kwargs: Fields to update (e.g., username, email, password).
+        :param kwargs: Fields to update (username, email, password).
         :return: Updated User object if successful, else None.
+        :raises ValueError: If an unknown field is given, or the email or username is already in use.
+        :raises passwordHasher.PasswordHasherBusy: If the hashing pool is saturated.
         """
+        unknown = sorted(set(kwargs) - set(PROFILE_FIELDS))
+        if unknown:
+            raise ValueError(f"Unsupported profile fields: {', '.join(unknown)}")
+
+        password_hash = None
+        if 'password' in kwargs:
+            if not kwargs['password']:
+                raise ValueError("Password must not be empty.")
+            password_hash = passwordHasher.hash_password(kwargs['password'])
+
         with get_db_session() as session:
             user = session.query(User).filter(User.id == user_id).first()
             if not user:
@@ -53,10 +82,19 @@ class UserService:
                 user.username = kwargs['username']
             if 'email' in kwargs:
                 user.email = kwargs['email']
-            if 'password' in kwargs:
-                user.password_hash = generate_password_hash(kwargs['password'])
-
-            session.commit()
+            if password_hash is not None:
+                user.password_hash = password_hash
+
+            # Evict the cached identity in every worker once this commits.
+            userCache.invalidate(user_id, session)
+            readRouting.mark_user_write(user_id, session)
+            try:
+                session.commit()
+            except IntegrityError:
+                # users_email_key or uq_users_username rejected the change.
+                session.rollback()
+                raise ValueError("Email or username already in use.")
+            userCache.invalidate_local(user_id)
             session.refresh(user)
             return user
 
@@ -74,17 +112,70 @@ class UserService:
                 return False
 
             session.delete(user)
+            userCache.invalidate(user_id, session)
+            readRouting.mark_user_write(user_id, session)
             session.commit()
+            userCache.invalidate_local(user_id)
             return True
 
     @staticmethod
-    def list_users(limit: int = 10, offset: int = 0) -> list:
+    def list_users(
+        limit: int = 10,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_from: Optional[datetime.datetime] = None,
+        created_to: Optional[datetime.datetime] = None
+    ) -> list:
         """
-        Retrieve a paginated list of users.
+        Retrieve a page of users ordered by ID, using keyset pagination.
+        Pass the ID of the last user of the previous page as after_id; each page is
+        then an index range scan on the primary key, however deep it is.
+        Only the listed columns are selected (never password_hash), as UserSummary objects.
 
         :param limit: Number of users to retrieve.
-        :param offset: Offset for pagination.
-        :return: List of User objects.
+        :param offset: Rows to skip. Deprecated: kept for existing callers; prefer after_id,
+                       since OFFSET reads and discards every skipped row. Cannot be
+                       combined with after_id.
+        :param after_id: Return users with an ID greater than this one.
+        :param created_from: Only users created at or after this time.
+        :param created_to: Only users created before this time.
+        :return: List of UserSummary objects.
+        :raises ValueError: If both offset and after_id are given.
         """
-        with get_db_session() as session:
-            return session.query(User).offset(offset).limit(limit).all()
+        if offset and after_id is not None:
+            raise ValueError("Use either offset or after_id to page users, not both.")
+        stmt = UserService._users_query(created_from, created_to)
+        if after_id is not None:
+            stmt = stmt.where(User.id > after_id)
+        stmt = stmt.order_by(User.id).limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+        with readRouting.get_read_session() as session:
+            return [UserSummary.from_row(row) for row in session.execute(stmt)]
+
+    @staticmethod
+    def estimate_user_count(
+        created_from: Optional[datetime.datetime] = None,
+        created_to: Optional[datetime.datetime] = None
+    ) -> int:
+        """
+        Estimate how many users list_users would page through, from planner statistics
+        rather than COUNT(*). Suitable for "about N users" totals in admin tooling.
+
+        :param created_from: Only users created at or after this time.
+        :param created_to: Only users created before this time.
+        :return: The approximate number of users.
+        """
+        with readRouting.get_read_session() as session:
+            if created_from is None and created_to is None:
+                return rowEstimates.estimate_table_rows(session, User.__tablename__)
+            return rowEstimates.estimate_query_rows(session, UserService._users_query(created_from, created_to))
+
+    @staticmethod
+    def _users_query(created_from=None, created_to=None):
+        stmt = select(*UserSummary.columns())
+        if created_from is not None:
+            stmt = stmt.where(User.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(User.created_at < created_to)
+        return stmt
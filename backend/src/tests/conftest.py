@@ -0,0 +1,24 @@
+# backend/src/tests/conftest.py
+"""
+Shared pytest setup for the backend tests.
+
+Tests import application code through one root, backend.src.*, the same one the
+application uses. Importing a module under a second root (e.g. models.User next to
+backend.src.models.User) loads it twice, which registers every table twice on the
+shared declarative Base and fails collection. This file puts the repository root on
+sys.path so backend.src resolves from any working directory.
+
+Test modules are named <module>.test.py; backend/pytest.ini collects that pattern and
+imports them with importlib (their dotted file names are not importable packages).
+
+Run from the repository root or from backend/:
+    python -m pytest backend/src/tests
+    cd backend && pytest
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
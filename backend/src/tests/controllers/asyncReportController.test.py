@@ -0,0 +1,85 @@
+# backend/src/tests/controllers/asyncReportController.test.py
+
+import pytest
+from unittest.mock import patch, AsyncMock
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+from backend.src.controllers import asyncReportController
+from backend.src.models.dto import ReportSummary
+from backend.src.services.userCache import AuthenticatedUser
+
+
+@pytest.fixture
+def client():
+    """
+    A Starlette test client serving only the async report routes, with every token
+    resolving to user 1.
+    """
+    app = Starlette(routes=[Mount("/api/reports", routes=asyncReportController.routes)])
+    user = AuthenticatedUser(1, "async@example.com", "async", None, None)
+    with patch("backend.src.middlewares.asyncAuthMiddleware.jwt.decode", return_value={"user_id": 1}), \
+            patch("backend.src.middlewares.asyncAuthMiddleware._resolve", return_value=(False, user)):
+        yield TestClient(app, headers={"Authorization": "Bearer token"})
+
+
+def _summary(report_id, user_id=1):
+    return ReportSummary(report_id, user_id, 1, "2024-01-01 00:00:00", None, None, "PAID")
+
+
+# Test: Missing Token
+def test_requires_token(client):
+    """
+    Test that protected async routes reject requests without a token.
+    """
+    response = client.get("/api/reports/all", headers={"Authorization": ""})
+    assert response.status_code == 401
+
+
+# Test: Reports of Other Users Are Forbidden
+@patch("backend.src.controllers.asyncReportController.asyncReportService")
+def test_get_report_forbidden(mock_service, client):
+    """
+    Test that a report owned by another user returns 403.
+    """
+    mock_service.get_report_by_id = AsyncMock(return_value=_summary(5, user_id=2))
+
+    response = client.get("/api/reports/5")
+
+    assert response.status_code == 403
+
+
+# Test: Listing Returns the Next Cursor in Headers
+@patch("backend.src.controllers.asyncReportController.asyncReportService")
+def test_get_all_reports_next_cursor(mock_service, client):
+    """
+    Test that /all returns a JSON array and points at the next page in headers.
+    """
+    mock_service.get_reports_version = AsyncMock(return_value=(7, "2024-01-01 00:00:00"))
+    mock_service.get_reports_page = AsyncMock(return_value=([_summary(7)], "CURSOR"))
+    mock_service.get_pdf_urls = AsyncMock(return_value={7: None})
+
+    response = client.get("/api/reports/all?limit=1")
+
+    assert response.status_code == 200
+    assert [r["id"] for r in response.json()] == [7]
+    assert response.headers["X-Next-Cursor"] == "CURSOR"
+    assert response.headers["Link"] == '</api/reports/all?limit=1&after=CURSOR>; rel="next"'
+
+
+# Test: Unchanged Listings Return 304
+@patch("backend.src.controllers.asyncReportController.asyncReportService")
+def test_get_all_reports_not_modified(mock_service, client):
+    """
+    Test that a matching If-None-Match skips the page query and returns 304.
+    """
+    mock_service.get_reports_version = AsyncMock(return_value=(7, "2024-01-01 00:00:00"))
+    mock_service.get_reports_page = AsyncMock(return_value=([_summary(7)], None))
+    mock_service.get_pdf_urls = AsyncMock(return_value={7: None})
+
+    etag = client.get("/api/reports/all").headers["ETag"]
+    response = client.get("/api/reports/all", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert mock_service.get_reports_page.await_count == 1
@@ -1,17 +1,19 @@
 # backend/src/tests/controllers/authController.test.py
 
 import pytest
+from unittest.mock import patch
 from flask import Flask
-from src.server import app
-from src.models.User import User
-from src.db.dbClient import get_db_session
-from werkzeug.security import generate_password_hash
+from backend.src.server import create_app
+from backend.src.models.User import User
+from backend.src.db.dbClient import get_db_session
+from backend.src.utils.passwordHasher import hash_password
 
 @pytest.fixture
 def client():
     """
     Create a Flask test client for API testing.
     """
+    app = create_app()
     app.config['TESTING'] = True
     with app.test_client() as client:
         yield client
@@ -26,7 +28,7 @@ def test_user():
         user = User(
             email="testuser@example.com",
             username="testuser",
-            password_hash=generate_password_hash("password123")
+            password_hash=hash_password("password123")
         )
         session.add(user)
         session.commit()
@@ -35,7 +37,18 @@ def test_user():
         session.commit()
 
 
-def test_signup_success(client):
+@pytest.fixture
+def cleanup_new_user():
+    """
+    Remove the user created through the signup endpoint.
+    """
+    yield
+    with get_db_session() as session:
+        session.query(User).filter(User.email == "newuser@example.com").delete()
+        session.commit()
+
+
+def test_signup_success(client, cleanup_new_user):
     """
     Test user signup with valid data.
     """
@@ -46,8 +59,9 @@ def test_signup_success(client):
     })
     assert response.status_code == 201
     data = response.get_json()
-    assert "message" in data
-    assert data["message"] == "User created successfully"
+    assert data["email"] == "newuser@example.com"
+    assert data["username"] == "newuser"
+    assert "password_hash" not in data
 
 
 def test_signup_existing_email(client, test_user):
@@ -62,7 +76,7 @@ def test_signup_existing_email(client, test_user):
     assert response.status_code == 400
     data = response.get_json()
     assert "error" in data
-    assert data["error"] == "Email already in use"
+    assert data["error"] == "Email or username already in use."
 
 
 def test_login_success(client, test_user):
@@ -89,18 +103,33 @@ def test_login_invalid_password(client, test_user):
     assert response.status_code == 401
     data = response.get_json()
     assert "error" in data
-    assert data["error"] == "Invalid credentials"
+    assert data["error"] == "Invalid email or password."
+
+
+def test_login_hashing_pool_saturated(client, test_user):
+    """
+    Test that login is turned away with 503 when the password hashing pool is full.
+    """
+    with patch("backend.src.utils.passwordHasher._admission") as admission:
+        admission.acquire.return_value = False
+        response = client.post('/api/auth/login', json={
+            "email": test_user.email,
+            "password": "password123"
+        })
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert "error" in response.get_json()
 
 
 def test_protected_route_without_token(client):
     """
     Test accessing a protected route without providing a token.
     """
-    response = client.get('/api/auth/protected')
+    response = client.post('/api/auth/logout')
     assert response.status_code == 401
     data = response.get_json()
     assert "error" in data
-    assert data["error"] == "Token is missing"
+    assert data["error"] == "Authorization header is missing"
 
 
 def test_protected_route_with_invalid_token(client):
@@ -108,7 +137,7 @@ def test_protected_route_with_invalid_token(client):
     Test accessing a protected route with an invalid token.
     """
     headers = {"Authorization": "Bearer invalidtoken"}
-    response = client.get('/api/auth/protected', headers=headers)
+    response = client.post('/api/auth/logout', headers=headers)
     assert response.status_code == 401
     data = response.get_json()
     assert "error" in data
@@ -0,0 +1,42 @@
+# backend/src/tests/controllers/metricsController.test.py
+
+import pytest
+from flask import Flask
+from backend.src.controllers import metricsController
+
+
+@pytest.fixture
+def client():
+    """
+    A bare Flask app serving only the metrics blueprint.
+    """
+    app = Flask(__name__)
+    app.register_blueprint(metricsController.metrics_bp, url_prefix="/api/metrics")
+    return app.test_client()
+
+
+# Test: Metrics Are Disabled Without a Token
+def test_metrics_disabled_by_default(client, monkeypatch):
+    """
+    Test that the endpoint is hidden when GFVRHO_METRICS_TOKEN is not configured.
+    """
+    monkeypatch.setattr(metricsController, "METRICS_TOKEN", "")
+
+    response = client.get("/api/metrics/db", headers={"Authorization": "Bearer "})
+
+    assert response.status_code == 404
+
+
+# Test: Metrics Require the Configured Token
+def test_metrics_require_token(client, monkeypatch):
+    """
+    Test that only requests carrying the metrics token get the numbers.
+    """
+    monkeypatch.setattr(metricsController, "METRICS_TOKEN", "scrape-secret")
+
+    assert client.get("/api/metrics/db").status_code == 404
+    assert client.get("/api/metrics/db", headers={"Authorization": "Bearer wrong"}).status_code == 404
+
+    response = client.get("/api/metrics/db", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "pool" in response.get_json()
@@ -1,12 +1,17 @@
 # backend/src/tests/controllers/reportController.test.py
 
+import datetime
+import jwt
 import pytest
+from unittest.mock import patch, MagicMock
 from flask import Flask
-from src.server import app
-from src.models.Report import Report
-from src.models.User import User
-from src.db.dbClient import get_db_session
-from werkzeug.security import generate_password_hash
+from backend.src.server import create_app
+from backend.src.models.Report import Report
+from backend.src.models.ReportJob import ReportJob
+from backend.src.models.User import User
+from backend.src.db.dbClient import get_db_session
+from backend.src.middlewares.authMiddleware import JWT_SECRET, JWT_ALGORITHM
+from backend.src.utils.passwordHasher import hash_password
 
 
 @pytest.fixture
@@ -14,6 +19,7 @@ def client():
     """
     Create a Flask test client for API testing.
     """
+    app = create_app()
     app.config['TESTING'] = True
     with app.test_client() as client:
         yield client
@@ -28,7 +34,7 @@ def test_user():
         user = User(
             email="reportuser@example.com",
             username="reportuser",
-            password_hash=generate_password_hash("password123")
+            password_hash=hash_password("password123")
         )
         session.add(user)
         session.commit()
@@ -37,6 +43,18 @@ def test_user():
         session.commit()
 
 
+@pytest.fixture
+def auth_headers(client, test_user):
+    """
+    Log the test user in and return the Authorization header for its token.
+    """
+    response = client.post('/api/auth/login', json={
+        "email": test_user.email,
+        "password": "password123"
+    })
+    return {"Authorization": f"Bearer {response.get_json()['token']}"}
+
+
 @pytest.fixture
 def test_report(test_user):
     """
@@ -56,61 +74,107 @@ def test_report(test_user):
         session.commit()
 
 
-def test_create_report_success(client, test_user):
+def test_create_report_success(client, test_user, auth_headers):
     """
-    Test creating a new report successfully.
+    Test queueing a new report successfully.
     """
-    response = client.post('/api/reports/create', json={
-        "user_id": test_user.id,
-        "tier": 2
-    })
-    assert response.status_code == 201
+    response = client.post('/api/reports/create', json={"tier": 2}, headers=auth_headers)
+    assert response.status_code == 202
+    data = response.get_json()
+    assert "job_id" in data
+    assert data["status"] == "queued"
+    assert response.headers["Location"] == data["status_url"]
+
+    with get_db_session() as session:
+        session.execute(
+            ReportJob.__table__.delete().where(ReportJob.id == data["job_id"])
+        )
+        session.commit()
+
+
+def test_create_report_invalid_tier(client, auth_headers):
+    """
+    Test that an unknown tier is rejected with 400 instead of being queued.
+    """
+    response = client.post('/api/reports/create', json={"tier": 7}, headers=auth_headers)
+    assert response.status_code == 400
+    assert "Invalid report tier" in response.get_json()["error"]
+
+
+def test_get_report_job_not_found(client, auth_headers):
+    """
+    Test polling a report job that does not exist.
+    """
+    response = client.get('/api/reports/jobs/does-not-exist', headers=auth_headers)
+    assert response.status_code == 404
     data = response.get_json()
-    assert "message" in data
-    assert data["message"] == "Report created successfully"
+    assert data["error"] == "Report job not found"
 
 
 def test_create_report_invalid_user(client):
     """
-    Test creating a report with an invalid user ID.
+    Test creating a report with a token for a user that does not exist.
     """
-    response = client.post('/api/reports/create', json={
+    token = jwt.encode({
         "user_id": 99999,
-        "tier": 1
+        "exp": datetime.datetime.utcnow() + datetime.timedelta(minutes=5)
+    }, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    response = client.post('/api/reports/create', json={"tier": 1}, headers={
+        "Authorization": f"Bearer {token}"
     })
-    assert response.status_code == 400
+    assert response.status_code == 401
     data = response.get_json()
     assert "error" in data
-    assert data["error"] == "Invalid user ID"
+    assert data["error"] == "User does not exist"
+
+
+@patch("backend.src.controllers.reportController.reportJobService.enqueue_report_job")
+@patch("backend.src.controllers.reportController.llmService.generate_report_content_stream")
+def test_stream_report_success(mock_stream, mock_enqueue, client, test_user, auth_headers):
+    """
+    Test streaming report content as Server-Sent Events.
+    """
+    mock_stream.return_value = iter(["First chunk\n", "Second chunk"])
+    mock_enqueue.return_value = MagicMock(id="job123")
+
+    with patch("backend.src.services.reportService.paymentService.verify_payment", return_value=True):
+        response = client.post('/api/reports/stream', json={"tier": 1}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+
+    body = response.get_data(as_text=True)
+    assert 'event: chunk\ndata: {"text": "First chunk\\n"}' in body
+    assert 'event: done\ndata: {"job_id": "job123"' in body
+    assert mock_enqueue.call_args.kwargs["report_content"] == "First chunk\nSecond chunk"
 
 
-def test_get_report_success(client, test_report):
+def test_get_report_success(client, test_report, auth_headers):
     """
     Test retrieving an existing report.
     """
-    response = client.get(f'/api/reports/{test_report.id}')
+    response = client.get(f'/api/reports/{test_report.id}', headers=auth_headers)
     assert response.status_code == 200
     data = response.get_json()
     assert "pdf_url" in data
     assert data["pdf_url"] == "https://example.com/report.pdf"
 
 
-def test_get_report_not_found(client):
+def test_get_report_not_found(client, auth_headers):
     """
     Test retrieving a non-existent report.
     """
-    response = client.get('/api/reports/99999')
+    response = client.get('/api/reports/99999', headers=auth_headers)
     assert response.status_code == 404
     data = response.get_json()
     assert "error" in data
     assert data["error"] == "Report not found"
 
 
-def test_list_user_reports(client, test_user, test_report):
+def test_list_user_reports(client, test_user, test_report, auth_headers):
     """
-    Test listing reports for a specific user.
+    Test listing the authenticated user's reports.
     """
-    response = client.get(f'/api/reports/user/{test_user.id}')
+    response = client.get('/api/reports/all', headers=auth_headers)
     assert response.status_code == 200
     data = response.get_json()
     assert isinstance(data, list)
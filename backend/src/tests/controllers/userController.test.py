@@ -1,11 +1,14 @@
 # backend/src/tests/controllers/userController.test.py
 
+import datetime
+import jwt
 import pytest
 from flask import Flask
-from src.server import app
-from src.models.User import User
-from src.db.dbClient import get_db_session
-from werkzeug.security import generate_password_hash
+from backend.src.server import create_app
+from backend.src.models.User import User
+from backend.src.db.dbClient import get_db_session
+from backend.src.middlewares.authMiddleware import JWT_SECRET, JWT_ALGORITHM
+from backend.src.utils.passwordHasher import hash_password
 
 
 @pytest.fixture
@@ -13,6 +16,7 @@ def client():
     """
     Create a Flask test client for API testing.
     """
+    app = create_app()
     app.config['TESTING'] = True
     with app.test_client() as client:
         yield client
@@ -27,7 +31,7 @@ def test_user():
         user = User(
             email="testuser@example.com",
             username="testuser",
-            password_hash=generate_password_hash("password123")
+            password_hash=hash_password("password123")
         )
         session.add(user)
         session.commit()
@@ -36,75 +40,90 @@ def test_user():
         session.commit()
 
 
-def test_get_user_profile_success(client, test_user):
+
+@pytest.fixture
+def auth_headers(client, test_user):
+    """
+    Log the test user in and return the Authorization header for its token.
+    """
+    response = client.post('/api/auth/login', json={
+        "email": test_user.email,
+        "password": "password123"
+    })
+    return {"Authorization": f"Bearer {response.get_json()['token']}"}
+
+
+@pytest.fixture
+def unknown_user_headers():
+    """
+    Return an Authorization header for a well-formed token whose user does not exist.
+    """
+    token = jwt.encode({
+        "user_id": 99999,
+        "exp": datetime.datetime.utcnow() + datetime.timedelta(minutes=5)
+    }, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_get_user_profile_success(client, test_user, auth_headers):
     """
     Test retrieving a user profile successfully.
     """
-    response = client.get(f'/api/users/{test_user.id}')
+    response = client.get('/api/users/profile', headers=auth_headers)
     assert response.status_code == 200
-    data = response.get_json()
+    data = response.get_json()["data"]
     assert "email" in data
     assert data["email"] == test_user.email
     assert "username" in data
     assert data["username"] == test_user.username
+    assert "password_hash" not in data
 
 
-def test_get_user_profile_not_found(client):
+def test_get_user_profile_not_found(client, unknown_user_headers):
     """
-    Test retrieving a non-existent user profile.
+    Test retrieving the profile of a user that does not exist.
     """
-    response = client.get('/api/users/99999')
-    assert response.status_code == 404
+    response = client.get('/api/users/profile', headers=unknown_user_headers)
+    assert response.status_code == 401
     data = response.get_json()
     assert "error" in data
-    assert data["error"] == "User not found"
+    assert data["error"] == "User does not exist"
+
+
+def test_get_user_profile_without_token(client):
+    """
+    Test retrieving a user profile without a token.
+    """
+    response = client.get('/api/users/profile')
+    assert response.status_code == 401
+    assert response.get_json()["error"] == "Authorization header is missing"
 
 
-def test_update_user_profile_success(client, test_user):
+def test_update_user_profile_success(client, test_user, auth_headers):
     """
     Test updating a user profile successfully.
     """
-    response = client.put(f'/api/users/{test_user.id}', json={
+    response = client.put('/api/users/profile', json={
         "username": "updateduser",
         "email": "updateduser@example.com"
-    })
+    }, headers=auth_headers)
     assert response.status_code == 200
     data = response.get_json()
-    assert "message" in data
-    assert data["message"] == "User updated successfully"
+    assert data["status"] == "success"
+    assert data["data"]["username"] == "updateduser"
+    assert data["data"]["email"] == "updateduser@example.com"
 
 
-def test_update_user_profile_not_found(client):
+def test_update_user_profile_not_found(client, unknown_user_headers):
     """
-    Test updating a non-existent user profile.
+    Test updating the profile of a user that does not exist.
     """
-    response = client.put('/api/users/99999', json={
+    response = client.put('/api/users/profile', json={
         "username": "ghostuser",
         "email": "ghostuser@example.com"
-    })
-    assert response.status_code == 404
+    }, headers=unknown_user_headers)
+    assert response.status_code == 401
     data = response.get_json()
     assert "error" in data
-    assert data["error"] == "User not found"
+    assert data["error"] == "User does not exist"
 
-
-def test_delete_user_success(client, test_user):
-    """
-    Test deleting a user successfully.
-    """
-    response = client.delete(f'/api/users/{test_user.id}')
-    assert response.status_code == 200
-    data = response.get_json()
-    assert "message" in data
-    assert data["message"] == "User deleted successfully"
-
-
-def test_delete_user_not_found(client):
-    """
-    Test deleting a non-existent user.
-    """
-    response = client.delete('/api/users/99999')
-    assert response.status_code == 404
-    data = response.get_json()
-    assert "error" in data
-    assert data["error"] == "User not found"
@@ -0,0 +1,100 @@
+# backend/src/tests/db/queryStats.test.py
+
+import logging
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+from backend.src.db import queryStats
+
+
+@pytest.fixture
+def engine():
+    """
+    An in-memory SQLite engine with the statement hooks attached.
+    """
+    return queryStats.instrument_engine(create_engine("sqlite://"))
+
+
+@pytest.fixture
+def app():
+    """
+    A bare Flask app with the per-request reporting registered.
+    """
+    app = Flask(__name__)
+    queryStats.init_app(app)
+    return app
+
+
+# Test: Statements Are Counted Per Request
+def test_request_stats(engine, app):
+    """
+    Test that statements run inside a request are counted and timed.
+    """
+    with app.test_request_context():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        stats = queryStats.get_request_stats()
+        assert stats.count == 2
+        assert stats.seconds >= 0
+        assert stats.repeated() == []
+
+
+# Test: Repeated Statements Are Flagged as N+1
+def test_n_plus_one_warning(engine, app, caplog):
+    """
+    Test that the same statement run many times in one request is logged and
+    reported in the debug headers.
+    """
+    app.debug = True
+    with app.test_request_context("/api/reports/all"):
+        with engine.connect() as conn:
+            for user_id in range(queryStats.N_PLUS_ONE_THRESHOLD):
+                conn.execute(text("SELECT :user_id"), {"user_id": user_id})
+
+        with caplog.at_level(logging.WARNING, logger=queryStats.__name__):
+            response = app.process_response(app.response_class("ok"))
+
+    assert "Possible N+1 query in GET /api/reports/all" in caplog.text
+    assert response.headers["X-DB-Query-Count"] == str(queryStats.N_PLUS_ONE_THRESHOLD)
+    assert response.headers["X-DB-Repeated-Statements"] == "1"
+
+
+# Test: Debug Headers Are Off in Production
+def test_no_headers_without_debug(engine, app):
+    """
+    Test that query counts are not exposed when the app is not in debug mode.
+    """
+    with app.test_request_context():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        response = app.process_response(app.response_class("ok"))
+
+    assert "X-DB-Query-Count" not in response.headers
+
+
+# Test: Slow Query Parameters Are Redacted
+def test_slow_query_redacted(engine, caplog, monkeypatch):
+    """
+    Test that slow queries are logged with parameter types instead of values.
+    """
+    monkeypatch.setattr(queryStats, "SLOW_QUERY_MS", 0)
+    with caplog.at_level(logging.WARNING, logger=queryStats.__name__):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :email"), {"email": "secret@example.com"})
+
+    assert "Slow query" in caplog.text
+    assert "secret@example.com" not in caplog.text
+    # Named or positional, depending on the dialect's parameter style.
+    assert "'email': 'str'" in caplog.text or "('str',)" in caplog.text
+
+
+# Test: Parameter Redaction Shapes
+def test_redact_parameters():
+    """
+    Test that every parameter shape is reduced to type names.
+    """
+    assert queryStats.redact_parameters({"email": "a@b.c", "id": 1}) == {"email": "str", "id": "int"}
+    assert queryStats.redact_parameters(("a@b.c", 1)) == ("str", "int")
+    assert queryStats.redact_parameters([{"id": 1}, {"id": 2}]) == "<2 parameter sets>"
@@ -0,0 +1,85 @@
+# backend/src/tests/db/readRouting.test.py
+#
+# Routing decisions are tested with stand-in engines. To exercise real replica reads,
+# run the suite with GFVRHO_DB_REPLICA_URLS pointing at a second local Postgres.
+
+import pytest
+from unittest.mock import patch, MagicMock
+from flask import Flask, g
+from sqlalchemy import select, update
+from backend.src.db import readRouting
+from backend.src.db.readRouting import RoutingSession
+from backend.src.models.Report import Report
+
+
+@pytest.fixture
+def replica():
+    """
+    Configure one stand-in replica and a clean read-your-writes state.
+    """
+    replica = MagicMock(name="replica")
+    readRouting._recent_writers.clear()
+    with patch.object(readRouting, "replica_engines", [replica]), \
+            patch.object(readRouting, "_primary_only_until", 0.0), \
+            patch("backend.src.db.readRouting.pgListener.ensure_started"):
+        yield replica
+    readRouting._recent_writers.clear()
+
+
+# Test: Reads Go to the Replica, Writes to the Primary
+def test_routing_session_binds(replica):
+    """
+    Test that selects use the replica while DML and flushes use the primary.
+    """
+    session = RoutingSession(replica=replica)
+    assert session.get_bind(clause=select(Report.id)) is replica
+    assert session.get_bind(clause=update(Report).values(tier=1)) is readRouting.engine
+
+
+# Test: Read-Your-Writes Window
+def test_recent_writer_reads_primary(replica):
+    """
+    Test that a user who just wrote reads from the primary, and others from the replica.
+    """
+    assert readRouting._use_replica(1) is True
+
+    readRouting.mark_user_write(1)
+
+    assert readRouting._use_replica(1) is False
+    assert readRouting._use_replica(2) is True
+
+
+# Test: Writes Earlier in the Request
+def test_request_write_pins_primary(replica):
+    """
+    Test that once a request has written, its later reads stay on the primary.
+    """
+    app = Flask(__name__)
+    with app.test_request_context():
+        assert readRouting._use_replica(1) is True
+        g._db_wrote = True
+        assert readRouting._use_replica(1) is False
+
+
+# Test: Missed Notifications
+def test_listener_reset_reads_primary(replica):
+    """
+    Test that all reads go to the primary for one window after the listener resets.
+    """
+    readRouting._on_reset()
+    assert readRouting._use_replica(1) is False
+
+
+# Test: Replica Miss Falls Back to the Primary
+def test_read_one_falls_back_to_primary(replica):
+    """
+    Test that a point lookup missing on the replica is retried on the primary.
+    """
+    results = iter([None, "found"])
+    with patch("backend.src.db.readRouting._new_replica_session") as replica_session, \
+            patch("backend.src.db.readRouting.get_db_session") as primary_session:
+        result = readRouting.read_one(lambda db: next(results), user_id=5)
+
+    assert result == "found"
+    replica_session.assert_called_once()
+    primary_session.assert_called_once()
@@ -0,0 +1,78 @@
+# backend/src/tests/db/runMigrations.test.py
+
+import pytest
+from sqlalchemy import text
+from backend.src.db import runMigrations
+from backend.src.db.dbClient import engine
+
+
+def _write_migration(directory, filename, revision, down_revision):
+    down = repr(down_revision)
+    (directory / filename).write_text(
+        f"revision = {revision!r}\ndown_revision = {down}\n\ndef upgrade():\n    pass\n"
+    )
+
+
+# Test: The Shipped Migrations Form One Chain
+def test_shipped_migrations_chain():
+    """
+    Test that every migration in db/migrations is reachable, starting from the initial one.
+    """
+    migrations = runMigrations.load_migrations()
+
+    assert migrations[0].revision == "20240101_initial_migration"
+    for previous, current in zip(migrations, migrations[1:]):
+        assert current.down_revision == previous.revision
+
+
+# Test: Order Follows down_revision, Not File Names
+def test_load_migrations_follows_down_revision(tmp_path):
+    """
+    Test that migrations are ordered by their down_revision links.
+    """
+    _write_migration(tmp_path, "a_last.py", "third", "second")
+    _write_migration(tmp_path, "b_first.py", "first", None)
+    _write_migration(tmp_path, "c_middle.py", "second", "first")
+
+    assert [m.revision for m in runMigrations.load_migrations(str(tmp_path))] == ["first", "second", "third"]
+
+
+# Test: Branched Revisions Are Rejected
+def test_load_migrations_rejects_branches(tmp_path):
+    """
+    Test that two revisions following the same parent raise instead of guessing an order.
+    """
+    _write_migration(tmp_path, "one.py", "first", None)
+    _write_migration(tmp_path, "two.py", "second", "first")
+    _write_migration(tmp_path, "three.py", "other", "first")
+
+    with pytest.raises(RuntimeError):
+        runMigrations.load_migrations(str(tmp_path))
+
+
+# Test: The Migration Lock Excludes Other Runners
+def test_migration_lock_excludes_other_runners():
+    """
+    Test that a second runner cannot take the advisory lock while the first holds it.
+    """
+    try_lock = text("SELECT pg_try_advisory_lock(:key)")
+    unlock = text("SELECT pg_advisory_unlock(:key)")
+    key = {"key": runMigrations.MIGRATION_LOCK_KEY}
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as other:
+        with runMigrations.migration_lock():
+            assert other.execute(try_lock, key).scalar() is False
+        assert other.execute(try_lock, key).scalar() is True
+        other.execute(unlock, key)
+
+
+# Test: Untracked Databases Are Refused
+def test_upgrade_refuses_untracked_database(monkeypatch):
+    """
+    Test that a database with tables but no recorded migrations points at --stamp
+    instead of replaying the chain.
+    """
+    monkeypatch.setattr(runMigrations, "applied_revisions", lambda connection: set())
+
+    with pytest.raises(RuntimeError, match="--stamp"):
+        runMigrations.upgrade()
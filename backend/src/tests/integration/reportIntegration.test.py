@@ -2,17 +2,18 @@
 
 import pytest
 from flask import Flask
-from db.dbConfig import SessionLocal
-from models.User import User
-from models.Report import Report
-from services.authService import create_user
-from services.reportService import create_report
+from backend.src.db.dbConfig import SessionLocal
+from backend.src.models.User import User
+from backend.src.models.Report import Report
+from backend.src.services.authService import create_user
+from backend.src.services.reportService import create_report
 from datetime import datetime
 
 # Fixture for test client
 @pytest.fixture
 def test_client():
-    from src.server import app  # Ensure server.py runs Flask app
+    from backend.src.server import create_app
+    app = create_app()
     
     with app.test_client() as testing_client:
         with app.app_context():
@@ -0,0 +1,62 @@
+# backend/src/tests/middlewares/compressionMiddleware.test.py
+
+import gzip
+import pytest
+from flask import Flask, jsonify
+from backend.src.middlewares import compressionMiddleware
+from backend.src.middlewares.compressionMiddleware import register_compression, choose_encoding
+
+
+@pytest.fixture
+def client():
+    """
+    A bare Flask app with compression registered, serving a large and a small body.
+    """
+    app = Flask(__name__)
+    register_compression(app)
+
+    @app.route("/large")
+    def large():
+        return jsonify([{"id": i, "tier": 1} for i in range(500)])
+
+    @app.route("/small")
+    def small():
+        return jsonify({"status": "ok"})
+
+    return app.test_client()
+
+
+# Test: Large JSON Bodies Are Gzipped
+def test_large_body_gzipped(client, monkeypatch):
+    """
+    Test that a large JSON response is gzip-compressed for gzip clients.
+    """
+    monkeypatch.setattr(compressionMiddleware, "brotli", None)
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert gzip.decompress(response.data).startswith(b"[")
+
+
+# Test: Small Bodies Are Sent As-Is
+def test_small_body_not_compressed(client):
+    """
+    Test that bodies below the threshold are not compressed.
+    """
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+# Test: Accept-Encoding Negotiation
+def test_choose_encoding(monkeypatch):
+    """
+    Test that q=0 refuses an encoding and identity-only clients get no compression.
+    """
+    monkeypatch.setattr(compressionMiddleware, "brotli", None)
+
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, br") is None
+    assert choose_encoding("identity") is None
@@ -0,0 +1,58 @@
+# backend/src/tests/models/dto.test.py
+
+import pytest
+from datetime import datetime
+from backend.src.models.dto import ReportSummary, UserSummary
+from backend.src.models.Report import Report
+from backend.src.utils import serializer
+
+
+# Test: DTOs Map Selected Columns
+def test_report_summary_from_row():
+    """
+    Test that a row selected with columns() maps onto the DTO's slots in order.
+    """
+    assert ReportSummary.columns()[0] is Report.id
+    created = datetime(2024, 1, 1, 12, 0)
+    report = ReportSummary.from_row((7, 1, 2, created, None, "reports/abc.pdf", "PAID"))
+
+    assert report.id == 7
+    assert report.pdf_key == "reports/abc.pdf"
+    assert not hasattr(report, "__dict__")
+
+
+# Test: DTOs Are Read-Only
+def test_dto_read_only():
+    """
+    Test that DTOs cannot be modified after construction.
+    """
+    user = UserSummary(1, "dto@example.com", "dto", None)
+    with pytest.raises(AttributeError):
+        user.email = "changed@example.com"
+
+
+# Test: User Listings Never Select the Password Hash
+def test_user_summary_excludes_password_hash():
+    """
+    Test that the user DTO does not select password_hash.
+    """
+    assert "password_hash" not in [c.key for c in UserSummary.columns()]
+
+
+# Test: Shared Serializer
+def test_serialize_report():
+    """
+    Test that the serializer renders the public fields, timestamps and extra values.
+    """
+    created = datetime(2024, 1, 1, 12, 0)
+    report = ReportSummary(7, 1, 2, created, None, "reports/abc.pdf", "PAID")
+
+    data = serializer.serialize(report, serializer.REPORT_FIELDS, pdf_url="https://signed/abc")
+
+    assert data == {
+        "id": 7,
+        "tier": 2,
+        "created_at": str(created),
+        "payment_status": "PAID",
+        "pdf_url": "https://signed/abc",
+    }
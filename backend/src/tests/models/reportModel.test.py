@@ -2,11 +2,15 @@
 
 import pytest
 from sqlalchemy.exc import IntegrityError
-from db.dbConfig import SessionLocal
-from models.Report import Report
-from models.User import User
+from backend.src.db.dbConfig import SessionLocal
+from backend.src.models.Report import Report
+from backend.src.models.User import User
 from datetime import datetime
 
+# Users created by these tests; removed again after each test.
+TEST_EMAILS = ("test@example.com", "test2@example.com")
+
+
 # Fixture for setting up and tearing down the database session
 @pytest.fixture
 def db_session():
@@ -15,6 +19,11 @@ def db_session():
         yield session
     finally:
         session.rollback()
+        session.query(Report).filter(
+            Report.user_id.in_(session.query(User.id).filter(User.email.in_(TEST_EMAILS)))
+        ).delete(synchronize_session=False)
+        session.query(User).filter(User.email.in_(TEST_EMAILS)).delete(synchronize_session=False)
+        session.commit()
         session.close()
 
 
@@ -2,10 +2,14 @@
 
 import pytest
 from sqlalchemy.exc import IntegrityError
-from db.dbConfig import SessionLocal
-from models.User import User
+from backend.src.db.dbConfig import SessionLocal
+from backend.src.models.User import User
 from datetime import datetime
 
+# Users created by these tests; removed again after each test.
+TEST_EMAILS = ("unique@example.com", "user1@example.com", "timestamp@example.com")
+
+
 # Fixture for setting up and tearing down the database session
 @pytest.fixture
 def db_session():
@@ -14,6 +18,8 @@ def db_session():
         yield session
     finally:
         session.rollback()
+        session.query(User).filter(User.email.in_(TEST_EMAILS)).delete(synchronize_session=False)
+        session.commit()
         session.close()
 
 
@@ -2,10 +2,20 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from services.authService import register_user, login_user, refresh_token
-from models.User import User
-from db.dbConfig import SessionLocal
-from werkzeug.security import generate_password_hash, check_password_hash
+import jwt
+from backend.src.services.authService import register_user, login_user, JWT_SECRET, JWT_ALGORITHM
+from backend.src.models.User import User
+from backend.src.db.dbConfig import SessionLocal
+from backend.src.utils import passwordHasher
+
+# Users created by these tests; removed again after each test.
+TEST_EMAILS = (
+    "test_register@example.com",
+    "test_duplicate@example.com",
+    "test_other@example.com",
+    "login_success@example.com",
+    "login_invalid@example.com",
+)
 
 
 # Fixture for database session
@@ -16,6 +26,8 @@ def db_session():
         yield session
     finally:
         session.rollback()
+        session.query(User).filter(User.email.in_(TEST_EMAILS)).delete(synchronize_session=False)
+        session.commit()
         session.close()
 
 
@@ -34,7 +46,20 @@ def test_register_user(db_session):
     assert user is not None
     assert user.email == user_data['email']
     assert user.username == user_data['username']
-    assert check_password_hash(user.password_hash, user_data['password'])
+    assert passwordHasher.check_password(user_data['password'], user.password_hash)
+
+
+# Test: Duplicate Registration
+def test_register_user_duplicate(db_session):
+    """
+    Test that reusing an email or a username is rejected.
+    """
+    register_user("test_duplicate@example.com", "duplicateuser", "StrongPassword123!")
+
+    with pytest.raises(ValueError, match="already in use"):
+        register_user("test_duplicate@example.com", "otheruser", "StrongPassword123!")
+    with pytest.raises(ValueError, match="already in use"):
+        register_user("test_other@example.com", "duplicateuser", "StrongPassword123!")
 
 
 # Test: User Login Success
@@ -42,7 +67,7 @@ def test_login_user_success(db_session):
     """
     Test successful user login.
     """
-    hashed_password = generate_password_hash("ValidPassword123!")
+    hashed_password = passwordHasher.hash_password("ValidPassword123!")
     user = User(
         email="login_success@example.com",
         username="loginuser",
@@ -51,9 +76,10 @@ def test_login_user_success(db_session):
     db_session.add(user)
     db_session.commit()
 
-    result = login_user("login_success@example.com", "ValidPassword123!")
-    assert result is not None
-    assert "token" in result
+    token = login_user("login_success@example.com", "ValidPassword123!")
+    claims = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    assert claims["user_id"] == user.id
+    assert "jti" in claims
 
 
 # Test: User Login Failure (Invalid Password)
@@ -61,7 +87,7 @@ def test_login_user_invalid_password(db_session):
     """
     Test login with an invalid password.
     """
-    hashed_password = generate_password_hash("CorrectPassword123!")
+    hashed_password = passwordHasher.hash_password("CorrectPassword123!")
     user = User(
         email="login_invalid@example.com",
         username="loginfail",
@@ -70,8 +96,8 @@ def test_login_user_invalid_password(db_session):
     db_session.add(user)
     db_session.commit()
 
-    result = login_user("login_invalid@example.com", "WrongPassword123!")
-    assert result is None
+    with pytest.raises(ValueError, match="Invalid email or password"):
+        login_user("login_invalid@example.com", "WrongPassword123!")
 
 
 # Test: User Login Failure (User Not Found)
@@ -79,31 +105,5 @@ def test_login_user_not_found(db_session):
     """
     Test login with a non-existing user.
     """
-    result = login_user("nonexistent@example.com", "RandomPassword123!")
-    assert result is None
-
-
-# Test: Token Refresh Success
-@patch("services.authService.verify_token")
-@patch("services.authService.generate_token")
-def test_refresh_token_success(mock_generate_token, mock_verify_token):
-    """
-    Test successful token refresh.
-    """
-    mock_verify_token.return_value = {"user_id": 1}
-    mock_generate_token.return_value = "new_token_string"
-
-    new_token = refresh_token("valid_refresh_token")
-    assert new_token == "new_token_string"
-
-
-# Test: Token Refresh Failure
-@patch("services.authService.verify_token")
-def test_refresh_token_failure(mock_verify_token):
-    """
-    Test token refresh failure due to invalid token.
-    """
-    mock_verify_token.return_value = None
-
-    new_token = refresh_token("invalid_refresh_token")
-    assert new_token is None
+    with pytest.raises(ValueError, match="Invalid email or password"):
+        login_user("nonexistent@example.com", "RandomPassword123!")
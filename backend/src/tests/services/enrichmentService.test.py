@@ -0,0 +1,60 @@
+# backend/src/tests/services/enrichmentService.test.py
+
+import time
+from unittest.mock import patch
+from backend.src.services.enrichmentService import gather_market_data
+
+
+def slow_provider(delay, payload):
+    def call(company_name):
+        time.sleep(delay)
+        return payload
+    return call
+
+
+def failing_provider(company_name):
+    raise Exception("Crunchbase API returned status code 500")
+
+
+# Test: Providers Run Concurrently
+def test_gather_market_data_concurrent():
+    """
+    Test that total latency tracks the slowest provider, not the sum.
+    """
+    providers = {
+        "linkedin": slow_provider(0.3, {"employees": 50}),
+        "crunchbase": slow_provider(0.3, {"funding": "Series A"}),
+        "carta": slow_provider(0.3, {"valuation": 1000000}),
+    }
+    with patch.dict("backend.src.services.enrichmentService.PROVIDERS", providers, clear=True):
+        started = time.monotonic()
+        market_data = gather_market_data("Acme Inc.", deadline_seconds=5)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.8
+    assert market_data["linkedin"] == {"employees": 50}
+    assert market_data["crunchbase"] == {"funding": "Series A"}
+    assert market_data["carta"] == {"valuation": 1000000}
+    assert market_data["unavailable_sources"] == []
+
+
+# Test: Failures and Deadline Misses Are Tolerated
+def test_gather_market_data_partial():
+    """
+    Test that a failing provider and a provider past the deadline are reported as unavailable.
+    """
+    providers = {
+        "linkedin": slow_provider(0, {"employees": 50}),
+        "crunchbase": failing_provider,
+        "carta": slow_provider(2, {"valuation": 1000000}),
+    }
+    with patch.dict("backend.src.services.enrichmentService.PROVIDERS", providers, clear=True):
+        started = time.monotonic()
+        market_data = gather_market_data("Acme Inc.", deadline_seconds=0.2)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 1
+    assert market_data["linkedin"] == {"employees": 50}
+    assert "crunchbase" not in market_data
+    assert "carta" not in market_data
+    assert market_data["unavailable_sources"] == ["carta", "crunchbase"]
@@ -0,0 +1,54 @@
+# backend/src/tests/services/llmCache.test.py
+
+import pytest
+from unittest.mock import patch
+from backend.src.services import llmCache, llmService
+from backend.src.services.llmService import generate_report_content
+
+
+@pytest.fixture(autouse=True)
+def memory_only_cache():
+    """
+    Run against the in-process tier only, with a clean cache per test.
+    """
+    llmCache._memory_cache.clear()
+    with patch.object(llmCache, "get_db_session", side_effect=Exception("database unavailable")):
+        yield
+    llmCache._memory_cache.clear()
+
+
+# Test: Key Is Canonical
+def test_make_cache_key_ignores_dict_order():
+    """
+    Test that logically equal inputs produce the same key.
+    """
+    key_a = llmCache.make_cache_key("gpt-4", 2, {"company_name": "Acme", "domain": "acme.com"}, {"a": 1, "b": 2})
+    key_b = llmCache.make_cache_key("gpt-4", 2, {"domain": "acme.com", "company_name": "Acme"}, {"b": 2, "a": 1})
+    assert key_a == key_b
+    assert len(key_a) == 64
+
+
+# Test: Key Depends on Model and Tier
+def test_make_cache_key_varies_by_model_and_tier():
+    """
+    Test that the model name and tier are part of the key.
+    """
+    base = llmCache.make_cache_key("gpt-4", 2, {}, {})
+    assert llmCache.make_cache_key("gpt-4o", 2, {}, {}) != base
+    assert llmCache.make_cache_key("gpt-4", 3, {}, {}) != base
+
+
+# Test: Repeat Request Skips the LLM
+@patch.object(llmService, "_call_advanced_llm")
+def test_generate_report_content_cached(mock_call_advanced_llm):
+    """
+    Test that the second identical request is served from the cache.
+    """
+    mock_call_advanced_llm.return_value = "Generated report content"
+
+    first = generate_report_content(2, userData={"company_name": "Acme"}, marketData={})
+    second = generate_report_content(2, userData={"company_name": "Acme"}, marketData={})
+
+    assert first == second == "Generated report content"
+    assert mock_call_advanced_llm.call_count == 1
+    assert llmCache.get_cache_stats()["memory_hits"] >= 1
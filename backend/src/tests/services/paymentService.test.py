@@ -2,11 +2,11 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from services.paymentService import verify_payment
+from backend.src.services.paymentService import verify_payment
 
 
 # Test: Successful Payment Verification
-@patch("services.paymentService.stripe.PaymentIntent.retrieve")
+@patch("backend.src.services.paymentService.stripe.PaymentIntent.retrieve")
 def test_verify_payment_success(mock_retrieve):
     """
     Test successful payment verification.
@@ -23,7 +23,7 @@ def test_verify_payment_success(mock_retrieve):
 
 
 # Test: Failed Payment Verification (Payment Intent Failed)
-@patch("services.paymentService.stripe.PaymentIntent.retrieve")
+@patch("backend.src.services.paymentService.stripe.PaymentIntent.retrieve")
 def test_verify_payment_failed_status(mock_retrieve):
     """
     Test payment verification failure due to unsuccessful payment status.
@@ -39,7 +39,7 @@ def test_verify_payment_failed_status(mock_retrieve):
 
 
 # Test: Failed Payment Verification (Mismatched Metadata)
-@patch("services.paymentService.stripe.PaymentIntent.retrieve")
+@patch("backend.src.services.paymentService.stripe.PaymentIntent.retrieve")
 def test_verify_payment_metadata_mismatch(mock_retrieve):
     """
     Test payment verification failure due to mismatched metadata.
@@ -55,7 +55,7 @@ def test_verify_payment_metadata_mismatch(mock_retrieve):
 
 
 # Test: Payment Verification Exception
-@patch("services.paymentService.stripe.PaymentIntent.retrieve")
+@patch("backend.src.services.paymentService.stripe.PaymentIntent.retrieve")
 def test_verify_payment_exception(mock_retrieve):
     """
     Test payment verification failure due to an exception.
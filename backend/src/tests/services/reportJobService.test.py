@@ -0,0 +1,240 @@
+# backend/src/tests/services/reportJobService.test.py
+
+import pytest
+from unittest.mock import patch, MagicMock
+from backend.src.services.reportJobService import (
+    enqueue_report_job,
+    get_job,
+    claim_next_job,
+    heartbeat_job,
+    complete_job,
+    fail_job,
+    is_retryable,
+    requeue_expired_jobs,
+    REPORT_JOB_MAX_ATTEMPTS,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JOB_FAILED
+)
+from backend.src.models.User import User
+from backend.src.models.ReportJob import ReportJob
+from backend.src.db.dbClient import get_db_session
+from werkzeug.security import generate_password_hash
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+
+@pytest.fixture
+def test_user():
+    """
+    Create a user that owns the queued jobs.
+    """
+    with get_db_session() as session:
+        user = User(
+            email="jobuser@example.com",
+            username="jobuser",
+            password_hash=generate_password_hash("password123")
+        )
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        yield user
+        session.query(ReportJob).filter(ReportJob.user_id == user.id).delete()
+        session.delete(user)
+        session.commit()
+
+
+@pytest.fixture(autouse=True)
+def no_embedded_workers():
+    """
+    Keep embedded worker threads from claiming jobs behind the test's back.
+    """
+    with patch("backend.src.workers.reportWorker.ensure_embedded_workers"), \
+            patch("backend.src.workers.reportWorker.notify_new_job"):
+        yield
+
+
+# Test: Enqueue and Fetch
+def test_enqueue_report_job(test_user):
+    """
+    Test that a new job is persisted in the queued state.
+    """
+    job = enqueue_report_job(user_id=test_user.id, tier=2)
+
+    fetched = get_job(job.id)
+    assert fetched is not None
+    assert fetched.status == JOB_QUEUED
+    assert fetched.tier == 2
+    assert fetched.attempts == 0
+
+
+# Test: Duplicate Requests Are Coalesced
+def test_enqueue_duplicate_request_shares_job(test_user):
+    """
+    Test that an identical request reuses the in-flight job, and a finished job does not block a new one.
+    """
+    first = enqueue_report_job(user_id=test_user.id, tier=2, user_data={"company_name": "Acme"})
+    second = enqueue_report_job(user_id=test_user.id, tier=2, user_data={"company_name": "Acme"})
+    other = enqueue_report_job(user_id=test_user.id, tier=3, user_data={"company_name": "Acme"})
+
+    assert second.id == first.id
+    assert other.id != first.id
+
+    claimed = claim_next_job("worker-a")
+    complete_job(claimed.id, "worker-a", report_id=None)
+
+    third = enqueue_report_job(user_id=test_user.id, tier=2, user_data={"company_name": "Acme"})
+    assert third.id != first.id
+
+
+# Test: Enqueue Gives Up Instead of Returning None
+def test_enqueue_raises_when_no_job_found():
+    """
+    Test that enqueue raises once its retries neither insert nor find an in-flight job.
+    """
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = None
+    session.query.return_value.filter.return_value.scalar.return_value = None
+
+    with patch("backend.src.services.reportJobService.get_db_session") as mock_get_session:
+        mock_get_session.return_value.__enter__.return_value = session
+        with pytest.raises(RuntimeError):
+            enqueue_report_job(user_id=1, tier=2)
+
+    assert session.execute.call_count == 3
+
+
+# Test: Claim, Heartbeat and Complete
+def test_claim_and_complete_job(test_user):
+    """
+    Test the happy path of a worker claiming and completing a job.
+    """
+    job = enqueue_report_job(user_id=test_user.id, tier=1)
+
+    claimed = claim_next_job("worker-a")
+    assert claimed.id == job.id
+    assert claimed.status == JOB_RUNNING
+    assert claimed.locked_by == "worker-a"
+    assert claimed.attempts == 1
+
+    # A second worker sees an empty queue.
+    assert claim_next_job("worker-b") is None
+
+    assert heartbeat_job(job.id, "worker-a") is True
+    assert heartbeat_job(job.id, "worker-b") is False
+
+    assert complete_job(job.id, "worker-a", report_id=None) is True
+    assert get_job(job.id).status == JOB_SUCCEEDED
+
+
+# Test: Failed Job
+def test_fail_job(test_user):
+    """
+    Test that a failed workflow is recorded with its error.
+    """
+    job = enqueue_report_job(user_id=test_user.id, tier=3)
+    claim_next_job("worker-a")
+
+    assert fail_job(job.id, "worker-a", "Payment not verified for the requested tier.") is True
+    failed = get_job(job.id)
+    assert failed.status == JOB_FAILED
+    assert failed.error == "Payment not verified for the requested tier."
+
+
+# Test: Invalid Requests Are Rejected Before Queueing
+@pytest.mark.parametrize("tier", [0, 4, "2", True])
+def test_enqueue_rejects_invalid_tier(test_user, tier):
+    """
+    Test that an unknown tier raises ValueError and queues nothing.
+    """
+    with pytest.raises(ValueError, match="Invalid report tier"):
+        enqueue_report_job(user_id=test_user.id, tier=tier)
+
+    with get_db_session() as session:
+        assert session.query(ReportJob).filter(ReportJob.user_id == test_user.id).count() == 0
+
+
+# Test: Unpaid Requests Are Rejected Before Queueing
+@patch("backend.src.services.reportService.paymentService.verify_payment", return_value=False)
+def test_enqueue_rejects_unverified_payment(mock_verify_payment, test_user):
+    """
+    Test that a tier the user has not paid for raises ValueError and queues nothing.
+    """
+    with pytest.raises(ValueError, match="Payment not verified"):
+        enqueue_report_job(user_id=test_user.id, tier=2)
+
+    mock_verify_payment.assert_called_once_with(test_user.id, 2)
+    with get_db_session() as session:
+        assert session.query(ReportJob).filter(ReportJob.user_id == test_user.id).count() == 0
+
+
+# Test: Transient Failures Are Retried
+def test_fail_job_requeues_retryable(test_user):
+    """
+    Test that a retryable failure requeues the job until its attempts are used up.
+    """
+    job = enqueue_report_job(user_id=test_user.id, tier=1)
+
+    for attempt in range(1, REPORT_JOB_MAX_ATTEMPTS + 1):
+        claimed = claim_next_job("worker-a")
+        assert claimed.id == job.id
+        assert fail_job(job.id, "worker-a", "S3 upload timed out", retryable=True) is True
+        retried = get_job(job.id)
+        assert retried.attempts == attempt
+        assert retried.error == "S3 upload timed out"
+        expected = JOB_FAILED if attempt == REPORT_JOB_MAX_ATTEMPTS else JOB_QUEUED
+        assert retried.status == expected
+
+    assert get_job(job.id).finished_at is not None
+
+
+# Test: Failure Classification
+def test_is_retryable():
+    """
+    Test that timeouts and dropped connections are retryable, also when wrapped,
+    and that workflow errors are not.
+    """
+    assert is_retryable(TimeoutError("render timed out"))
+    assert is_retryable(OperationalError("SELECT 1", {}, Exception("server closed the connection")))
+
+    try:
+        try:
+            raise ConnectionError("connection reset")
+        except ConnectionError as e:
+            raise Exception(f"Error generating or uploading PDF: {e}")
+    except Exception as wrapped:
+        assert is_retryable(wrapped)
+
+    assert not is_retryable(ValueError("Payment not verified for the requested tier."))
+    assert not is_retryable(Exception("Error generating or uploading PDF: bad template"))
+
+
+# Test: Expired Lease Is Requeued
+def test_requeue_expired_jobs(test_user):
+    """
+    Test that a job whose lease expired returns to the queue and rejects the stale worker.
+    """
+    job = enqueue_report_job(user_id=test_user.id, tier=1)
+    claim_next_job("worker-a")
+
+    with get_db_session() as session:
+        session.execute(
+            text("UPDATE report_jobs SET lease_expires_at = now() - interval '1 minute' WHERE id = :id"),
+            {"id": job.id}
+        )
+        session.commit()
+
+    assert requeue_expired_jobs() >= 1
+    assert get_job(job.id).status == JOB_QUEUED
+
+    # The original worker can no longer complete the job.
+    assert complete_job(job.id, "worker-a", report_id=None) is False
+
+
+# Test: Unknown Job
+def test_get_job_not_found():
+    """
+    Test retrieving a job ID that was never issued.
+    """
+    assert get_job("missing") is None
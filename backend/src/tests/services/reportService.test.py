@@ -1,10 +1,13 @@
 # backend/src/tests/services/reportService.test.py
 
 import pytest
+import threading
 from unittest.mock import patch, MagicMock
-from services.reportService import create_report, get_report
-from models.Report import Report
-from db.dbConfig import SessionLocal
+from backend.src.services.reportService import create_report, get_report_by_id, get_pdf_urls, get_reports_page
+from backend.src.models.Report import Report
+from backend.src.models.User import User
+from backend.src.db.dbConfig import SessionLocal
+from werkzeug.security import generate_password_hash
 from datetime import datetime
 
 
@@ -19,40 +22,111 @@ def db_session():
         session.close()
 
 
+# Fixture for the user owning the test reports
+@pytest.fixture
+def test_user(db_session):
+    user = User(
+        email="reportservice@example.com",
+        username="reportservice",
+        password_hash=generate_password_hash("password123")
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    yield user
+    db_session.rollback()
+    db_session.query(Report).filter(Report.user_id == user.id).delete()
+    db_session.delete(user)
+    db_session.commit()
+
+
 # Test: Report Creation Success
-@patch("services.reportService.llmService.generate_report_content")
-@patch("services.reportService.pdfGenerator.generate_pdf")
-@patch("services.reportService.upload_to_s3")
-def test_create_report_success(mock_upload_to_s3, mock_generate_pdf, mock_generate_report_content, db_session):
+@patch("backend.src.services.reportService.paymentService.verify_payment", return_value=True)
+@patch("backend.src.services.reportService.llmService.generate_report_content")
+@patch("backend.src.services.reportService.pdfGenerator.generate_pdf")
+def test_create_report_success(mock_generate_pdf, mock_generate_report_content, mock_verify_payment, test_user):
     """
     Test successful report creation.
     """
     # Mock dependencies
     mock_generate_report_content.return_value = "Generated report content"
-    mock_generate_pdf.return_value = "/tmp/report.pdf"
-    mock_upload_to_s3.return_value = "https://s3-bucket-url/report.pdf"
+    mock_generate_pdf.return_value = "reports/abc123.pdf"
 
     report = create_report(
-        user_id=1,
-        tier=2,
-        payment_status="Paid"
+        user_id=test_user.id,
+        tier=2
     )
 
     assert report is not None
-    assert report.user_id == 1
+    assert report.user_id == test_user.id
     assert report.tier == 2
-    assert report.payment_status == "Paid"
-    assert report.pdf_url == "https://s3-bucket-url/report.pdf"
+    assert report.payment_status == "PAID"
+    # Only the S3 key is stored; download URLs are minted on read.
+    assert report.pdf_key == "reports/abc123.pdf"
+    assert report.pdf_url is None
+
+
+# Test: Download URLs Are Minted On Read
+@patch("backend.src.services.reportService.pdfGenerator.get_presigned_urls")
+def test_get_pdf_urls(mock_get_presigned_urls):
+    """
+    Test that stored keys are signed in one batch and legacy reports keep their stored URL.
+    """
+    mock_get_presigned_urls.return_value = {"reports/abc123.pdf": "https://signed/abc123"}
+    reports = [
+        Report(id=1, pdf_key="reports/abc123.pdf"),
+        Report(id=2, pdf_key="reports/abc123.pdf"),
+        Report(id=3, pdf_url="https://s3-bucket-url/legacy.pdf"),
+    ]
+
+    urls = get_pdf_urls(reports)
+
+    mock_get_presigned_urls.assert_called_once_with(["reports/abc123.pdf", "reports/abc123.pdf"])
+    assert urls == {
+        1: "https://signed/abc123",
+        2: "https://signed/abc123",
+        3: "https://s3-bucket-url/legacy.pdf",
+    }
+
+
+# Test: Concurrent Identical Requests Are Coalesced
+@patch("backend.src.services.reportService._create_report")
+def test_create_report_single_flight(mock_create_report):
+    """
+    Test that concurrent identical requests run the workflow once and share the result.
+    """
+    release = threading.Event()
+    shared_report = MagicMock(id=7)
+
+    def slow_create(*args, **kwargs):
+        release.wait(5)
+        return shared_report
+
+    mock_create_report.side_effect = slow_create
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(create_report(user_id=1, tier=2)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert mock_create_report.call_count == 1
+    assert results == [shared_report] * 5
 
 
 # Test: Report Retrieval Success
-def test_get_report_success(db_session):
+def test_get_report_success(db_session, test_user):
     """
     Test successful retrieval of an existing report.
     """
     # Create a test report
     report = Report(
-        user_id=1,
+        user_id=test_user.id,
         tier=1,
         pdf_url="https://s3-bucket-url/test-report.pdf",
         payment_status="Paid",
@@ -62,16 +136,52 @@ def test_get_report_success(db_session):
     db_session.commit()
     db_session.refresh(report)
 
-    fetched_report = get_report(report.id)
+    fetched_report = get_report_by_id(report.id)
 
     assert fetched_report is not None
     assert fetched_report.id == report.id
     assert fetched_report.pdf_url == "https://s3-bucket-url/test-report.pdf"
 
 
+# Test: Keyset Pagination
+def test_get_reports_page(db_session, test_user):
+    """
+    Test that pages are newest first, do not overlap, and end with no cursor.
+    """
+    created = datetime(2024, 1, 1)
+    reports = [
+        Report(user_id=test_user.id, tier=1, payment_status="Paid", created_at=created)
+        for _ in range(3)
+    ]
+    db_session.add_all(reports)
+    db_session.commit()
+    # Same created_at for all three: the id tie-breaker must still order them.
+    expected = sorted((r.id for r in reports), reverse=True)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = get_reports_page(user_id=test_user.id, limit=2, after=cursor)
+        seen.extend(r.id for r in page)
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+# Test: Malformed Cursor
+def test_get_reports_page_invalid_cursor():
+    """
+    Test that a tampered cursor is rejected with ValueError.
+    """
+    with pytest.raises(ValueError):
+        get_reports_page(user_id=1, limit=2, after="not-a-cursor")
+
+
 # Test: Report Retrieval Failure (Non-existent Report)
 def test_get_report_not_found(db_session):
     """
     Test retrieval failure when report does not exist.
     """
-    fetched_report = get_report(99999)  # ID that d
+    fetched_report = get_report_by_id(99999)  # ID that does not exist
+
+    assert fetched_report is None
@@ -0,0 +1,71 @@
+# backend/src/tests/services/tokenRevocation.test.py
+
+import pytest
+import datetime
+from unittest.mock import patch
+from backend.src.services import tokenRevocation
+from backend.src.utils.bloomFilter import BloomFilter
+
+
+@pytest.fixture(autouse=True)
+def loaded_filter():
+    """
+    Start each test with an empty, freshly loaded filter and no cached answers.
+    """
+    tokenRevocation._bloom = BloomFilter(capacity=1000)
+    tokenRevocation._confirmed.clear()
+    with patch("backend.src.services.tokenRevocation._maybe_refresh"):
+        yield
+    tokenRevocation._bloom = None
+
+
+# Test: Bloom Filter Has No False Negatives
+def test_bloom_filter_membership():
+    """
+    Test that every added key is reported present and the false positive rate stays near target.
+    """
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+
+    assert all(f"jti-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+# Test: Unrevoked Tokens Skip the Store
+@patch("backend.src.services.tokenRevocation.get_db_session")
+def test_is_revoked_filter_miss(mock_get_db_session):
+    """
+    Test that a token absent from the filter is accepted without a database lookup.
+    """
+    assert tokenRevocation.is_revoked("never-revoked") is False
+    mock_get_db_session.assert_not_called()
+
+
+# Test: Revoked Tokens Are Rejected
+@patch("backend.src.services.tokenRevocation.get_db_session")
+def test_revoke_then_is_revoked(mock_get_db_session):
+    """
+    Test that a revoked token is rejected at once in the revoking worker, without a second lookup.
+    """
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+    tokenRevocation.revoke("abc123", 1, expires_at)
+    assert mock_get_db_session.call_count == 1
+
+    assert tokenRevocation.is_revoked("abc123") is True
+    assert mock_get_db_session.call_count == 1
+
+
+# Test: Filter Hits Are Confirmed Against the Store
+@patch("backend.src.services.tokenRevocation.get_db_session")
+def test_is_revoked_false_positive(mock_get_db_session):
+    """
+    Test that a filter hit for a token missing from the store is accepted.
+    """
+    tokenRevocation._bloom.add("false-positive")
+    session = mock_get_db_session.return_value.__enter__.return_value
+    session.query.return_value.filter.return_value.first.return_value = None
+
+    assert tokenRevocation.is_revoked("false-positive") is False
+    assert tokenRevocation.get_revocation_stats()["false_positives"] >= 1
@@ -0,0 +1,93 @@
+# backend/src/tests/services/userCache.test.py
+
+import pytest
+from unittest.mock import patch
+from backend.src.services import userCache
+from backend.src.services.userCache import AuthenticatedUser
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """
+    Start each test with an empty cache and no listener thread.
+    """
+    userCache._cache.clear()
+    with patch("backend.src.services.userCache.pgListener.ensure_started"):
+        yield
+    userCache._cache.clear()
+
+
+def _user(user_id=1):
+    return AuthenticatedUser(user_id, "cached@example.com", "cached", None, None)
+
+
+# Test: Repeat Lookups Skip the Database
+@patch("backend.src.services.userCache._load_user")
+def test_get_user_cached(mock_load_user):
+    """
+    Test that the second lookup for a user is served from the cache.
+    """
+    mock_load_user.return_value = _user()
+
+    first = userCache.get_user(1)
+    second = userCache.get_user(1)
+
+    assert first is second
+    assert mock_load_user.call_count == 1
+
+
+# Test: Unknown Users Are Not Cached
+@patch("backend.src.services.userCache._load_user")
+def test_get_user_not_found(mock_load_user):
+    """
+    Test that a missing user is looked up again on the next request.
+    """
+    mock_load_user.return_value = None
+
+    assert userCache.get_user(99999) is None
+    assert userCache.get_user(99999) is None
+    assert mock_load_user.call_count == 2
+
+
+# Test: Invalidation Forces a Reload
+@patch("backend.src.services.userCache.get_db_session")
+@patch("backend.src.services.userCache._load_user")
+def test_invalidate_user(mock_load_user, mock_get_db_session):
+    """
+    Test that invalidating a user evicts it locally and notifies other workers.
+    """
+    mock_load_user.return_value = _user()
+    userCache.get_user(1)
+
+    userCache.invalidate(1)
+    userCache.get_user(1)
+
+    assert mock_load_user.call_count == 2
+    session = mock_get_db_session.return_value.__enter__.return_value
+    notify_params = session.execute.call_args[0][1]
+    assert notify_params == {"channel": userCache.INVALIDATION_CHANNEL, "payload": "1"}
+
+
+# Test: A Lookup That Races an Invalidation Is Not Stored
+@patch("backend.src.services.userCache._load_user")
+def test_get_user_racing_invalidation(mock_load_user):
+    """
+    Test that a row read before an invalidation is returned but not cached.
+    """
+    def load_then_invalidate(user_id):
+        userCache.invalidate_local(user_id)
+        return _user(user_id)
+
+    mock_load_user.side_effect = load_then_invalidate
+
+    assert userCache.get_user(1).id == 1
+    assert 1 not in userCache._cache
+
+
+# Test: Snapshots Are Read-Only
+def test_authenticated_user_read_only():
+    """
+    Test that cached snapshots shared between requests cannot be modified.
+    """
+    with pytest.raises(AttributeError):
+        _user().username = "changed"
@@ -2,9 +2,10 @@
 
 import pytest
 from sqlalchemy.orm import Session
-from src.services.userService import UserService
-from src.models.User import User
-from src.db.dbClient import get_db_session
+from backend.src.services.userService import UserService
+from backend.src.models.User import User
+from backend.src.db.dbClient import get_db_session
+from backend.src.utils import passwordHasher
 from werkzeug.security import generate_password_hash, check_password_hash
 
 
@@ -90,6 +91,41 @@ def test_update_user_profile_not_found():
     assert updated_user is None
 
 
+def test_update_user_profile_password_uses_bcrypt(db_session, test_user):
+    """
+    Test that a changed password is stored in the scheme login checks against.
+    """
+    updated_user = UserService.update_user_profile(test_user.id, password="newpassword456")
+    assert passwordHasher.check_password("newpassword456", updated_user.password_hash)
+
+
+def test_update_user_profile_rejects_unknown_fields(db_session, test_user):
+    """
+    Test that fields outside the profile allowlist are rejected.
+    """
+    with pytest.raises(ValueError):
+        UserService.update_user_profile(test_user.id, is_admin=True)
+
+
+def test_update_user_profile_duplicate_email(db_session, test_user):
+    """
+    Test that taking another user's email raises ValueError rather than a database error.
+    """
+    other = User(
+        email="other@example.com",
+        username="otheruser",
+        password_hash=generate_password_hash("password123")
+    )
+    db_session.add(other)
+    db_session.commit()
+    try:
+        with pytest.raises(ValueError):
+            UserService.update_user_profile(test_user.id, email="other@example.com")
+    finally:
+        db_session.delete(other)
+        db_session.commit()
+
+
 def test_delete_user_success(db_session, test_user):
     """
     Test deleting a user successfully.
@@ -115,3 +151,41 @@ def test_list_users(db_session, test_user):
     users = UserService.list_users(limit=10, offset=0)
     assert len(users) >= 1
     assert any(user.id == test_user.id for user in users)
+
+
+def test_list_users_keyset(db_session, test_user):
+    """
+    Test that pages continue after the last ID seen and never repeat a user.
+    """
+    first_page = UserService.list_users(limit=1, after_id=test_user.id - 1)
+    assert [user.id for user in first_page] == [test_user.id]
+
+    next_page = UserService.list_users(limit=10, after_id=test_user.id)
+    assert all(user.id > test_user.id for user in next_page)
+
+
+def test_list_users_rejects_offset_with_keyset():
+    """
+    Test that offset and after_id cannot be combined.
+    """
+    with pytest.raises(ValueError):
+        UserService.list_users(limit=10, offset=5, after_id=1)
+
+
+def test_list_users_created_filter(db_session, test_user):
+    """
+    Test filtering users by creation time.
+    """
+    users = UserService.list_users(limit=10, after_id=test_user.id - 1, created_from=test_user.created_at)
+    assert any(user.id == test_user.id for user in users)
+
+    users = UserService.list_users(limit=10, after_id=test_user.id - 1, created_to=test_user.created_at)
+    assert all(user.id != test_user.id for user in users)
+
+
+def test_estimate_user_count(db_session, test_user):
+    """
+    Test that the planner estimate returns a non-negative integer.
+    """
+    assert UserService.estimate_user_count() >= 0
+    assert UserService.estimate_user_count(created_from=test_user.created_at) >= 0
@@ -0,0 +1,97 @@
+# backend/src/tests/utils/lruCache.test.py
+
+import pytest
+from backend.src.utils import lruCache
+from backend.src.utils.lruCache import LRUCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    A controllable monotonic clock for TTL tests.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(lruCache.time, "monotonic", lambda: now[0])
+    return now
+
+
+# Test: Least Recently Used Entry Is Evicted
+def test_evicts_least_recently_used():
+    """
+    Test that a read refreshes an entry, so the oldest unread entry is evicted first.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+# Test: Overwriting Refreshes Recency
+def test_set_existing_key_refreshes_recency():
+    """
+    Test that re-setting a key moves it to the most recently used position.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == 10
+    assert "b" not in cache
+
+
+# Test: Entries Expire After the Default TTL
+def test_default_ttl_expiry(clock):
+    """
+    Test that entries are served until their TTL elapses, then dropped.
+    """
+    cache = LRUCache(maxsize=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    clock[0] += 59
+    assert cache.get("a") == 1
+
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+# Test: Per-Entry TTL Overrides the Default
+def test_per_entry_ttl(clock):
+    """
+    Test that set(ttl_seconds=...) overrides the cache default, and None means no expiry.
+    """
+    cache = LRUCache(maxsize=10)
+    cache.set("short", 1, ttl_seconds=5)
+    cache.set("forever", 2)
+
+    clock[0] += 3600
+
+    assert cache.get("short") is None
+    assert cache.get("forever") == 2
+
+
+# Test: Stats, Delete and Clear
+def test_stats_delete_and_clear():
+    """
+    Test that hits and misses are counted and clear() resets them.
+    """
+    cache = LRUCache(maxsize=10)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+    cache.delete("a")
+
+    assert cache.stats() == {"size": 0, "maxsize": 10, "hits": 1, "misses": 1}
+
+    cache.clear()
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,56 @@
+# backend/src/tests/utils/passwordHasher.test.py
+
+import sys
+import types
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from backend.src.utils import passwordHasher
+
+
+def _fake_gevent_monkey(patched: bool):
+    module = types.ModuleType("gevent.monkey")
+    module.is_module_patched = lambda name: patched and name == "threading"
+    return module
+
+
+# Test: Plain Thread Pool Without gevent
+def test_executor_without_gevent(monkeypatch):
+    """
+    Test that a regular ThreadPoolExecutor is used when threading is not monkey-patched.
+    """
+    monkeypatch.setitem(sys.modules, "gevent.monkey", _fake_gevent_monkey(False))
+
+    executor = passwordHasher._new_executor()
+    try:
+        assert type(executor) is ThreadPoolExecutor
+    finally:
+        executor.shutdown()
+
+
+# Test: Native Threads Under gevent
+def test_executor_under_gevent(monkeypatch):
+    """
+    Test that gevent's native-thread executor is used once threading is monkey-patched,
+    so bcrypt never runs on greenlets.
+    """
+    threadpool = pytest.importorskip("gevent.threadpool")
+    monkeypatch.setitem(sys.modules, "gevent.monkey", _fake_gevent_monkey(True))
+
+    executor = passwordHasher._new_executor()
+    try:
+        assert isinstance(executor, threadpool.ThreadPoolExecutor)
+    finally:
+        executor.shutdown()
+
+
+# Test: Hash Round Trip
+def test_hash_and_check_password(monkeypatch):
+    """
+    Test that a hash produced on the pool verifies, and a wrong password does not.
+    """
+    monkeypatch.setattr(passwordHasher, "BCRYPT_ROUNDS", 4)
+
+    password_hash = passwordHasher.hash_password("s3cret")
+
+    assert passwordHasher.check_password("s3cret", password_hash)
+    assert not passwordHasher.check_password("wrong", password_hash)
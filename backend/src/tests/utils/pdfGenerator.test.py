@@ -0,0 +1,137 @@
+# backend/src/tests/utils/pdfGenerator.test.py
+
+import io
+import tempfile
+import pytest
+from unittest.mock import MagicMock
+from botocore.exceptions import ClientError
+from backend.src.utils import pdfGenerator
+
+
+@pytest.fixture(autouse=True)
+def s3(monkeypatch):
+    """
+    A stubbed S3 client, stubbed rendering and empty in-process caches.
+    """
+    client = MagicMock()
+    client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+    monkeypatch.setattr(pdfGenerator, "s3_client", client)
+    monkeypatch.setattr(pdfGenerator.pdfRenderPool, "render_pdf", MagicMock(return_value=b"%PDF-1.7"))
+    pdfGenerator._known_pdf_keys.clear()
+    pdfGenerator._presigned_urls.clear()
+    yield client
+    pdfGenerator._known_pdf_keys.clear()
+    pdfGenerator._presigned_urls.clear()
+
+
+# Test: Content Keys Are Stable
+def test_content_key_stable():
+    """
+    Test that the same HTML always maps to the same key, and different HTML does not.
+    """
+    key = pdfGenerator._content_key("<p>report</p>")
+
+    assert key == pdfGenerator._content_key("<p>report</p>")
+    assert key != pdfGenerator._content_key("<p>other report</p>")
+    assert key.startswith("reports/") and key.endswith(".pdf")
+
+
+# Test: Render Version and Stylesheet Salt the Key
+def test_content_key_salted_by_version_and_css(monkeypatch):
+    """
+    Test that bumping PDF_RENDER_VERSION or changing BASE_CSS produces new keys.
+    """
+    key = pdfGenerator._content_key("<p>report</p>")
+
+    monkeypatch.setattr(pdfGenerator, "PDF_RENDER_VERSION", pdfGenerator.PDF_RENDER_VERSION + "-next")
+    bumped = pdfGenerator._content_key("<p>report</p>")
+    assert bumped != key
+
+    monkeypatch.setattr(pdfGenerator.pdfRenderPool, "BASE_CSS", pdfGenerator.pdfRenderPool.BASE_CSS + "p {}")
+    assert pdfGenerator._content_key("<p>report</p>") not in (key, bumped)
+
+
+# Test: Known Keys Skip Rendering and the HEAD Request
+def test_known_key_skips_render_and_head(s3):
+    """
+    Test that a second identical request reuses the key without touching S3 or the renderer.
+    """
+    first = pdfGenerator.generate_pdf("content", "watermark")
+    second = pdfGenerator.generate_pdf("content", "watermark")
+
+    assert first == second
+    assert pdfGenerator.pdfRenderPool.render_pdf.call_count == 1
+    assert s3.upload_fileobj.call_count == 1
+    assert s3.head_object.call_count == 1
+
+
+# Test: Existing Objects Are Reused
+def test_existing_object_not_rerendered(s3):
+    """
+    Test that an object already in S3 (e.g., uploaded by another worker) is not rendered again.
+    """
+    s3.head_object.side_effect = None
+
+    pdf_key = pdfGenerator.generate_pdf("content", "watermark")
+
+    assert pdfGenerator._known_pdf_keys.get(pdf_key) is True
+    pdfGenerator.pdfRenderPool.render_pdf.assert_not_called()
+    s3.upload_fileobj.assert_not_called()
+
+
+# Test: Upload Streams From Memory With the Transfer Config
+def test_upload_from_memory(s3, monkeypatch, tmp_path):
+    """
+    Test that the rendered bytes are uploaded from a BytesIO with transfer_config,
+    and no temporary file is created.
+    """
+    def no_temp_files(*args, **kwargs):
+        raise AssertionError("PDF upload must not write a temporary file")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+    monkeypatch.setattr(tempfile, "mkstemp", no_temp_files)
+    monkeypatch.chdir(tmp_path)
+
+    pdf_key = pdfGenerator.generate_pdf("content", "watermark")
+
+    s3.upload_fileobj.assert_called_once()
+    kwargs = s3.upload_fileobj.call_args.kwargs
+    assert isinstance(kwargs["Fileobj"], io.BytesIO)
+    assert kwargs["Fileobj"].getvalue() == b"%PDF-1.7"
+    assert kwargs["Bucket"] == pdfGenerator.S3_BUCKET_NAME
+    assert kwargs["Key"] == pdf_key
+    assert kwargs["ExtraArgs"] == {"ContentType": "application/pdf"}
+    assert kwargs["Config"] is pdfGenerator.transfer_config
+    assert list(tmp_path.iterdir()) == []
+
+
+# Test: Batch Signing Reuses Cached URLs
+def test_presigned_urls_batch_cache(s3):
+    """
+    Test that a batch signs each missing key once and later batches reuse the cached URLs.
+    """
+    s3.generate_presigned_url.side_effect = lambda ClientMethod, Params, ExpiresIn: f"https://signed/{Params['Key']}"
+
+    urls = pdfGenerator.get_presigned_urls(["reports/a.pdf", "reports/b.pdf", "reports/a.pdf"])
+    assert urls == {"reports/a.pdf": "https://signed/reports/a.pdf", "reports/b.pdf": "https://signed/reports/b.pdf"}
+    assert s3.generate_presigned_url.call_count == 2
+
+    urls = pdfGenerator.get_presigned_urls(["reports/b.pdf", "reports/c.pdf"])
+    assert set(urls) == {"reports/b.pdf", "reports/c.pdf"}
+    assert s3.generate_presigned_url.call_count == 3
+    assert s3.generate_presigned_url.call_args.kwargs["ExpiresIn"] == pdfGenerator.PRESIGNED_URL_EXPIRES_SECONDS
+
+
+# Test: A Margin Covering the Whole Lifetime Disables Caching
+def test_presigned_urls_not_cached_without_ttl(s3, monkeypatch):
+    """
+    Test that URLs are not cached when the refresh margin leaves no lifetime to cache.
+    """
+    monkeypatch.setattr(pdfGenerator, "PRESIGNED_URL_REFRESH_MARGIN_SECONDS", pdfGenerator.PRESIGNED_URL_EXPIRES_SECONDS)
+    s3.generate_presigned_url.return_value = "https://signed/a"
+
+    pdfGenerator.get_presigned_urls(["reports/a.pdf"])
+    pdfGenerator.get_presigned_urls(["reports/a.pdf"])
+
+    assert s3.generate_presigned_url.call_count == 2
+    assert len(pdfGenerator._presigned_urls) == 0
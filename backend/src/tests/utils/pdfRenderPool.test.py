@@ -0,0 +1,155 @@
+# backend/src/tests/utils/pdfRenderPool.test.py
+
+import pytest
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from backend.src.utils import pdfRenderPool
+
+
+class FakeProcess:
+    """
+    Stands in for a renderer process.
+    """
+
+    def __init__(self):
+        self.terminated = False
+
+    def is_alive(self):
+        return not self.terminated
+
+    def terminate(self):
+        self.terminated = True
+
+
+class FakePool:
+    """
+    Stands in for ProcessPoolExecutor: runs submitted calls inline, and can be told
+    to report a broken pool, or to hang (never finish), instead.
+    """
+    instances = []
+    break_next = False
+    hang_next = False
+
+    def __init__(self, max_workers, mp_context, initializer):
+        self.broken = FakePool.break_next
+        self.hang = FakePool.hang_next
+        FakePool.break_next = False
+        FakePool.hang_next = False
+        self.shutdown_calls = []
+        self._processes = {pid: FakeProcess() for pid in range(max_workers)}
+        FakePool.instances.append(self)
+
+    def submit(self, fn, *args):
+        future = Future()
+        if self.broken:
+            future.set_exception(BrokenProcessPool("renderer died"))
+        elif not self.hang:
+            future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdown_calls.append(wait)
+
+
+@pytest.fixture(autouse=True)
+def fake_pool(monkeypatch):
+    """
+    Two fake renderer processes, recycled after two renders each, with rendering stubbed.
+    """
+    FakePool.instances = []
+    FakePool.break_next = False
+    FakePool.hang_next = False
+    monkeypatch.setattr(pdfRenderPool, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(pdfRenderPool, "_render", lambda html: (b"%PDF-" + html.encode(), 10.0))
+    monkeypatch.setattr(pdfRenderPool, "RENDER_PROCESSES", 2)
+    monkeypatch.setattr(pdfRenderPool, "RENDER_RECYCLE_AFTER", 2)
+    monkeypatch.setattr(pdfRenderPool, "RENDER_MAX_RSS_MB", 512)
+    monkeypatch.setattr(pdfRenderPool, "RENDER_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(pdfRenderPool, "_pool", None)
+    monkeypatch.setattr(pdfRenderPool, "_pool_renders", 0)
+    yield
+
+
+# Test: Pool Is Recycled After RENDER_RECYCLE_AFTER Renders per Process
+def test_pool_recycled_after_render_budget():
+    """
+    Test that the pool is retired after RENDER_RECYCLE_AFTER * RENDER_PROCESSES renders,
+    and the next render starts a fresh one.
+    """
+    for _ in range(4):
+        assert pdfRenderPool.render_pdf("doc") == b"%PDF-doc"
+
+    assert len(FakePool.instances) == 1
+    assert FakePool.instances[0].shutdown_calls == [False]
+    assert pdfRenderPool._pool is None
+
+    pdfRenderPool.render_pdf("doc")
+    assert len(FakePool.instances) == 2
+    assert pdfRenderPool._pool_renders == 1
+
+
+# Test: Broken Pool Is Replaced and the Render Retried
+def test_broken_pool_retried_once():
+    """
+    Test that a BrokenProcessPool retires the pool and the render succeeds on a new one.
+    """
+    FakePool.break_next = True
+
+    assert pdfRenderPool.render_pdf("doc") == b"%PDF-doc"
+
+    broken, replacement = FakePool.instances
+    assert broken.shutdown_calls == [False]
+    assert pdfRenderPool._pool is replacement
+
+
+# Test: Broken Pool Twice in a Row
+def test_broken_pool_retry_failure_propagates(monkeypatch):
+    """
+    Test that the retry is attempted only once.
+    """
+    monkeypatch.setattr(FakePool, "__init__", _always_broken_init)
+
+    with pytest.raises(BrokenProcessPool):
+        pdfRenderPool.render_pdf("doc")
+    assert len(FakePool.instances) == 2
+
+
+# Test: High RSS Recycles the Pool
+def test_pool_recycled_on_high_rss(monkeypatch):
+    """
+    Test that a renderer reporting RSS above RENDER_MAX_RSS_MB retires the pool.
+    """
+    monkeypatch.setattr(pdfRenderPool, "_render", lambda html: (b"%PDF", 1024.0))
+
+    pdfRenderPool.render_pdf("doc")
+
+    assert FakePool.instances[0].shutdown_calls == [False]
+    assert pdfRenderPool._pool is None
+
+
+# Test: Timed-Out Render Frees Its Slot
+def test_pool_terminated_on_timeout():
+    """
+    Test that a render exceeding RENDER_TIMEOUT_SECONDS retires the pool, terminates
+    its processes, and the next render starts a fresh one.
+    """
+    FakePool.hang_next = True
+
+    with pytest.raises(FutureTimeoutError):
+        pdfRenderPool.render_pdf("doc")
+
+    hung = FakePool.instances[0]
+    assert hung.shutdown_calls == [False]
+    assert all(process.terminated for process in hung._processes.values())
+    assert pdfRenderPool._pool is None
+
+    assert pdfRenderPool.render_pdf("doc") == b"%PDF-doc"
+    assert len(FakePool.instances) == 2
+
+
+def _always_broken_init(self, max_workers, mp_context, initializer):
+    self.broken = True
+    self.hang = False
+    self._processes = {}
+    self.shutdown_calls = []
+    FakePool.instances.append(self)
@@ -0,0 +1,60 @@
+"""
+bloomFilter.py
+
+This module provides a compact, in-process Bloom filter: a set membership test that
+can return false positives but never false negatives. It lets hot paths skip a lookup
+in an authoritative store for the (vast majority of) keys that are definitely absent;
+see services/tokenRevocation.py.
+
+Usage:
+    bloom = BloomFilter(capacity=100000, error_rate=0.001)
+    bloom.add("a1b2c3")
+    if "a1b2c3" in bloom:   # maybe present -> check the real store
+        ...
+
+Best Practices:
+- Size capacity for the expected number of keys. Past it, the false positive rate
+  climbs quickly.
+- Entries cannot be removed. Rebuild the filter to drop them.
+"""
+
+import math
+import hashlib
+
+
+class BloomFilter:
+    """
+    Bloom filter over string keys, using double hashing of one BLAKE2b digest.
+
+    :param capacity: Number of keys the filter is sized for.
+    :param error_rate: Target false positive rate at capacity.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def add(self, key: str):
+        """
+        Adds a key to the filter.
+        """
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self):
+        return self.count
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
@@ -0,0 +1,76 @@
+"""
+httpCache.py
+
+This module implements conditional GET for read endpoints that clients poll. An
+endpoint derives a weak ETag from a few cheap values that change whenever its
+response would (e.g., the newest report's id and created_at), and answers
+304 Not Modified when the client already has that version:
+
+    etag = httpCache.make_etag("reports", user_id, newest_id, newest_created_at)
+    if httpCache.etag_matches(request.headers.get("If-None-Match"), etag):
+        return httpCache.not_modified(etag)
+
+We expose:
+- make_etag(*parts) -> str
+- etag_matches(if_none_match, etag) -> bool
+- not_modified(etag) -> Response
+- url_window() -> int
+
+Best Practices:
+- Compute the ETag before the expensive part of the endpoint (full query, URL signing,
+  serialization), so a 304 skips it.
+- Weak ETags (W/"...") promise equivalent content, not identical bytes, so they stay
+  valid when the response is compressed.
+"""
+
+import time
+import hashlib
+from flask import make_response
+from backend.src.utils import pdfGenerator
+
+
+def make_etag(*parts) -> str:
+    """
+    Returns a weak ETag for the given values (anything with a stable str()).
+    """
+    digest = hashlib.sha1("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Returns whether an If-None-Match header value matches etag, using the weak
+    comparison required for If-None-Match.
+
+    :param if_none_match: The raw header value, or None.
+    :param etag: The current ETag, as returned by make_etag.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(candidate) == opaque for candidate in if_none_match.split(","))
+
+
+def not_modified(etag: str):
+    """
+    Builds an empty 304 response carrying the ETag.
+    """
+    response = make_response("", 304)
+    response.headers["ETag"] = etag
+    return response
+
+
+def url_window() -> int:
+    """
+    Returns the current pre-signed URL window. Responses that embed pre-signed PDF
+    URLs include it in their ETag, so a client revalidating a cached body gets fresh
+    URLs before the ones it holds expire.
+    """
+    return int(time.time() // pdfGenerator.PRESIGNED_URL_REFRESH_MARGIN_SECONDS)
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
@@ -0,0 +1,98 @@
+"""
+lruCache.py
+
+This module provides a small thread-safe, in-process LRU cache with optional
+per-entry TTL. It is shared by the caching layers in the backend (e.g., the PDF
+key index in pdfGenerator.py) so they all behave the same way.
+
+Best Practices:
+- Always bound the cache with maxsize; the cache lives for the lifetime of the worker.
+- Use a TTL for anything that can change outside this process.
+- Caches are per process. Do not rely on them for correctness across workers.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with optional expiry.
+
+    :param maxsize: Maximum number of entries kept; the least recently used entry
+                    is evicted when the cache is full.
+    :param ttl_seconds: Default lifetime of an entry in seconds, or None for no expiry.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for key, or default if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl_seconds: float = None):
+        """
+        Stores value under key. ttl_seconds overrides the cache default for this entry.
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Removes key from the cache if present.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """
+        Removes every entry and resets the hit/miss counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the current size and hit/miss counters.
+        """
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
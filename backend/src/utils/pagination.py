@@ -0,0 +1,92 @@
+"""
+pagination.py
+
+This module provides keyset (cursor) pagination helpers. Instead of OFFSET, a page
+request carries the sort key of the last row the client saw, and the next page is
+fetched with a row-value comparison that an index can seek to directly:
+
+    WHERE (created_at, id) < (:last_created_at, :last_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit
+
+so page N costs the same as page 1 no matter how many rows precede it.
+
+Cursors are opaque to clients: URL-safe base64 of the JSON-encoded sort key.
+
+We expose:
+- encode_cursor(values) -> str
+- decode_cursor(token, types) -> tuple
+- clamp_limit(value, default, maximum) -> int
+
+Best Practices:
+- Always order by a unique key (append the primary key as a tie-breaker).
+- Fetch limit + 1 rows to learn whether another page exists without a COUNT.
+- Cursors are not signed. Always apply authorization filters (e.g., user_id) in the
+  query itself, never rely on the cursor for them.
+"""
+
+import json
+import base64
+import binascii
+import datetime
+
+
+def encode_cursor(values: tuple) -> str:
+    """
+    Encodes a row's sort key as an opaque cursor.
+
+    :param values: The sort key values (ints, strings or datetimes).
+    :return: A URL-safe cursor string.
+    """
+    encoded = [v.isoformat() if isinstance(v, datetime.datetime) else v for v in values]
+    raw = json.dumps(encoded, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, types: tuple) -> tuple:
+    """
+    Decodes a cursor produced by encode_cursor.
+
+    :param token: The cursor from the client.
+    :param types: The expected type of each value (int, str or datetime.datetime).
+    :return: The sort key values as a tuple.
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid pagination cursor.") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid pagination cursor.")
+
+    decoded = []
+    for value, expected in zip(values, types):
+        try:
+            if expected is datetime.datetime:
+                decoded.append(datetime.datetime.fromisoformat(value))
+            elif isinstance(value, expected) and not isinstance(value, bool):
+                decoded.append(value)
+            else:
+                raise TypeError(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor.") from e
+    return tuple(decoded)
+
+
+def clamp_limit(value, default: int, maximum: int) -> int:
+    """
+    Parses a client-supplied page size, falling back to default and capping at maximum.
+
+    :raises ValueError: If the value is not a positive integer.
+    """
+    if value is None or value == "":
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError("limit must be a positive integer.") from e
+    if limit < 1:
+        raise ValueError("limit must be a positive integer.")
+    return min(limit, maximum)
@@ -0,0 +1,160 @@
+"""
+passwordHasher.py
+
+This module runs bcrypt hashing and verification on a dedicated, size-bounded thread
+pool with admission control. Each bcrypt operation costs 100-300 ms of CPU; run inline
+in request threads, a burst of logins occupies every thread of a worker and starves
+unrelated requests. bcrypt releases the GIL while it works, so a small pool caps how
+much CPU hashing can take while other requests keep running.
+
+Admission control keeps the queue short: at most GFVRHO_BCRYPT_MAX_PENDING operations
+may be running or waiting at once. Beyond that, callers get PasswordHasherBusy right
+away, so the endpoint can answer 503 instead of queueing without limit.
+
+We expose:
+- hash_password(password) -> str
+- check_password(password, password_hash) -> bool
+- hash_password_async / check_password_async: the same, awaited from asyncio code
+  without blocking the event loop (see asgi.py)
+- get_pool_stats() -> dict
+- PasswordHasherBusy
+
+Best Practices:
+- Size GFVRHO_BCRYPT_WORKERS below the cores available to the worker so hashing
+  cannot consume all of them.
+- Do not hold a database session while waiting on the pool.
+- The pool always uses native threads. Under gevent's monkey patching (gunicorn's
+  gevent worker class), a plain ThreadPoolExecutor would run bcrypt on greenlets and
+  block the whole worker for every hash, so gevent's native-thread executor is used
+  instead; greenlets waiting on it yield to the others.
+"""
+
+import os
+import sys
+import bcrypt
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+BCRYPT_WORKERS = int(os.environ.get("GFVRHO_BCRYPT_WORKERS", max(1, (os.cpu_count() or 2) // 2)))
+BCRYPT_MAX_PENDING = int(os.environ.get("GFVRHO_BCRYPT_MAX_PENDING", BCRYPT_WORKERS * 4))
+BCRYPT_ROUNDS = int(os.environ.get("GFVRHO_BCRYPT_ROUNDS", 12))
+
+
+def _new_executor():
+    """
+    Returns the hashing pool: gevent's native-thread executor when threading has been
+    monkey-patched by gevent, a regular ThreadPoolExecutor otherwise.
+    """
+    gevent_monkey = sys.modules.get("gevent.monkey")
+    if gevent_monkey is not None and gevent_monkey.is_module_patched("threading"):
+        from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+        return NativeThreadPoolExecutor(max_workers=BCRYPT_WORKERS)
+    return ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+
+
+_executor = _new_executor()
+_admission = threading.BoundedSemaphore(BCRYPT_MAX_PENDING)
+_stats = {"completed": 0, "rejected": 0}
+_stats_lock = threading.Lock()
+
+
+class PasswordHasherBusy(Exception):
+    """
+    Raised when the hashing pool is saturated and the request should be retried later.
+    """
+
+
+def hash_password(password: str) -> str:
+    """
+    Hashes a password with a fresh salt on the hashing pool.
+
+    :param password: The plaintext password.
+    :return: The bcrypt hash as a string.
+    :raises PasswordHasherBusy: If the pool is saturated.
+    """
+    hashed = _run(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return hashed.decode('utf-8')
+
+
+def check_password(password: str, password_hash: str) -> bool:
+    """
+    Verifies a password against a stored bcrypt hash on the hashing pool.
+
+    :param password: The plaintext password to verify.
+    :param password_hash: The stored bcrypt hash.
+    :return: True if the password matches.
+    :raises PasswordHasherBusy: If the pool is saturated.
+    """
+    return _run(bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8'))
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Async variant of hash_password.
+
+    :raises PasswordHasherBusy: If the pool is saturated.
+    """
+    hashed = await _run_async(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return hashed.decode('utf-8')
+
+
+async def check_password_async(password: str, password_hash: str) -> bool:
+    """
+    Async variant of check_password.
+
+    :raises PasswordHasherBusy: If the pool is saturated.
+    """
+    return await _run_async(bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8'))
+
+
+def get_pool_stats() -> dict:
+    """
+    Returns the pool configuration and completed/rejected counters for this process.
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["workers"] = BCRYPT_WORKERS
+    stats["max_pending"] = BCRYPT_MAX_PENDING
+    return stats
+
+
+def _run(fn, *args):
+    """
+    Runs fn on the pool if a slot is free, and waits for its result.
+    """
+    result = _submit(fn, *args).result()
+    _count("completed")
+    return result
+
+
+async def _run_async(fn, *args):
+    """
+    Runs fn on the pool if a slot is free, and awaits its result.
+    """
+    result = await asyncio.wrap_future(_submit(fn, *args))
+    _count("completed")
+    return result
+
+
+def _submit(fn, *args):
+    """
+    Admits and submits fn to the pool, returning its Future.
+    """
+    if not _admission.acquire(blocking=False):
+        _count("rejected")
+        raise PasswordHasherBusy("Too many authentication requests in progress. Please retry shortly.")
+
+    try:
+        future = _executor.submit(fn, *args)
+    except Exception:
+        _admission.release()
+        raise
+    # Release the slot when the work finishes, even if the caller stops waiting.
+    future.add_done_callback(lambda _: _admission.release())
+    return future
+
+
+def _count(counter: str):
+    with _stats_lock:
+        _stats[counter] += 1
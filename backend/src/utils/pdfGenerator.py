@@ -3,16 +3,22 @@ pdfGenerator.py
 
 This module defines functionality for generating a PDF from textual content and uploading it
 to an S3 bucket. The generate_pdf function produces the PDF, applies a watermark, uploads it
-to S3, and returns the file's public URL (or a pre-signed URL, depending on your needs).
+to S3, and returns the object's key. Download URLs are pre-signed at read time with
+get_presigned_url / get_presigned_urls, so stored reports never hold an expired link.
+
+PDFs are content-addressed: the S3 key is a hash of the rendered HTML (content plus
+watermark), so byte-identical requests reuse the existing object and skip both the
+WeasyPrint render and the upload. An in-process LRU index of known keys lets repeat
+hits skip the S3 HEAD request as well.
 
 Best Practices:
 1. Store S3 credentials and configuration in environment variables or a secure vault (e.g., AWS Secrets Manager).
-2. Use a temporary location for PDF generation, or generate in-memory if feasible.
-3. Handle file cleanup and exceptions gracefully to avoid resource leaks.
+2. PDFs are rendered in memory (by the renderer pool in pdfRenderPool.py) and uploaded
+   from there, so there are no temp files to clean up on the container disk.
+3. Handle exceptions gracefully to avoid resource leaks.
 
 Dependencies:
-- WeasyPrint, ReportLab, or another Python PDF library. Below we demonstrate WeasyPrint for
-  HTML-based PDF generation. Adjust as needed for your use case.
+- WeasyPrint for HTML-based PDF generation, run in renderer processes by pdfRenderPool.py.
 - Boto3 for AWS S3 integration.
 
 Notes:
@@ -22,55 +28,77 @@ Notes:
   ACL or pre-signed URL policy if you need a public link.
 """
 
+import io
 import os
-import uuid
 import boto3
-import tempfile
-from weasyprint import HTML, CSS
+import logging
+import hashlib
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from backend.src.utils import pdfRenderPool
+from backend.src.utils.lruCache import LRUCache
 
 # Example environment variables for S3
 S3_BUCKET_NAME = os.environ.get("GFVRHO_S3_BUCKET_NAME", "CHANGE_ME")
 AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
 
+# Bump when the HTML template or rendering options change, so cached PDFs are not reused.
+PDF_RENDER_VERSION = "2"
+PDF_KEY_INDEX_SIZE = int(os.environ.get("GFVRHO_PDF_KEY_INDEX_SIZE", 10000))
+
+# Download URLs are minted on read. A cached URL is replaced this long before it expires.
+PRESIGNED_URL_EXPIRES_SECONDS = int(os.environ.get("GFVRHO_PRESIGNED_URL_EXPIRES_SECONDS", 3600))
+PRESIGNED_URL_REFRESH_MARGIN_SECONDS = int(os.environ.get("GFVRHO_PRESIGNED_URL_REFRESH_MARGIN_SECONDS", 300))
+PRESIGNED_URL_CACHE_SIZE = int(os.environ.get("GFVRHO_PRESIGNED_URL_CACHE_SIZE", 10000))
+
+logger = logging.getLogger(__name__)
+
+# The margin must be positive (httpCache.url_window divides by it) and leave part of
+# each URL's lifetime to cache it for; clamp misconfigured values to half the expiry.
+_margin = max(1, min(PRESIGNED_URL_REFRESH_MARGIN_SECONDS, PRESIGNED_URL_EXPIRES_SECONDS // 2))
+if _margin != PRESIGNED_URL_REFRESH_MARGIN_SECONDS:
+    logger.warning(
+        "GFVRHO_PRESIGNED_URL_REFRESH_MARGIN_SECONDS=%d does not fit a %d s URL lifetime; using %d",
+        PRESIGNED_URL_REFRESH_MARGIN_SECONDS, PRESIGNED_URL_EXPIRES_SECONDS, _margin
+    )
+    PRESIGNED_URL_REFRESH_MARGIN_SECONDS = _margin
+
+MB = 1024 * 1024
+
 s3_client = boto3.client("s3", region_name=AWS_REGION)
 
+# Most reports fit in a single PUT; only large ones switch to parallel multipart uploads.
+transfer_config = TransferConfig(
+    multipart_threshold=int(os.environ.get("GFVRHO_S3_MULTIPART_THRESHOLD_MB", 16)) * MB,
+    multipart_chunksize=int(os.environ.get("GFVRHO_S3_MULTIPART_CHUNKSIZE_MB", 8)) * MB,
+    max_concurrency=int(os.environ.get("GFVRHO_S3_MAX_CONCURRENCY", 4)),
+    use_threads=True
+)
+
+# Keys known to exist in S3. Objects are never deleted by the app, so entries do not expire.
+_known_pdf_keys = LRUCache(maxsize=PDF_KEY_INDEX_SIZE)
+
+# Pre-signed download URLs by key, expiring ahead of the URLs themselves.
+_presigned_urls = LRUCache(maxsize=PRESIGNED_URL_CACHE_SIZE)
+
 def generate_pdf(content: str, watermark_text: str) -> str:
     """
     Generates a PDF from the provided content, applies a watermark, uploads the PDF to S3,
-    and returns the S3 file URL.
+    and returns the S3 object key. If a PDF for identical content and watermark was already
+    uploaded, it is reused without rendering or uploading again.
+
+    Callers store the key and mint a download URL when the report is read
+    (see get_presigned_url), because pre-signed URLs expire.
 
     :param content: The textual (HTML) content for the PDF body.
     :param watermark_text: A watermark message to overlay on each page.
-    :return: A string containing the S3 URL or pre-signed URL of the uploaded PDF.
+    :return: The S3 key of the uploaded PDF.
     :raises Exception: If PDF generation or upload fails.
     """
     # 1. Convert the textual content to simple HTML structure for WeasyPrint.
-    #    Real usage might involve more complex HTML/CSS for styling.
+    #    Styling comes from pdfRenderPool.BASE_CSS, which renderers compile once.
     html_content = f"""
     <html>
-      <head>
-        <style>
-          /* Example styling */
-          body {{
-            font-family: Arial, sans-serif;
-            margin: 2em;
-          }}
-          .watermark {{
-            position: fixed;
-            top: 50%%; 
-            left: 50%%; 
-            transform: translate(-50%%, -50%%);
-            font-size: 48px;
-            color: rgba(100, 100, 100, 0.2);
-            z-index: 9999;
-            pointer-events: none;
-          }}
-          .report-content {{
-            position: relative;
-            z-index: 1;
-          }}
-        </style>
-      </head>
       <body>
         <div class="watermark">{watermark_text}</div>
         <div class="report-content">
@@ -81,49 +109,121 @@ def generate_pdf(content: str, watermark_text: str) -> str:
     """
 
     # We could also do a multi-step approach for advanced watermarking (e.g., multiple pages),
-    # but for simplicity, we use a CSS overlay approach above.
+    # but for simplicity, we use a CSS overlay approach (see BASE_CSS).
 
     try:
-        # 2. Generate the PDF in a temporary file.
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-            tmp_pdf_path = tmp_pdf.name
+        # 2. Derive the S3 key from the rendered inputs. Identical content and watermark
+        #    always map to the same object, so a repeat request can reuse it.
+        pdf_key = _content_key(html_content)
 
-        HTML(string=html_content).write_pdf(tmp_pdf_path, stylesheets=[CSS(string="")])
+        # 3. Render and upload only if the object does not exist yet.
+        if not _pdf_exists(pdf_key):
+            _render_and_upload(html_content, pdf_key)
+            _known_pdf_keys.set(pdf_key, True)
 
-        # 3. Upload the PDF to S3.
-        #    Generate a unique key so we don't overwrite existing files.
-        pdf_key = f"reports/{uuid.uuid4()}.pdf"
+        return pdf_key
 
-        with open(tmp_pdf_path, "rb") as file_data:
-            s3_client.upload_fileobj(
-                Fileobj=file_data,
-                Bucket=S3_BUCKET_NAME,
-                Key=pdf_key,
-                ExtraArgs={"ContentType": "application/pdf"}
-            )
+    except Exception as e:
+        raise Exception(f"Error generating or uploading PDF: {str(e)}")
 
-        # 4. Construct a public or pre-signed URL for the uploaded PDF (depending on your needs).
 
-        # Option A: If the S3 bucket is public or you set the object ACL to public-read, 
-        # build a public URL. (Not recommended for sensitive data.)
-        # public_url = f"https://{S3_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{pdf_key}"
+def get_presigned_url(pdf_key: str) -> str:
+    """
+    Returns a pre-signed download URL for a stored PDF.
+    URLs are cached until PRESIGNED_URL_REFRESH_MARGIN_SECONDS before they expire,
+    so every URL handed out stays valid for at least that long.
+
+    :param pdf_key: The S3 key returned by generate_pdf.
+    :return: A pre-signed URL valid for up to PRESIGNED_URL_EXPIRES_SECONDS.
+    """
+    return get_presigned_urls([pdf_key])[pdf_key]
+
+
+def get_presigned_urls(pdf_keys: list) -> dict:
+    """
+    Batch variant of get_presigned_url for list endpoints. Cached URLs are reused
+    and only the missing keys are signed, each at most once per call.
 
-        # Option B: Generate a pre-signed URL that expires after a certain time.
-        # This is more secure if you want temporary access.
-        presigned_url = s3_client.generate_presigned_url(
+    :param pdf_keys: S3 keys returned by generate_pdf (duplicates are fine).
+    :return: A dictionary mapping each key to its pre-signed URL.
+    """
+    urls = {}
+    missing = []
+    for pdf_key in dict.fromkeys(pdf_keys):
+        url = _presigned_urls.get(pdf_key)
+        if url is None:
+            missing.append(pdf_key)
+        else:
+            urls[pdf_key] = url
+
+    # Option A: If the S3 bucket is public or you set the object ACL to public-read, 
+    # build a public URL. (Not recommended for sensitive data.)
+    # public_url = f"https://{S3_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{pdf_key}"
+
+    # Option B: Generate a pre-signed URL that expires after a certain time.
+    # Signing is a local HMAC computation, so no request is made to S3 here.
+    cache_ttl = max(PRESIGNED_URL_EXPIRES_SECONDS - PRESIGNED_URL_REFRESH_MARGIN_SECONDS, 0)
+    for pdf_key in missing:
+        url = s3_client.generate_presigned_url(
             ClientMethod="get_object",
             Params={
                 "Bucket": S3_BUCKET_NAME,
                 "Key": pdf_key
             },
-            ExpiresIn=3600  # 1 hour
+            ExpiresIn=PRESIGNED_URL_EXPIRES_SECONDS
         )
+        if cache_ttl > 0:
+            _presigned_urls.set(pdf_key, url, ttl_seconds=cache_ttl)
+        urls[pdf_key] = url
 
-        return presigned_url
+    return urls
 
-    except Exception as e:
-        raise Exception(f"Error generating or uploading PDF: {str(e)}")
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(tmp_pdf_path):
-            os.remove(tmp_pdf_path)
+
+def _content_key(html_content: str) -> str:
+    """
+    Returns the content-addressed S3 key for a rendered HTML document.
+    PDF_RENDER_VERSION is part of the hash so template or renderer changes
+    produce new objects instead of serving stale ones.
+    """
+    digest = hashlib.sha256()
+    digest.update(PDF_RENDER_VERSION.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(pdfRenderPool.BASE_CSS.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(html_content.encode("utf-8"))
+    return f"reports/{digest.hexdigest()}.pdf"
+
+
+def _pdf_exists(pdf_key: str) -> bool:
+    """
+    Checks whether a PDF object already exists, consulting the in-process index
+    first so repeated hits do not cost a HEAD request.
+    """
+    if _known_pdf_keys.get(pdf_key):
+        return True
+
+    try:
+        s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=pdf_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+
+    _known_pdf_keys.set(pdf_key, True)
+    return True
+
+
+def _render_and_upload(html_content: str, pdf_key: str):
+    """
+    Renders the HTML to PDF on the warm renderer pool and uploads the bytes to S3
+    under pdf_key. The PDF only ever exists in memory; nothing is written to disk.
+    """
+    pdf_bytes = pdfRenderPool.render_pdf(html_content)
+
+    s3_client.upload_fileobj(
+        Fileobj=io.BytesIO(pdf_bytes),
+        Bucket=S3_BUCKET_NAME,
+        Key=pdf_key,
+        ExtraArgs={"ContentType": "application/pdf"},
+        Config=transfer_config
+    )
@@ -0,0 +1,246 @@
+"""
+pdfRenderPool.py
+
+This module runs WeasyPrint rendering in a dedicated pool of warm worker processes.
+WeasyPrint is CPU-heavy, holds the GIL while it lays out a document and is slow on
+its first render (font discovery, CSS parsing). Rendering inside a Flask or report
+worker thread therefore blocks every other thread in that process and slowly grows
+its memory. Callers submit HTML and get PDF bytes back:
+
+    pdf_bytes = pdfRenderPool.render_pdf(html_content)
+
+Each renderer process imports WeasyPrint, compiles BASE_CSS and renders a small
+warm-up document once when it starts. Processes are recycled so RSS stays stable:
+the pool is replaced after GFVRHO_PDF_RENDER_RECYCLE_AFTER renders per process, or
+as soon as any renderer reports an RSS above GFVRHO_PDF_RENDER_MAX_RSS_MB. A retired
+pool finishes its in-flight renders before its processes exit.
+
+A render that exceeds GFVRHO_PDF_RENDER_TIMEOUT_SECONDS is assumed hung: its pool is
+retired and its processes are terminated, so the hung renderer gives its slot back
+instead of occupying it forever. Other renders that were running on that pool see a
+BrokenProcessPool and are retried once on the new pool.
+
+Best Practices:
+- GFVRHO_PDF_RENDER_PROCESSES defaults to a small fixed count rather than the core
+  count: every process that renders gets its own pool, so memory grows with
+  (processes that render) x (renderers each). Raise it in dedicated report worker
+  containers, sized to the cores they are given. Set it to 0 to render inline
+  (useful for tests and one-off scripts).
+- The pool starts on the first render, so web processes that only enqueue report
+  jobs never start renderers.
+- Renderer processes are started with the "spawn" method so they never inherit
+  threads, sockets or DB connections from the parent.
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+RENDER_PROCESSES = int(os.environ.get("GFVRHO_PDF_RENDER_PROCESSES", 2))
+RENDER_RECYCLE_AFTER = int(os.environ.get("GFVRHO_PDF_RENDER_RECYCLE_AFTER", 200))
+RENDER_MAX_RSS_MB = int(os.environ.get("GFVRHO_PDF_RENDER_MAX_RSS_MB", 512))
+RENDER_TIMEOUT_SECONDS = float(os.environ.get("GFVRHO_PDF_RENDER_TIMEOUT_SECONDS", 120))
+RENDER_START_METHOD = os.environ.get("GFVRHO_PDF_RENDER_START_METHOD", "spawn")
+
+# Stylesheet applied to every report. Compiled once per renderer process.
+BASE_CSS = """
+body {
+  font-family: Arial, sans-serif;
+  margin: 2em;
+}
+.watermark {
+  position: fixed;
+  top: 50%;
+  left: 50%;
+  transform: translate(-50%, -50%);
+  font-size: 48px;
+  color: rgba(100, 100, 100, 0.2);
+  z-index: 9999;
+  pointer-events: none;
+}
+.report-content {
+  position: relative;
+  z-index: 1;
+}
+"""
+
+_WARM_UP_HTML = "<html><body><div class='report-content'>gfvrho</div></body></html>"
+
+logger = logging.getLogger(__name__)
+
+# Per-process renderer state (set in renderer processes, or lazily for inline rendering).
+_HTML = None
+_base_stylesheets = None
+
+_pool = None
+_pool_renders = 0
+_pool_lock = threading.Lock()
+
+
+def render_pdf(html_content: str) -> bytes:
+    """
+    Renders an HTML document to PDF bytes on the renderer pool.
+
+    :param html_content: The full HTML document; BASE_CSS is applied automatically.
+    :return: The rendered PDF as bytes.
+    :raises concurrent.futures.TimeoutError: If rendering exceeds RENDER_TIMEOUT_SECONDS;
+                                             the pool is replaced before this is raised.
+    :raises Exception: If rendering fails.
+    """
+    if RENDER_PROCESSES <= 0:
+        pdf_bytes, _ = _render(html_content)
+        return pdf_bytes
+
+    try:
+        pdf_bytes, rss_mb = _submit(html_content)
+    except BrokenProcessPool:
+        # A renderer died (e.g., OOM-killed). Replace the pool and retry once.
+        logger.warning("PDF renderer pool broke; starting a new one and retrying")
+        _retire_pool()
+        pdf_bytes, rss_mb = _submit(html_content)
+
+    if rss_mb > RENDER_MAX_RSS_MB:
+        logger.info("PDF renderer RSS %.0f MB exceeds %d MB; recycling pool", rss_mb, RENDER_MAX_RSS_MB)
+        _retire_pool()
+    return pdf_bytes
+
+
+def warm_up():
+    """
+    Starts the renderer processes ahead of the first request so no caller pays
+    for process start-up or WeasyPrint's first render.
+    """
+    if RENDER_PROCESSES <= 0:
+        return
+    with _pool_lock:
+        pool = _get_pool_locked()
+        futures = [pool.submit(_ping) for _ in range(RENDER_PROCESSES)]
+    for future in futures:
+        future.result(timeout=RENDER_TIMEOUT_SECONDS)
+
+
+def shutdown():
+    """
+    Stops the renderer pool, waiting for in-flight renders.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _submit(html_content: str):
+    global _pool, _pool_renders
+    # Submit under the lock so another thread cannot retire the pool in between.
+    with _pool_lock:
+        pool = _get_pool_locked()
+        future = pool.submit(_render, html_content)
+    try:
+        result = future.result(timeout=RENDER_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        logger.warning("PDF render exceeded %.0f s; terminating its renderer pool", RENDER_TIMEOUT_SECONDS)
+        with _pool_lock:
+            if pool is _pool:
+                _pool = None
+        _terminate_pool(pool)
+        raise
+
+    with _pool_lock:
+        if pool is _pool:
+            _pool_renders += 1
+            if _pool_renders >= RENDER_RECYCLE_AFTER * RENDER_PROCESSES:
+                _retire_pool_locked()
+    return result
+
+
+def _get_pool_locked() -> ProcessPoolExecutor:
+    """
+    Returns the current pool, starting a new one if needed. Caller holds _pool_lock.
+    """
+    global _pool, _pool_renders
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=RENDER_PROCESSES,
+            mp_context=multiprocessing.get_context(RENDER_START_METHOD),
+            initializer=_init_renderer
+        )
+        _pool_renders = 0
+    return _pool
+
+
+def _retire_pool():
+    with _pool_lock:
+        _retire_pool_locked()
+
+
+def _retire_pool_locked():
+    """
+    Detaches the current pool so new renders start a fresh one. The old pool's
+    processes exit once their in-flight renders are done. Caller holds _pool_lock.
+    """
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def _terminate_pool(pool: ProcessPoolExecutor):
+    """
+    Stops a retired pool's processes without waiting for their renders. shutdown()
+    alone would leave a hung renderer running.
+    """
+    # Read before shutdown(), which drops the executor's reference to its processes.
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+def _init_renderer():
+    """
+    Renderer process initializer: load WeasyPrint, compile the base stylesheet and
+    render a tiny document so fonts and layout caches are warm.
+    """
+    _load_weasyprint()
+    _HTML(string=_WARM_UP_HTML).write_pdf(stylesheets=_base_stylesheets)
+
+
+def _load_weasyprint():
+    global _HTML, _base_stylesheets
+    if _HTML is None:
+        from weasyprint import HTML, CSS
+        _base_stylesheets = [CSS(string=BASE_CSS)]
+        _HTML = HTML
+
+
+def _render(html_content: str):
+    """
+    Renders one document. Returns the PDF bytes and the process RSS in MB so the
+    parent can decide whether to recycle the pool.
+    """
+    _load_weasyprint()
+    pdf_bytes = _HTML(string=html_content).write_pdf(stylesheets=_base_stylesheets)
+    return pdf_bytes, _current_rss_mb()
+
+
+def _ping():
+    return os.getpid()
+
+
+def _current_rss_mb() -> float:
+    """
+    Resident set size of the current process in MB (Linux /proc, with a
+    peak-RSS fallback on other platforms).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
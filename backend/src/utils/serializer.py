@@ -0,0 +1,53 @@
+"""
+serializer.py
+
+This module builds the JSON-ready dictionaries returned by the controllers, so every
+endpoint represents the same resource the same way. It works on slotted DTOs
+(models/dto.py) and on ORM objects alike, by reading a fixed list of fields.
+
+We expose:
+- REPORT_FIELDS, USER_FIELDS
+- serialize(obj, fields, **extra) -> dict
+- serialize_many(objs, fields, extra=None) -> list
+
+Best Practices:
+- Add a field to the *_FIELDS tuples, not to individual controllers.
+- Timestamps are rendered with str(), the format the API has always returned.
+"""
+
+import datetime
+
+# Public representation of each resource. Never list secrets (e.g., password_hash).
+REPORT_FIELDS = ("id", "tier", "created_at", "payment_status")
+USER_FIELDS = ("id", "email", "username")
+
+
+def serialize(obj, fields: tuple, **extra) -> dict:
+    """
+    Builds a dictionary from the given fields of obj, plus any computed extra values.
+
+    :param obj: A DTO or ORM object.
+    :param fields: Attribute names to include, in order.
+    :param extra: Additional key/value pairs (e.g., a pre-signed pdf_url).
+    :return: A JSON-serializable dictionary.
+    """
+    data = {}
+    for field in fields:
+        value = getattr(obj, field)
+        data[field] = str(value) if isinstance(value, (datetime.datetime, datetime.date)) else value
+    data.update(extra)
+    return data
+
+
+def serialize_many(objs, fields: tuple, extra=None) -> list:
+    """
+    Serializes a sequence of objects with the same fields.
+
+    :param objs: DTOs or ORM objects.
+    :param fields: Attribute names to include, in order.
+    :param extra: Optional function obj -> dict of computed values per object.
+    :return: A list of JSON-serializable dictionaries.
+    """
+    if extra is None:
+        return [serialize(obj, fields) for obj in objs]
+    return [serialize(obj, fields, **extra(obj)) for obj in objs]
@@ -0,0 +1,86 @@
+"""
+singleFlight.py
+
+This module provides request coalescing ("single flight") for expensive operations.
+When several threads call the same operation with the same key at the same time, only
+the first one (the leader) executes it; the others wait and receive the leader's result,
+or its exception.
+
+Usage:
+    _report_flights = SingleFlight()
+    report = _report_flights.do(key, _create_report, user_id, tier)
+
+Best Practices:
+- Keys must capture every input that affects the result.
+- Coalescing only spans calls that overlap in time. Nothing is cached after the
+  leader returns.
+- This is per process. Cross-process deduplication needs shared state (see
+  reportJobService.py, which deduplicates through the database).
+"""
+
+import threading
+
+
+class _Call:
+    """
+    An in-flight execution that followers wait on.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) unless a call with the same key is already in flight,
+        in which case it waits for that call and returns its result.
+
+        :param key: Hashable identity of the operation and its inputs.
+        :return: The result of the (possibly shared) execution.
+        :raises Exception: Whatever the shared execution raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                call.followers += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """
+        Returns the number of keys currently executing.
+        """
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,197 @@
+"""
+reportWorker.py
+
+This module is the worker entry point for the report_jobs queue. Each worker thread
+loops: claim the oldest queued job (FOR UPDATE SKIP LOCKED), run
+reportService.create_report while a heartbeat thread renews the job lease, then record
+success or failure. Periodically, every worker also re-queues jobs whose lease has
+expired, so jobs held by a crashed node are picked up elsewhere.
+
+Run dedicated workers (any number of containers/nodes) with:
+    python -m backend.src.workers.reportWorker --concurrency 4
+
+Web processes can also run embedded workers by setting GFVRHO_REPORT_JOB_WORKERS
+(see reportJobService.REPORT_JOB_WORKERS), which is convenient for local development.
+It defaults to 0, so a web tier scaled to many processes does not also run a worker
+pool in each of them.
+
+Best Practices:
+- Keep the heartbeat interval well below GFVRHO_REPORT_JOB_LEASE_SECONDS so a
+  healthy worker never loses its lease.
+- Scale rendering throughput by adding worker processes, independently of web workers.
+"""
+
+import os
+import time
+import socket
+import signal
+import logging
+import argparse
+import threading
+from backend.src.services import reportJobService, reportService
+from backend.src.utils import pdfRenderPool
+
+POLL_INTERVAL_SECONDS = float(os.environ.get("GFVRHO_REPORT_JOB_POLL_SECONDS", 1.0))
+HEARTBEAT_INTERVAL_SECONDS = float(
+    os.environ.get("GFVRHO_REPORT_JOB_HEARTBEAT_SECONDS", reportJobService.REPORT_JOB_LEASE_SECONDS / 3)
+)
+REAP_INTERVAL_SECONDS = float(os.environ.get("GFVRHO_REPORT_JOB_REAP_SECONDS", 15))
+
+logger = logging.getLogger(__name__)
+
+# Set by notify_new_job so idle local workers claim immediately instead of
+# waiting for the next poll.
+_wakeup = threading.Event()
+_embedded_workers = []
+_embedded_lock = threading.Lock()
+
+
+class ReportWorker(threading.Thread):
+    """
+    A single worker thread that claims and executes report jobs until stopped.
+    """
+
+    def __init__(self, worker_id: str, stop_event: threading.Event):
+        super().__init__(name=f"report-worker-{worker_id}", daemon=True)
+        self.worker_id = worker_id
+        self.stop_event = stop_event
+        self._last_reap = 0.0
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                self._maybe_reap()
+                job = reportJobService.claim_next_job(self.worker_id)
+            except Exception:
+                logger.exception("Worker %s failed to claim a job", self.worker_id)
+                job = None
+
+            if job is None:
+                _wakeup.wait(POLL_INTERVAL_SECONDS)
+                _wakeup.clear()
+                continue
+
+            self.process(job)
+
+    def process(self, job):
+        """
+        Runs the report workflow for a claimed job while heartbeating its lease.
+        """
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop,
+            args=(job.id, heartbeat_stop),
+            name=f"{self.name}-heartbeat",
+            daemon=True
+        )
+        heartbeat.start()
+        try:
+            user_data = dict(job.params or {})
+            report_content = user_data.pop(reportJobService.REPORT_CONTENT_PARAM, None)
+            report = reportService.create_report(
+                user_id=job.user_id,
+                tier=job.tier,
+                user_data=user_data,
+                report_content=report_content
+            )
+            if not reportJobService.complete_job(job.id, self.worker_id, report.id):
+                logger.warning("Worker %s lost the lease on job %s before completing it", self.worker_id, job.id)
+        except Exception as e:
+            logger.exception("Report job %s failed", job.id)
+            reportJobService.fail_job(
+                job.id, self.worker_id, str(e), retryable=reportJobService.is_retryable(e)
+            )
+        finally:
+            heartbeat_stop.set()
+            heartbeat.join()
+
+    def _heartbeat_loop(self, job_id: str, heartbeat_stop: threading.Event):
+        """
+        Renews the job lease until the job finishes or the lease is lost.
+        """
+        while not heartbeat_stop.wait(HEARTBEAT_INTERVAL_SECONDS):
+            try:
+                if not reportJobService.heartbeat_job(job_id, self.worker_id):
+                    logger.warning("Worker %s no longer holds job %s", self.worker_id, job_id)
+                    return
+            except Exception:
+                logger.exception("Heartbeat failed for job %s", job_id)
+
+    def _maybe_reap(self):
+        """
+        Re-queues jobs with expired leases, at most once per REAP_INTERVAL_SECONDS.
+        """
+        now = time.monotonic()
+        if now - self._last_reap < REAP_INTERVAL_SECONDS:
+            return
+        self._last_reap = now
+        requeued = reportJobService.requeue_expired_jobs()
+        if requeued:
+            logger.info("Re-queued %d report jobs with expired leases", requeued)
+
+
+def notify_new_job():
+    """
+    Wakes idle local workers after a job has been enqueued in this process.
+    """
+    _wakeup.set()
+
+
+def ensure_embedded_workers(count: int):
+    """
+    Starts `count` worker threads inside the current process, once.
+    Workers started before a fork do not survive in the child, so this is called
+    lazily from the first enqueue rather than at import time.
+    """
+    if count <= 0:
+        return
+    with _embedded_lock:
+        if _embedded_workers and _embedded_workers[0][0] == os.getpid():
+            return
+        _embedded_workers.clear()
+        stop_event = threading.Event()
+        for i in range(count):
+            worker = ReportWorker(_worker_id(i), stop_event)
+            worker.start()
+            _embedded_workers.append((os.getpid(), worker))
+
+
+def _worker_id(index: int) -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{index}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run gfvrho report job workers.")
+    parser.add_argument("--concurrency", type=int, default=int(os.environ.get("GFVRHO_REPORT_WORKER_CONCURRENCY", 4)),
+                        help="Number of worker threads in this process.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
+
+    stop_event = threading.Event()
+
+    def _shutdown(signum, frame):
+        logger.info("Received signal %s, finishing in-flight jobs", signum)
+        stop_event.set()
+        _wakeup.set()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    # Start the PDF renderers before taking jobs so the first job does not pay for it.
+    pdfRenderPool.warm_up()
+
+    workers = [ReportWorker(_worker_id(i), stop_event) for i in range(args.concurrency)]
+    for worker in workers:
+        worker.start()
+    logger.info("Started %d report workers", len(workers))
+
+    while not stop_event.is_set():
+        stop_event.wait(1)
+    for worker in workers:
+        worker.join()
+    pdfRenderPool.shutdown()
+
+
+if __name__ == '__main__':
+    main()